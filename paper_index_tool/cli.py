@@ -23,17 +23,22 @@ and has been reviewed and tested by a human.
 
 import atexit
 import json
+import os
 from collections import Counter
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, cast, get_args
 
 import typer
+from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from paper_index_tool.completion import completion_app
 from paper_index_tool.logging_config import get_logger, setup_logging
-from paper_index_tool.models import Book, Media, MediaType, Paper, Quote
+from paper_index_tool.models import Book, Media, MediaType, Paper, Quote, VectorQuantization
 from paper_index_tool.storage import (
     BookRegistry,
     EntryExistsError,
@@ -43,6 +48,10 @@ from paper_index_tool.storage import (
 )
 from paper_index_tool.telemetry import TelemetryConfig, TelemetryService, traced
 
+if TYPE_CHECKING:
+    from paper_index_tool.models import AIProvider
+    from paper_index_tool.search import SearchResult
+
 logger = get_logger(__name__)
 
 app = typer.Typer(invoke_without_command=True)
@@ -64,13 +73,83 @@ vector_app = typer.Typer(
 )
 
 
-class OutputFormat(str, Enum):
+class OutputFormat(StrEnum):
     """Output format options."""
 
     HUMAN = "human"
     JSON = "json"
 
 
+# =============================================================================
+# Registry Factories
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def _paper_registry() -> PaperRegistry:
+    """Return the process-wide PaperRegistry instance."""
+    return PaperRegistry()
+
+
+@lru_cache(maxsize=1)
+def _book_registry() -> BookRegistry:
+    """Return the process-wide BookRegistry instance."""
+    return BookRegistry()
+
+
+@lru_cache(maxsize=1)
+def _media_registry() -> MediaRegistry:
+    """Return the process-wide MediaRegistry instance."""
+    return MediaRegistry()
+
+
+# =============================================================================
+# Search Output
+# =============================================================================
+
+
+def _echo_json(data: Any, indent: int | None = 2) -> None:
+    """Write data to stdout as JSON.
+
+    Serializes with pydantic_core (Rust) straight to UTF-8 bytes, which
+    are written to the binary stdout stream without a str round trip.
+    Used for search results, whose fragment text can be large.
+    """
+    typer.echo(to_json(data, indent=indent))
+
+
+def _echo_lines(lines: list[str]) -> None:
+    """Write lines to stdout in a single write (one flush instead of one per line)."""
+    typer.echo("\n".join(lines))
+
+
+def _format_fragment_lines(fragments: list[dict[str, Any]]) -> list[str]:
+    """Format extracted fragments as indented human-readable lines."""
+    lines: list[str] = []
+    for j, frag in enumerate(fragments, 1):
+        lines.append(f"\n    Fragment {j} (lines {frag['line_start']}-{frag['line_end']}):")
+        lines.append("    " + "-" * 40)
+        lines.extend(f"    {line}" for line in frag["lines"])
+    return lines
+
+
+def _format_result_lines(
+    rank: int, result: SearchResult, fragments: bool, score_format: str = ".4f"
+) -> list[str]:
+    """Format one search result (and optionally its fragments) as human-readable lines."""
+    title = result.entry.title if result.entry else "No title"
+    lines = [
+        f"[{rank}] {result.entry_id} (score: {result.score:{score_format}})",
+        f"    Title: {title}",
+    ]
+    if result.entry_type.value != "paper":
+        lines.append(f"    Type: {result.entry_type.value}")
+    if fragments and result.fragments:
+        lines.extend(_format_fragment_lines(result.fragments))
+    lines.append("")
+    return lines
+
+
 # =============================================================================
 # Version Callback
 # =============================================================================
@@ -194,7 +273,7 @@ def _print_paper_detail(paper: Paper, output_format: OutputFormat) -> None:
 
 def _get_paper_or_exit(paper_id: str) -> Paper:
     """Get paper by ID or exit with error."""
-    registry = PaperRegistry()
+    registry = _paper_registry()
     try:
         paper = registry.get_paper(paper_id)
         if not paper:
@@ -299,7 +378,7 @@ def _print_book_detail(book: Book, output_format: OutputFormat) -> None:
 
 def _get_book_or_exit(book_id: str) -> Book:
     """Get book by ID or exit with error."""
-    registry = BookRegistry()
+    registry = _book_registry()
     try:
         book = registry.get_book(book_id)
         if not book:
@@ -326,7 +405,7 @@ def _get_book_or_chapters_or_exit(book_id: str) -> Book | list[Book]:
     Raises:
         typer.Exit: If nothing found.
     """
-    registry = BookRegistry()
+    registry = _book_registry()
     result = registry.get_book_or_chapters(book_id)
 
     if result is None:
@@ -607,7 +686,7 @@ def _print_media_detail(media: Media, output_format: OutputFormat) -> None:
 
 def _get_media_or_exit(media_id: str) -> Media:
     """Get media by ID or exit with error."""
-    registry = MediaRegistry()
+    registry = _media_registry()
     try:
         media = registry.get_media(media_id)
         if not media:
@@ -795,7 +874,7 @@ def paper_create(
     """
     logger.info("Creating paper: %s", paper_id)
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
 
     # Check if exists
     if registry.paper_exists(paper_id):
@@ -812,8 +891,8 @@ def paper_create(
     if quotes_json:
         try:
             quotes_data = json.loads(quotes_json)
-            quotes = [Quote(**q) for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            quotes = Quote.validate_batch(quotes_data)
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "page": 1}}]',
@@ -945,7 +1024,7 @@ def paper_update(
     """
     logger.info("Updating paper: %s", paper_id)
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
 
     # Build updates dict (only non-None values)
     updates: dict[str, object] = {}
@@ -1000,8 +1079,8 @@ def paper_update(
     if quotes_json is not None:
         try:
             quotes_data = json.loads(quotes_json)
-            updates["quotes"] = [Quote(**q).model_dump() for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            updates["quotes"] = [q.model_dump() for q in Quote.validate_batch(quotes_data)]
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "page": 1}}]',
@@ -1048,7 +1127,7 @@ def paper_delete(
     """
     logger.info("Deleting paper: %s", paper_id)
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
 
     if not registry.paper_exists(paper_id):
         typer.echo(
@@ -1094,7 +1173,7 @@ def paper_rename(
     """
     logger.info("Renaming paper: %s -> %s", old_id, new_id)
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
 
     if not registry.paper_exists(old_id):
         typer.echo(
@@ -1131,9 +1210,9 @@ def paper_rename(
         raise typer.Exit(1)
 
     # Rebuild search index
-    from paper_index_tool.search import PaperSearcher
+    from paper_index_tool.search import get_paper_searcher
 
-    PaperSearcher().rebuild_index()
+    get_paper_searcher().rebuild_index()
 
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "renamed", "old_id": old_id, "new_id": new_id}))
@@ -1160,7 +1239,7 @@ def paper_list(
     """
     logger.info("Listing papers")
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
     papers = registry.list_papers()
 
     if count:
@@ -1219,19 +1298,13 @@ def paper_clear(
 
     logger.info("Clearing all papers")
 
-    registry = PaperRegistry()
+    registry = _paper_registry()
     count = registry.clear()
 
-    # Clear the BM25 index for papers
-    from paper_index_tool.search import PaperSearcher
+    # Clear the BM25 index and cached per-entry term counts for papers
+    from paper_index_tool.search import get_paper_searcher
 
-    searcher = PaperSearcher()
-    index_path = searcher.index_path
-    if index_path.exists():
-        import shutil
-
-        shutil.rmtree(index_path)
-        logger.info("Cleared paper search index at %s", index_path)
+    get_paper_searcher().clear_index()
 
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "cleared", "count": count}))
@@ -1382,7 +1455,7 @@ def paper_add_quote(
         paper-index-tool paper add-quote ashford2012 "Leadership is a process..." 17
     """
     paper = _get_paper_or_exit(paper_id)
-    registry = PaperRegistry()
+    registry = _paper_registry()
 
     new_quote = Quote(text=text, page=page)
     updated_quotes = paper.quotes + [new_quote]
@@ -1436,7 +1509,7 @@ def paper_bibtex(
         paper-index-tool paper bibtex ashford2012
     """
     paper = _get_paper_or_exit(paper_id)
-    typer.echo(paper.to_bibtex())
+    typer.echo(paper.bibtex)
 
 
 @paper_app.command(name="query")
@@ -1553,7 +1626,7 @@ def book_create(
     """
     logger.info("Creating book: %s", book_id)
 
-    registry = BookRegistry()
+    registry = _book_registry()
 
     # Check if exists
     if registry.book_exists(book_id):
@@ -1570,8 +1643,8 @@ def book_create(
     if quotes_json:
         try:
             quotes_data = json.loads(quotes_json)
-            quotes = [Quote(**q) for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            quotes = Quote.validate_batch(quotes_data)
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "page": 1}}]',
@@ -1704,7 +1777,7 @@ def book_update(
     """
     logger.info("Updating book: %s", book_id)
 
-    registry = BookRegistry()
+    registry = _book_registry()
 
     # Build updates dict (only non-None values)
     updates: dict[str, object] = {}
@@ -1749,8 +1822,8 @@ def book_update(
     if quotes_json is not None:
         try:
             quotes_data = json.loads(quotes_json)
-            updates["quotes"] = [Quote(**q).model_dump() for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            updates["quotes"] = [q.model_dump() for q in Quote.validate_batch(quotes_data)]
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "page": 1}}]',
@@ -1803,7 +1876,7 @@ def book_delete(
     """
     logger.info("Deleting book: %s", book_id)
 
-    registry = BookRegistry()
+    registry = _book_registry()
 
     # Check if exact match exists
     if registry.book_exists(book_id):
@@ -1888,7 +1961,7 @@ def book_rename(
     """
     logger.info("Renaming book: %s -> %s", old_id, new_id)
 
-    registry = BookRegistry()
+    registry = _book_registry()
 
     if not registry.book_exists(old_id):
         typer.echo(
@@ -1925,9 +1998,9 @@ def book_rename(
         raise typer.Exit(1)
 
     # Rebuild search index
-    from paper_index_tool.search import BookSearcher
+    from paper_index_tool.search import get_book_searcher
 
-    BookSearcher().rebuild_index()
+    get_book_searcher().rebuild_index()
 
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "renamed", "old_id": old_id, "new_id": new_id}))
@@ -1954,7 +2027,7 @@ def book_list(
     """
     logger.info("Listing books")
 
-    registry = BookRegistry()
+    registry = _book_registry()
     books = registry.list_books()
 
     if count:
@@ -2013,19 +2086,13 @@ def book_clear(
 
     logger.info("Clearing all books")
 
-    registry = BookRegistry()
+    registry = _book_registry()
     count = registry.clear()
 
-    # Clear the BM25 index for books
-    from paper_index_tool.search import BookSearcher
-
-    searcher = BookSearcher()
-    index_path = searcher.index_path
-    if index_path.exists():
-        import shutil
+    # Clear the BM25 index and cached per-entry term counts for books
+    from paper_index_tool.search import get_book_searcher
 
-        shutil.rmtree(index_path)
-        logger.info("Cleared book search index at %s", index_path)
+    get_book_searcher().clear_index()
 
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "cleared", "count": count}))
@@ -2237,7 +2304,7 @@ def book_bibtex(
         paper-index-tool book bibtex vogelgesang2023
     """
     book = _get_book_or_exit(book_id)
-    typer.echo(book.to_bibtex())
+    typer.echo(book.bibtex)
 
 
 @book_app.command(name="query")
@@ -2278,10 +2345,7 @@ def book_query(
         paper-index-tool book query vogelgesang2023 "identity" --fragments
         paper-index-tool book query vogelgesang2023 "How do leaders grow?" -s  # Semantic
     """
-    import bm25s  # type: ignore[import-untyped]
-    import Stemmer  # type: ignore[import-not-found]
-
-    from paper_index_tool.search import extract_fragments
+    from paper_index_tool.search import extract_fragments, score_single_document, tokenize_text
 
     logger.info("Query: %s in book: %s", search_query, book_id)
 
@@ -2373,22 +2437,17 @@ def book_query(
             raise typer.Exit(1)
     else:
         # BM25 keyword search
-        stemmer = Stemmer.Stemmer("english")
+        query_tokens = tokenize_text(search_query)
 
-        for chapter in chapters:
-            content = chapter.get_searchable_text()
+        # A query of only stopwords cannot score: skip tokenizing the chapters
+        scored_chapters = chapters if query_tokens else []
+        for chapter in scored_chapters:
+            content = chapter.searchable_text
             if not content:
                 continue
 
-            # BM25 scoring for this chapter
-            corpus_tokens = bm25s.tokenize([content], stopwords="en", stemmer=stemmer)
-            query_tokens = bm25s.tokenize([search_query], stopwords="en", stemmer=stemmer)
-
-            retriever = bm25s.BM25()
-            retriever.index(corpus_tokens)
-            _results_array, scores_array = retriever.retrieve(query_tokens, k=1)
-
-            score = float(scores_array[0, 0])
+            # BM25 scoring for this chapter as a one-document corpus
+            score = score_single_document(query_tokens, Counter(chapter.searchable_tokens))
             if score <= 0:
                 continue
 
@@ -2415,13 +2474,13 @@ def book_query(
     # Output
     if not all_results:
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps([]))
+            _echo_json([])
         else:
             typer.echo("No results found")
         return
 
     if output_format == OutputFormat.JSON:
-        typer.echo(json.dumps(all_results, indent=2))
+        _echo_json(all_results)
     else:
         for r in all_results:
             typer.echo(f"[{r['id']}] score={r['score']:.3f} - {r['title']}")
@@ -2538,7 +2597,7 @@ def media_create(
     """
     logger.info("Creating media: %s", media_id)
 
-    registry = MediaRegistry()
+    registry = _media_registry()
 
     # Check if exists
     if registry.media_exists(media_id):
@@ -2555,8 +2614,8 @@ def media_create(
     if quotes_json:
         try:
             quotes_data = json.loads(quotes_json)
-            quotes = [Quote(**q) for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            quotes = Quote.validate_batch(quotes_data)
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "timestamp": "05:30"}}]',
@@ -2600,7 +2659,8 @@ def media_create(
             quotes=quotes,
             full_text=full_text,
             ai_generated=ai_generated,
-            ai_provider=ai_provider,
+            # Checked against the allowed providers by the model
+            ai_provider=cast("AIProvider | None", ai_provider),
             ai_model=ai_model,
         )
         registry.add_media(media)
@@ -2727,7 +2787,7 @@ def media_update(
     """
     logger.info("Updating media: %s", media_id)
 
-    registry = MediaRegistry()
+    registry = _media_registry()
 
     # Build updates dict (only non-None values)
     updates: dict[str, object] = {}
@@ -2800,8 +2860,8 @@ def media_update(
     if quotes_json is not None:
         try:
             quotes_data = json.loads(quotes_json)
-            updates["quotes"] = [Quote(**q).model_dump() for q in quotes_data]
-        except (json.JSONDecodeError, TypeError) as e:
+            updates["quotes"] = [q.model_dump() for q in Quote.validate_batch(quotes_data)]
+        except (json.JSONDecodeError, TypeError, ValidationError) as e:
             typer.echo(
                 f"Error: Invalid quotes JSON: {e}. "
                 f'Expected format: [{{"text": "quote text", "timestamp": "05:30"}}]',
@@ -2848,7 +2908,7 @@ def media_delete(
     """
     logger.info("Deleting media: %s", media_id)
 
-    registry = MediaRegistry()
+    registry = _media_registry()
 
     if not registry.media_exists(media_id):
         typer.echo(
@@ -2894,7 +2954,7 @@ def media_rename(
     """
     logger.info("Renaming media: %s -> %s", old_id, new_id)
 
-    registry = MediaRegistry()
+    registry = _media_registry()
 
     if not registry.media_exists(old_id):
         typer.echo(
@@ -2931,9 +2991,9 @@ def media_rename(
         raise typer.Exit(1)
 
     # Rebuild search index
-    from paper_index_tool.search import MediaSearcher
+    from paper_index_tool.search import get_media_searcher
 
-    MediaSearcher().rebuild_index()
+    get_media_searcher().rebuild_index()
 
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "renamed", "old_id": old_id, "new_id": new_id}))
@@ -2965,7 +3025,7 @@ def media_list(
     """
     logger.info("Listing media")
 
-    registry = MediaRegistry()
+    registry = _media_registry()
     all_media = registry.list_media()
 
     # Apply type filter if specified
@@ -3009,7 +3069,8 @@ def media_clear(
 ) -> None:
     """Clear all media from the index.
 
-    This command removes all media entries. Requires --approve flag for safety.
+    This command removes all media entries and clears the BM25 search index.
+    Requires --approve flag for safety.
 
     \b
     Examples:
@@ -3028,13 +3089,18 @@ def media_clear(
 
     logger.info("Clearing all media")
 
-    registry = MediaRegistry()
+    registry = _media_registry()
     count = registry.clear()
 
+    # Clear the BM25 index and cached per-entry term counts for media
+    from paper_index_tool.search import get_media_searcher
+
+    get_media_searcher().clear_index()
+
     if output_format == OutputFormat.JSON:
         typer.echo(json.dumps({"status": "cleared", "count": count}))
     else:
-        typer.echo(f"Cleared {count} media entry(ies)")
+        typer.echo(f"Cleared {count} media entry(ies) and search index")
 
 
 # Media field query commands
@@ -3220,7 +3286,7 @@ def media_bibtex(
         paper-index-tool media bibtex ashford2017
     """
     media = _get_media_or_exit(media_id)
-    typer.echo(media.to_bibtex())
+    typer.echo(media.bibtex)
 
 
 @media_app.command(name="query")
@@ -3258,11 +3324,11 @@ def media_query(
 
     # Search single media entry
     media = _get_media_or_exit(media_id)
-    content = media.get_searchable_text()
+    content = media.searchable_text
 
     if not content:
         if output_format == OutputFormat.JSON:
-            typer.echo(json.dumps([]))
+            _echo_json([])
         else:
             typer.echo("No searchable content in media")
         return
@@ -3295,7 +3361,7 @@ def media_query(
             )
             if not results:
                 if output_format == OutputFormat.JSON:
-                    typer.echo(json.dumps([]))
+                    _echo_json([])
                 else:
                     typer.echo("No results found")
                 return
@@ -3310,21 +3376,18 @@ def media_query(
             raise typer.Exit(1)
     else:
         # BM25 keyword search
-        import bm25s
-        import Stemmer
+        from paper_index_tool.search import score_single_document, tokenize_text
 
-        stemmer = Stemmer.Stemmer("english")
-        corpus_tokens = bm25s.tokenize([content], stopwords="en", stemmer=stemmer)
-        query_tokens = bm25s.tokenize([search_query], stopwords="en", stemmer=stemmer)
+        query_tokens = tokenize_text(search_query)
 
-        retriever = bm25s.BM25()
-        retriever.index(corpus_tokens)
-        _results_array, scores_array = retriever.retrieve(query_tokens, k=1)
+        # A query of only stopwords cannot score: skip tokenizing the content
+        score = 0.0
+        if query_tokens:
+            score = score_single_document(query_tokens, Counter(media.searchable_tokens))
 
-        score = float(scores_array[0, 0])
         if score <= 0:
             if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps([]))
+                _echo_json([])
             else:
                 typer.echo("No results found")
             return
@@ -3343,7 +3406,7 @@ def media_query(
         }
         if fragments:
             media_result["fragments"] = frags
-        typer.echo(json.dumps([media_result], indent=2))
+        _echo_json([media_result])
     else:
         typer.echo(f"[1] {media_id} (score: {score:.4f})")
         typer.echo(f"    Title: {media.title}")
@@ -3402,13 +3465,14 @@ def stats_command(
     """
     logger.info("Generating statistics")
 
-    paper_registry = PaperRegistry()
-    book_registry = BookRegistry()
-    media_registry = MediaRegistry()
+    paper_registry = _paper_registry()
+    book_registry = _book_registry()
+    media_registry = _media_registry()
 
-    papers = paper_registry.list_papers()
-    books = book_registry.list_books()
-    media_list = media_registry.list_media()
+    # Statistics only read metadata: skip validation and quote loading
+    papers = paper_registry.list_entries(trusted=True, include_quotes=False)
+    books = book_registry.list_entries(trusted=True, include_quotes=False)
+    media_list = media_registry.list_entries(trusted=True, include_quotes=False)
 
     # Collect stats
     paper_count = len(papers)
@@ -3452,17 +3516,11 @@ def stats_command(
     # Keywords breakdown
     keywords_counter: Counter[str] = Counter()
     for paper in papers:
-        if paper.keywords:
-            for kw in paper.keywords.split(","):
-                keywords_counter[kw.strip().lower()] += 1
+        keywords_counter.update(paper.keywords_list)
     for book in books:
-        if book.keywords:
-            for kw in book.keywords.split(","):
-                keywords_counter[kw.strip().lower()] += 1
+        keywords_counter.update(book.keywords_list)
     for media in media_list:
-        if media.keywords:
-            for kw in media.keywords.split(","):
-                keywords_counter[kw.strip().lower()] += 1
+        keywords_counter.update(media.keywords_list)
 
     if output_format == OutputFormat.JSON:
         stats_data = {
@@ -3472,7 +3530,7 @@ def stats_command(
             "media_count": media_count,
             "media_by_type": dict(media_types),
             "authors_top_10": dict(authors.most_common(10)),
-            "years": dict(sorted(years.items())),
+            "years": dict(sorted(years.items(), key=itemgetter(0))),
             "keywords_top_10": dict(keywords_counter.most_common(10)),
         }
         typer.echo(json.dumps(stats_data, indent=2))
@@ -3562,8 +3620,8 @@ def export_command(
         )
         raise typer.Exit(1)
 
-    paper_registry = PaperRegistry()
-    book_registry = BookRegistry()
+    paper_registry = _paper_registry()
+    book_registry = _book_registry()
 
     papers = paper_registry.list_papers()
     books = book_registry.list_books()
@@ -3573,15 +3631,16 @@ def export_command(
         "exported_at": datetime.now().isoformat(),
         "paper_count": len(papers),
         "book_count": len(books),
-        "papers": [p.model_dump(mode="json") for p in papers],
-        "books": [b.model_dump(mode="json") for b in books],
+        "papers": papers,
+        "books": books,
     }
 
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(export_data, f, indent=2, default=str)
+    # Serialize models directly in pydantic-core: long full_text fields are
+    # escaped in Rust and written as UTF-8 instead of \uXXXX sequences
+    output_path.write_bytes(to_json(export_data, indent=2, fallback=str))
 
     typer.echo(f"Exported {len(papers)} papers and {len(books)} books to {output_path}")
 
@@ -3606,6 +3665,10 @@ def import_command(
         bool,
         typer.Option("--dry-run", help="Preview import without making changes"),
     ] = False,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel", help="Validate entries across multiple threads"),
+    ] = False,
 ) -> None:
     """Import papers and books from a JSON backup file.
 
@@ -3614,6 +3677,10 @@ def import_command(
         --replace   Clear ALL existing data, then import (default)
         --merge     Add new entries only, skip if ID exists
 
+    \b
+    PERFORMANCE:
+        --parallel  Validate entries in chunks across CPU threads (large backups)
+
     \b
     AUTOMATIC ACTIONS:
         - Validates JSON structure before import
@@ -3649,11 +3716,10 @@ def import_command(
     if merge:
         replace = False
 
-    # Load and validate file
+    # Load and validate file (pydantic-core's jiter parser decodes straight from bytes)
     try:
-        with open(input_path) as f:
-            import_data = json.load(f)
-    except json.JSONDecodeError as e:
+        import_data = from_json(input_path.read_bytes())
+    except ValueError as e:
         typer.echo(
             f"Error: Invalid JSON in file '{input_path}': {e}. Please check the file format.",
             err=True,
@@ -3685,25 +3751,26 @@ def import_command(
 
         return
 
-    paper_registry = PaperRegistry()
-    book_registry = BookRegistry()
+    paper_registry = _paper_registry()
+    book_registry = _book_registry()
 
     # Convert to dict format for import_all
     papers_dict = {p["id"]: p for p in papers_data if "id" in p}
     books_dict = {b["id"]: b for b in books_data if "id" in b}
 
     # Import
+    workers = (os.cpu_count() or 1) if parallel else 1
     try:
-        paper_count = paper_registry.import_all(papers_dict, replace=replace)
-        book_count = book_registry.import_all(books_dict, replace=replace)
+        paper_count = paper_registry.import_all(papers_dict, replace=replace, workers=workers)
+        book_count = book_registry.import_all(books_dict, replace=replace, workers=workers)
     except ValueError as e:
         typer.echo(f"Error: Import validation failed: {e}", err=True)
         raise typer.Exit(1)
 
     # Rebuild BM25 index
-    from paper_index_tool.search import PaperSearcher
+    from paper_index_tool.search import get_paper_searcher
 
-    searcher = PaperSearcher()
+    searcher = get_paper_searcher()
     index_count = searcher.rebuild_index()
 
     mode_str = "Replaced" if replace else "Merged"
@@ -3716,6 +3783,10 @@ def import_command(
 # =============================================================================
 
 
+# Keys whose presence marks JSON data as a book (chapter) entry
+_BOOK_MARKERS = frozenset({"chapter", "chapter_title", "chapter_number"})
+
+
 def _detect_entry_type(data: dict[str, Any]) -> str:
     """Detect if JSON data represents a paper or book.
 
@@ -3729,10 +3800,8 @@ def _detect_entry_type(data: dict[str, Any]) -> str:
     """
     if "journal" in data:
         return "paper"
-    if "chapter" in data or "chapter_title" in data or "chapter_number" in data:
-        return "book"
     # Default to paper if ambiguous
-    return "paper"
+    return "book" if not data.keys().isdisjoint(_BOOK_MARKERS) else "paper"
 
 
 def _transform_book_data(data: dict[str, Any]) -> dict[str, Any]:
@@ -3803,8 +3872,14 @@ def _populate_full_text_from_markdown(data: dict[str, Any]) -> dict[str, Any]:
         expanded_path = Path(markdown_path).expanduser()
         if expanded_path.exists():
             try:
-                with open(expanded_path, encoding="utf-8") as f:
-                    data["full_text"] = f.read()
+                raw = expanded_path.read_bytes()
+                # ASCII-only files (the common case) skip the UTF-8 decoder's
+                # multi-byte validation
+                text = raw.decode("ascii") if raw.isascii() else raw.decode("utf-8")
+                # Match text-mode universal newline handling
+                if "\r" in text:
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                data["full_text"] = text
                 logger.info(
                     "Auto-populated full_text from %s (%d chars)",
                     markdown_path,
@@ -3905,7 +3980,7 @@ def create_from_json(
     try:
         if entry_type == "paper":
             paper = Paper.model_validate(data)
-            paper_registry = PaperRegistry()
+            paper_registry = _paper_registry()
             if paper_registry.paper_exists(entry_id):
                 typer.echo(
                     f"Error: Paper '{entry_id}' already exists. "
@@ -3916,7 +3991,7 @@ def create_from_json(
             paper_registry.add_paper(paper)
         else:
             book = Book.model_validate(data)
-            book_registry = BookRegistry()
+            book_registry = _book_registry()
             if book_registry.book_exists(entry_id):
                 typer.echo(
                     f"Error: Book '{entry_id}' already exists. "
@@ -4005,7 +4080,7 @@ def update_from_json(
 
     try:
         if entry_type == "paper":
-            paper_registry = PaperRegistry()
+            paper_registry = _paper_registry()
             if not paper_registry.paper_exists(entry_id):
                 typer.echo(
                     f"Error: Paper '{entry_id}' not found. "
@@ -4015,7 +4090,7 @@ def update_from_json(
                 raise typer.Exit(1)
             paper_registry.update_paper(entry_id, updates)
         else:
-            book_registry = BookRegistry()
+            book_registry = _book_registry()
             if not book_registry.book_exists(entry_id):
                 typer.echo(
                     f"Error: Book '{entry_id}' not found. "
@@ -4137,20 +4212,17 @@ def query_command(
         paper-index-tool vector create nova-1024 --model nova --dimensions 1024
         paper-index-tool vector default nova-1024
     """
-    from paper_index_tool.search import PaperSearcher
-
     logger.info("Query: %s", search_query)
 
     # Validate options
-    options_count = sum([paper_id is not None, book_id is not None, all_entries])
+    options_count = (paper_id is not None) + (book_id is not None) + all_entries
     if options_count == 0:
         typer.echo(
             "Error: Must specify --paper <id>, --book <id>, or --all. Use --help for examples.",
             err=True,
         )
         raise typer.Exit(1)
-
-    if options_count > 1:
+    elif options_count > 1:
         typer.echo(
             "Error: Cannot use multiple search modes. Choose one of: --paper, --book, or --all.",
             err=True,
@@ -4177,42 +4249,30 @@ def query_command(
     if book_id:
         # Search single book
         book = _get_book_or_exit(book_id)
-        content = book.get_searchable_text()
-
-        if not content:
+        if not book.searchable_text:
             if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps([]))
+                _echo_json([])
             else:
                 typer.echo("No searchable content in book")
             return
 
-        # Use BM25 for scoring
-        import bm25s
-        import Stemmer
-
-        from paper_index_tool.search import extract_fragments
-
-        stemmer = Stemmer.Stemmer("english")
-        corpus_tokens = bm25s.tokenize([content], stopwords="en", stemmer=stemmer)
-        query_tokens = bm25s.tokenize([search_query], stopwords="en", stemmer=stemmer)
+        from paper_index_tool.search import get_book_searcher
 
-        retriever = bm25s.BM25()
-        retriever.index(corpus_tokens)
-        _results_array, scores_array = retriever.retrieve(query_tokens, k=1)
-
-        score = float(scores_array[0, 0])
-        if score <= 0:
+        book_results = get_book_searcher().search(
+            query=search_query,
+            entry_id=book_id,
+            extract_fragments_flag=fragments,
+            context_lines=context,
+        )
+        if not book_results:
             if output_format == OutputFormat.JSON:
-                typer.echo(json.dumps([]))
+                _echo_json([])
             else:
                 typer.echo("No results found")
             return
 
-        # Extract fragments if requested
-        query_terms = search_query.split()
-        frags = []
-        if fragments:
-            frags = extract_fragments(content, query_terms, context, max_fragments=3)
+        score = book_results[0].score
+        frags = book_results[0].fragments
 
         if output_format == OutputFormat.JSON:
             book_result: dict[str, Any] = {
@@ -4223,18 +4283,12 @@ def query_command(
             }
             if fragments:
                 book_result["fragments"] = frags
-            typer.echo(json.dumps([book_result], indent=2))
+            _echo_json([book_result])
         else:
-            typer.echo(f"[1] {book_id} (score: {score:.4f})")
-            typer.echo(f"    Title: {book.title}")
-
+            lines = [f"[1] {book_id} (score: {score:.4f})", f"    Title: {book.title}"]
             if fragments and frags:
-                for j, frag in enumerate(frags, 1):
-                    line_range = f"{frag['line_start']}-{frag['line_end']}"
-                    typer.echo(f"\n    Fragment {j} (lines {line_range}):")
-                    typer.echo("    " + "-" * 40)
-                    for line in frag["lines"]:
-                        typer.echo(f"    {line}")
+                lines.extend(_format_fragment_lines(frags))
+            _echo_lines(lines)
 
         return
 
@@ -4417,55 +4471,27 @@ def query_command(
                 "semantic_results": semantic_data,
                 "overlap": overlap_ids,
             }
-            typer.echo(json.dumps(output, indent=2))
+            _echo_json(output)
         else:
             # Human-readable output
-            typer.echo("=== BM25 Results (keyword match) ===")
+            lines = ["=== BM25 Results (keyword match) ==="]
             if not bm25_results:
-                typer.echo("No BM25 results found")
-            else:
-                for i, r in enumerate(bm25_results, 1):
-                    title = r.entry.title if r.entry else "No title"
-                    typer.echo(f"[{i}] {r.entry_id} (score: {r.score:.2f})")
-                    typer.echo(f"    Title: {title}")
-                    if r.entry_type.value != "paper":
-                        typer.echo(f"    Type: {r.entry_type.value}")
-
-                    if fragments and r.fragments:
-                        for j, frag in enumerate(r.fragments, 1):
-                            line_range = f"{frag['line_start']}-{frag['line_end']}"
-                            typer.echo(f"\n    Fragment {j} (lines {line_range}):")
-                            typer.echo("    " + "-" * 40)
-                            for line in frag["lines"]:
-                                typer.echo(f"    {line}")
-                    typer.echo()
-
-            typer.echo("\n=== Semantic Results (meaning match) ===")
+                lines.append("No BM25 results found")
+            for i, r in enumerate(bm25_results, 1):
+                lines.extend(_format_result_lines(i, r, fragments, score_format=".2f"))
+
+            lines.append("\n=== Semantic Results (meaning match) ===")
             if not semantic_results:
-                typer.echo("No semantic results found")
-            else:
-                for i, r in enumerate(semantic_results, 1):
-                    title = r.entry.title if r.entry else "No title"
-                    typer.echo(f"[{i}] {r.entry_id} (score: {r.score:.2f})")
-                    typer.echo(f"    Title: {title}")
-                    if r.entry_type.value != "paper":
-                        typer.echo(f"    Type: {r.entry_type.value}")
-
-                    if fragments and r.fragments:
-                        for j, frag in enumerate(r.fragments, 1):
-                            line_range = f"{frag['line_start']}-{frag['line_end']}"
-                            typer.echo(f"\n    Fragment {j} (lines {line_range}):")
-                            typer.echo("    " + "-" * 40)
-                            for line in frag["lines"]:
-                                typer.echo(f"    {line}")
-                    typer.echo()
-
-            typer.echo("\n=== Found in both ===")
+                lines.append("No semantic results found")
+            for i, r in enumerate(semantic_results, 1):
+                lines.extend(_format_result_lines(i, r, fragments, score_format=".2f"))
+
+            lines.append("\n=== Found in both ===")
             if overlap_ids:
-                for entry_id in overlap_ids:
-                    typer.echo(f"  - {entry_id}")
+                lines.extend(f"  - {entry_id}" for entry_id in overlap_ids)
             else:
-                typer.echo("  (no overlap)")
+                lines.append("  (no overlap)")
+            _echo_lines(lines)
 
         return
 
@@ -4486,8 +4512,10 @@ def query_command(
             raise typer.Exit(1)
     else:
         # Single paper search
+        from paper_index_tool.search import get_paper_searcher
+
         try:
-            results = PaperSearcher().search(
+            results = get_paper_searcher().search(
                 query=search_query,
                 entry_id=paper_id,
                 top_k=num_results,
@@ -4510,29 +4538,16 @@ def query_command(
             if fragments:
                 result_item["fragments"] = r.fragments
             results_data.append(result_item)
-        typer.echo(json.dumps(results_data, indent=2))
+        _echo_json(results_data)
     else:
         if not results:
             typer.echo("No results found")
             return
 
+        out_lines: list[str] = []
         for i, r in enumerate(results, 1):
-            title = r.entry.title if r.entry else "No title"
-            typer.echo(f"[{i}] {r.entry_id} (score: {r.score:.4f})")
-            typer.echo(f"    Title: {title}")
-            if r.entry_type.value != "paper":
-                typer.echo(f"    Type: {r.entry_type.value}")
-
-            if fragments and r.fragments:
-                for j, frag in enumerate(r.fragments, 1):
-                    typer.echo(
-                        f"\n    Fragment {j} (lines {frag['line_start']}-{frag['line_end']}):"
-                    )
-                    typer.echo("    " + "-" * 40)
-                    for line in frag["lines"]:
-                        typer.echo(f"    {line}")
-
-            typer.echo()
+            out_lines.extend(_format_result_lines(i, r, fragments))
+        _echo_lines(out_lines)
 
 
 @app.command(name="reindex")
@@ -4543,6 +4558,14 @@ def reindex_command(
     bm25_only: Annotated[
         bool, typer.Option("--bm25", help="Only rebuild BM25 index (skip vectors)")
     ] = False,
+    max_rps: Annotated[
+        float | None,
+        typer.Option(
+            "--max-rps",
+            min=1.0,
+            help="Cap Bedrock embedding requests per second (default: no cap)",
+        ),
+    ] = None,
 ) -> None:
     """Rebuild search indices for all entries.
 
@@ -4566,32 +4589,38 @@ def reindex_command(
     EXAMPLES:
         paper-index-tool reindex              # BM25 only
         paper-index-tool reindex --vectors    # Build vector index (semantic search)
+        paper-index-tool reindex --vectors --max-rps 20   # Stay under Bedrock quota
 
     \b
     REQUIREMENTS FOR --vectors:
         - AWS credentials configured (AWS_PROFILE or environment variables)
         - Bedrock access enabled for amazon.titan-embed-text-v2:0
         - Optional dependencies: pip install paper-index-tool[vector]
+
+    \b
+    EMBEDDING THROUGHPUT:
+        Titan and Nova embed one chunk per request; requests run concurrently.
+        Cohere indices (vector create --model cohere-multi) send up to 96 chunks
+        per request - far fewer round trips, but inputs are capped at 512 tokens.
     """
-    import os
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from tqdm import tqdm
 
     from paper_index_tool.search import (
-        BookSearcher,
-        MediaSearcher,
-        PaperSearcher,
+        get_book_searcher,
+        get_media_searcher,
+        get_paper_searcher,
     )
 
     def _rebuild_index(index_type: str) -> tuple[str, int]:
         """Rebuild a single index type (worker function for parallel execution)."""
         if index_type == "papers":
-            return ("papers", PaperSearcher().rebuild_index())
+            return ("papers", get_paper_searcher().rebuild_index())
         elif index_type == "books":
-            return ("books", BookSearcher().rebuild_index())
+            return ("books", get_book_searcher().rebuild_index())
         else:
-            return ("media", MediaSearcher().rebuild_index())
+            return ("media", get_media_searcher().rebuild_index())
 
     # Build BM25 index (unless --vectors only was intended)
     if not vectors or bm25_only:
@@ -4633,7 +4662,7 @@ def reindex_command(
         typer.echo("Building vector index for semantic search...")
 
         try:
-            vector_searcher = VectorSearcher()
+            vector_searcher = VectorSearcher(max_requests_per_second=max_rps)
             vector_counts = vector_searcher.rebuild_index()
             typer.echo(
                 f"Vector: Indexed {int(vector_counts['papers'])} papers, "
@@ -4643,6 +4672,7 @@ def reindex_command(
             typer.echo(
                 f"Tokens: {int(vector_counts['tokens']):,} | Cost: ${vector_counts['cost']:.6f}"
             )
+            typer.echo(_format_embedding_rate(vector_counts))
         except AWSCredentialsError as e:
             typer.echo(f"Error: {e}", err=True)
             raise typer.Exit(1)
@@ -4659,6 +4689,14 @@ def reindex_command(
 # =============================================================================
 
 
+def _format_embedding_rate(counts: dict[str, int | float]) -> str:
+    """Format embedding wall-clock time and throughput from rebuild counts."""
+    seconds = float(counts.get("seconds", 0.0))
+    chunks = int(counts["chunks"])
+    rate = chunks / seconds if seconds > 0 else 0.0
+    return f"Embedding: {chunks} chunks in {seconds:.1f}s ({rate:.1f} chunks/s)"
+
+
 @vector_app.command(name="create")
 def vector_create_command(
     name: Annotated[str, typer.Argument(help="Index name (e.g., 'nova-1024', 'titan-v2')")],
@@ -4684,6 +4722,22 @@ def vector_create_command(
         int,
         typer.Option("--chunk-overlap", help="Overlap words between chunks"),
     ] = 50,
+    quantization: Annotated[
+        str,
+        typer.Option(
+            "--quantization",
+            "-q",
+            help="Vector storage: fp32 (exact), fp16 (half size), int8 (quarter size)",
+        ),
+    ] = "fp32",
+    max_rps: Annotated[
+        float | None,
+        typer.Option(
+            "--max-rps",
+            min=1.0,
+            help="Cap Bedrock embedding requests per second (default: no cap)",
+        ),
+    ] = None,
     verbose: Annotated[int, typer.Option("--verbose", "-v", count=True, help="Verbosity")] = 0,
 ) -> None:
     """Create and build a new named vector index.
@@ -4704,6 +4758,8 @@ def vector_create_command(
         paper-index-tool vector create nova-1024 --model nova --dimensions 1024
         paper-index-tool vector create titan-default --model titan-v2
         paper-index-tool vector create cohere-search --model cohere-en
+        paper-index-tool vector create titan-int8 --model titan-v2 --quantization int8
+        paper-index-tool vector create titan-default --model titan-v2 --max-rps 20
 
     \b
     NOTE: Building the index requires AWS Bedrock credentials.
@@ -4724,6 +4780,16 @@ def vector_create_command(
         typer.echo(f"Error: Unknown model '{model}'. Valid models: {valid_models}", err=True)
         raise typer.Exit(1)
 
+    # Validate quantization
+    valid_quantizations = get_args(VectorQuantization)
+    if quantization not in valid_quantizations:
+        typer.echo(
+            f"Error: Unknown quantization '{quantization}'. "
+            f"Valid values: {', '.join(valid_quantizations)}",
+            err=True,
+        )
+        raise typer.Exit(1)
+
     # Validate dimensions
     try:
         validated_dims = validate_dimensions(model, dimensions)
@@ -4749,6 +4815,7 @@ def vector_create_command(
             dimensions=validated_dims,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            quantization=cast(VectorQuantization, quantization),
         )
 
         config = get_model_config(model)
@@ -4757,6 +4824,7 @@ def vector_create_command(
         typer.echo(f"  Dimensions: {validated_dims}")
         typer.echo(f"  Chunk size: {chunk_size} words")
         typer.echo(f"  Chunk overlap: {chunk_overlap} words")
+        typer.echo(f"  Quantization: {quantization}")
         typer.echo()
 
         # Build the index
@@ -4765,6 +4833,7 @@ def vector_create_command(
             index_name=name,
             model_name=model,
             dimensions=validated_dims,
+            max_requests_per_second=max_rps,
         )
         counts = searcher.rebuild_index()
 
@@ -4776,6 +4845,7 @@ def vector_create_command(
         typer.echo(f"  Total chunks: {counts['chunks']}")
         typer.echo(f"  Tokens processed: {counts['tokens']}")
         typer.echo(f"  Estimated cost: ${counts['cost']:.6f}")
+        typer.echo(f"  {_format_embedding_rate(counts)}")
 
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -4834,6 +4904,7 @@ def vector_list_command(
             typer.echo(f"  {idx.name}{default_marker}")
             typer.echo(f"    Model: {model_name} ({idx.embedding_model})")
             typer.echo(f"    Dimensions: {idx.dimensions}")
+            typer.echo(f"    Quantization: {idx.quantization}")
             typer.echo(f"    Chunks: {idx.chunk_count}")
             typer.echo(f"    Cost: ${idx.estimated_cost_usd:.6f}")
             typer.echo()
@@ -4903,6 +4974,7 @@ def vector_info_command(
             typer.echo(f"  Dimensions: {metadata.dimensions}")
             typer.echo(f"  Chunk size: {metadata.chunk_size} words")
             typer.echo(f"  Chunk overlap: {metadata.chunk_overlap} words")
+            typer.echo(f"  Quantization: {metadata.quantization}")
             typer.echo(f"  Chunks: {metadata.chunk_count}")
             typer.echo(f"  Tokens processed: {metadata.total_tokens}")
             typer.echo(f"  Estimated cost: ${metadata.estimated_cost_usd:.6f}")
@@ -5028,6 +5100,14 @@ def vector_default_command(
 @vector_app.command(name="rebuild")
 def vector_rebuild_command(
     name: Annotated[str, typer.Argument(help="Index name to rebuild")],
+    max_rps: Annotated[
+        float | None,
+        typer.Option(
+            "--max-rps",
+            min=1.0,
+            help="Cap Bedrock embedding requests per second (default: no cap)",
+        ),
+    ] = None,
     verbose: Annotated[int, typer.Option("--verbose", "-v", count=True, help="Verbosity")] = 0,
 ) -> None:
     """Rebuild an existing vector index.
@@ -5037,6 +5117,7 @@ def vector_rebuild_command(
     \b
     EXAMPLES:
         paper-index-tool vector rebuild nova-1024
+        paper-index-tool vector rebuild nova-1024 --max-rps 20
     """
     setup_logging(verbose)
 
@@ -5059,6 +5140,7 @@ def vector_rebuild_command(
             index_name=name,
             model_name=model_name,
             dimensions=metadata.dimensions,
+            max_requests_per_second=max_rps,
         )
         counts = searcher.rebuild_index()
 
@@ -5069,6 +5151,7 @@ def vector_rebuild_command(
         typer.echo(f"  Total chunks: {counts['chunks']}")
         typer.echo(f"  Tokens processed: {counts['tokens']}")
         typer.echo(f"  Estimated cost: ${counts['cost']:.6f}")
+        typer.echo(f"  {_format_embedding_rate(counts)}")
 
     except NamedIndexNotFoundError:
         typer.echo(f"Error: Index '{name}' not found.", err=True)
@@ -4,15 +4,23 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 
+import click
 import typer
 from click.shell_completion import BashComplete, FishComplete, ShellComplete, ZshComplete
 
 completion_app = typer.Typer(help="Generate shell completion scripts.")
 
+_COMPLETION_CLASSES: dict[str, type[ShellComplete]] = {
+    "bash": BashComplete,
+    "zsh": ZshComplete,
+    "fish": FishComplete,
+}
 
-class Shell(str, Enum):
+
+class Shell(StrEnum):
     """Supported shell types for completion."""
 
     bash = "bash"
@@ -67,25 +75,26 @@ def generate_completion(
     \b
     Note: PowerShell is not currently supported.
     """
+    if shell.value not in _COMPLETION_CLASSES:
+        raise typer.BadParameter(f"Unsupported shell: {shell}")
+    typer.echo(_completion_source(shell.value))
+
+
+@lru_cache(maxsize=1)
+def _get_click_command() -> click.Command:
+    """Build the Click command tree from the Typer app once."""
     from paper_index_tool.cli import app
 
-    completion_classes: dict[str, type[ShellComplete]] = {
-        "bash": BashComplete,
-        "zsh": ZshComplete,
-        "fish": FishComplete,
-    }
-
-    # Get the Click command from the Typer app
-    click_command = typer.main.get_command(app)
-
-    completion_class = completion_classes.get(shell.value)
-    if completion_class:
-        completer = completion_class(
-            cli=click_command,
-            ctx_args={},
-            prog_name="paper-index-tool",
-            complete_var="_PAPER_INDEX_TOOL_COMPLETE",
-        )
-        typer.echo(completer.source())
-    else:
-        raise typer.BadParameter(f"Unsupported shell: {shell}")
+    return typer.main.get_command(app)
+
+
+@lru_cache(maxsize=len(_COMPLETION_CLASSES))
+def _completion_source(shell_name: str) -> str:
+    """Render the completion script for a shell (deterministic per CLI definition)."""
+    completer = _COMPLETION_CLASSES[shell_name](
+        cli=_get_click_command(),
+        ctx_args={},
+        prog_name="paper-index-tool",
+        complete_var="_PAPER_INDEX_TOOL_COMPLETE",
+    )
+    return completer.source()
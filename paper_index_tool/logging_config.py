@@ -22,6 +22,9 @@ DEFAULT_LOG_FORMAT = "[%(asctime)s] [%(levelname)s] %(name)s: %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 CONSOLE_LOG_FORMAT = "[%(levelname)s] %(message)s"
 
+# Open rotating file handlers by log file path, reused across setup_logging calls
+_FILE_HANDLERS: dict[str, RotatingFileHandler] = {}
+
 
 def setup_logging(
     verbose_count: int = 0,
@@ -68,9 +71,10 @@ def setup_logging(
     file_path = log_file or os.environ.get("LOG_FILE")
     fmt = log_format or os.environ.get("LOG_FORMAT")
 
-    # Get root logger and clear existing handlers
+    # Get root logger and clear existing handlers (keeping the file open
+    # when the same log file is configured again)
     root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    _clear_handlers(root_logger, keep=_FILE_HANDLERS.get(file_path) if file_path else None)
     root_logger.setLevel(level)
 
     if file_path:
@@ -88,6 +92,26 @@ def setup_logging(
     #       logging.getLogger("urllib3").setLevel(logging.DEBUG)
 
 
+def _clear_handlers(logger: logging.Logger, keep: logging.Handler | None = None) -> None:
+    """Detach all handlers from a logger, closing all but ``keep``.
+
+    Closing releases the file descriptors of replaced file handlers, so
+    repeated setup in a long-running process does not leak them.
+
+    Args:
+        logger: Logger to clear.
+        keep: Handler to detach without closing, for reuse.
+    """
+    for handler in logger.handlers:
+        if handler is keep:
+            continue
+        handler.close()
+        for path, cached in list(_FILE_HANDLERS.items()):
+            if cached is handler:
+                del _FILE_HANDLERS[path]
+    logger.handlers.clear()
+
+
 def _setup_console_handler(
     logger: logging.Logger,
     level: int,
@@ -117,6 +141,9 @@ def _setup_file_handler(
 ) -> None:
     """Set up rotating file handler.
 
+    The handler for a given path is created once and reused by later
+    calls, which only update its level and format.
+
     Args:
         logger: Logger to configure.
         file_path: Path to log file.
@@ -125,16 +152,19 @@ def _setup_file_handler(
         max_bytes: Maximum file size before rotation (default 10MB).
         backup_count: Number of backup files to keep (default 5).
     """
-    # Ensure parent directory exists
-    log_path = Path(file_path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-
-    handler = RotatingFileHandler(
-        file_path,
-        maxBytes=max_bytes,
-        backupCount=backup_count,
-        encoding="utf-8",
-    )
+    handler = _FILE_HANDLERS.get(file_path)
+    if handler is None:
+        # Ensure parent directory exists
+        log_path = Path(file_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        handler = RotatingFileHandler(
+            file_path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        _FILE_HANDLERS[file_path] = handler
     handler.setLevel(level)
     formatter = logging.Formatter(
         fmt or DEFAULT_LOG_FORMAT,
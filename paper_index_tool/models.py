@@ -13,31 +13,53 @@ Models:
 Enums:
     MediaType: Type of media source (video, podcast, blog).
 
+Types:
+    AIProvider: Literal of the allowed ai_provider values.
+    VectorQuantization: Literal of the supported vector index storage formats.
+
+Functions:
+    freeze_now: Context manager sharing one default timestamp across a bulk import.
+
 Field Lists:
-    PAPER_BIBTEX_FIELDS: List of bibtex field names for Paper model.
-    PAPER_CONTENT_FIELDS: List of content field names for Paper model.
-    BOOK_BIBTEX_FIELDS: List of bibtex field names for Book model.
-    BOOK_CONTENT_FIELDS: List of content field names for Book model.
-    MEDIA_BIBTEX_FIELDS: List of bibtex field names for Media model.
-    MEDIA_CONTENT_FIELDS: List of content field names for Media model.
+    PAPER_BIBTEX_FIELDS: Tuple of bibtex field names for Paper model.
+    PAPER_CONTENT_FIELDS: Tuple of content field names for Paper model.
+    BOOK_BIBTEX_FIELDS: Tuple of bibtex field names for Book model.
+    BOOK_CONTENT_FIELDS: Tuple of content field names for Book model.
+    MEDIA_BIBTEX_FIELDS: Tuple of bibtex field names for Media model.
+    MEDIA_CONTENT_FIELDS: Tuple of content field names for Media model.
+    *_ALL_FIELDS_SET: Frozensets of all field names for membership checks.
 
 Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
 import re
+import time
+from abc import abstractmethod
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field, field_validator, model_validator
+from enum import StrEnum
+from functools import cache, cached_property, lru_cache
+from itertools import chain, islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
 
 # =============================================================================
 # Enums
 # =============================================================================
 
 
-class MediaType(str, Enum):
+class MediaType(StrEnum):
     """Type of media source.
 
     Values:
@@ -51,11 +73,72 @@ class MediaType(str, Enum):
     BLOG = "blog"
 
 
+# Allowed ai_provider values, enforced by pydantic-core as a Literal
+AIProvider = Literal["anthropic", "openai", "google", "meta", "mistral", "other"]
+
+# Storage format of vectors in a FAISS index (fp16/int8 use a scalar quantizer)
+VectorQuantization = Literal["fp32", "fp16", "int8"]
+
+
+# =============================================================================
+# Validation Constants
+# =============================================================================
+
+
+class _Patterns(NamedTuple):
+    """Compiled validation regexes, see _patterns()."""
+
+    id: re.Pattern[str]
+    word: re.Pattern[str]
+    name: re.Pattern[str]
+
+
+@cache
+def _patterns() -> _Patterns:
+    """Compile the validation regexes on first use.
+
+    Importing the models (e.g. for CLI help or completion) does not pay
+    for regex compilation; the first validation that needs a pattern does.
+
+    Returns:
+        The compiled patterns, shared by all later calls.
+    """
+    return _Patterns(
+        # <surname><year> optionally followed by:
+        # - single letter (a, b, c)
+        # - 'ch' + digits (ch1, ch2)
+        # - media type (pod, vid, blg) optionally followed by a letter
+        id=re.compile(r"^[a-z]+\d{4}([a-z]|ch\d+|(pod|vid|blg)[a-z]?)?$"),
+        word=re.compile(r"\S+"),
+        # Vector index names: alphanumeric start, then lowercase, digits, '-' or '_'
+        name=re.compile(r"^[a-z0-9][a-z0-9_-]*$"),
+    )
+
+
+# Accepted URL schemes; only the scheme and the first character after it
+# are checked, the rest of the URL is never scanned
+_URL_SCHEMES = ("http://", "https://")
+MAX_URL_LENGTH = 2048
+# Absolute Unix/Mac paths or relative paths; Windows drive letters are
+# checked separately in validate_file_path
+_PATH_PREFIXES = ("/", "~", "./", "../")
+
+
 # =============================================================================
 # Reusable Validator Functions (SOLID - Single Responsibility)
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_id(value_lower: str) -> bool:
+    """Match a lowercased ID against the ID pattern, memoized per ID.
+
+    IDs repeat across imports, merges and cross-references, so repeated
+    checks of the same ID skip the regex match.
+    """
+    return _patterns().id.match(value_lower) is not None
+
+
 def validate_id_format(value: str, field_name: str = "id") -> str:
     """Validate ID format matches <surname><year>[suffix] pattern.
 
@@ -81,13 +164,8 @@ def validate_id_format(value: str, field_name: str = "id") -> str:
         >>> validate_id_format("ashford2017vida")
         'ashford2017vida'
     """
-    # Allow <surname><year> optionally followed by:
-    # - single letter (a, b, c)
-    # - 'ch' + digits (ch1, ch2)
-    # - media type (pod, vid, blg) optionally followed by a letter
-    pattern = r"^[a-z]+\d{4}([a-z]|ch\d+|(pod|vid|blg)[a-z]?)?$"
     value_lower = value.lower()
-    if not re.match(pattern, value_lower):
+    if not _is_valid_id(value_lower):
         raise ValueError(
             f"Invalid {field_name} format: '{value}'. "
             f"Expected format: <surname><year>[suffix], "
@@ -113,9 +191,14 @@ def validate_min_length(value: str, min_len: int, field_name: str) -> str:
     Raises:
         ValueError: If string is too short with agent-friendly guidance.
     """
-    if len(value.strip()) < min_len:
+    # Fast path: no surrounding whitespace means strip() would be a no-op,
+    # so the raw length decides without allocating a stripped copy
+    if len(value) >= min_len and not value[:1].isspace() and not value[-1:].isspace():
+        return value
+    stripped_len = len(value.strip())
+    if stripped_len < min_len:
         raise ValueError(
-            f"Field '{field_name}' is too short: {len(value.strip())} characters. "
+            f"Field '{field_name}' is too short: {stripped_len} characters. "
             f"Minimum required: {min_len} characters. "
             f"Current value: '{value[:50]}{'...' if len(value) > 50 else ''}'. "
             f"Please provide a more complete value."
@@ -123,6 +206,88 @@ def validate_min_length(value: str, min_len: int, field_name: str) -> str:
     return value
 
 
+# Current year for validate_year as (monotonic time checked, year)
+_YEAR_TTL_SECONDS = 3600.0
+_year_cache: tuple[float, int] = (float("-inf"), 0)
+
+
+def _current_year() -> int:
+    """Get the current year, re-reading the clock at most once an hour.
+
+    Bulk validation checks the year of every record; the cached value
+    turns that into an integer compare. The hourly refresh keeps
+    long-running processes correct across New Year.
+
+    Returns:
+        The current calendar year.
+    """
+    global _year_cache
+    checked_at, year = _year_cache
+    now = time.monotonic()
+    if now - checked_at > _YEAR_TTL_SECONDS:
+        year = datetime.now().year
+        _year_cache = (now, year)
+    return year
+
+
+# Coarse clock for entry timestamps as (monotonic time read, wall-clock time)
+_NOW_TTL_SECONDS = 1.0
+_now_cache: tuple[float, datetime] = (float("-inf"), datetime.min)
+
+
+# Fixed timestamp for entries built inside freeze_now()
+_NOW_OVERRIDE: ContextVar[datetime | None] = ContextVar("_now_override", default=None)
+
+
+def _cached_now() -> datetime:
+    """Get the current time at one-second resolution.
+
+    Paper/Book/Media entries without stored timestamps take created_at and
+    updated_at from this clock. Bulk imports validate thousands of entries
+    per second, so the clock is read at most once a second and the value
+    shared. Inside freeze_now() the frozen timestamp is returned instead.
+
+    Returns:
+        The current local time, at most one second old.
+    """
+    frozen = _NOW_OVERRIDE.get()
+    if frozen is not None:
+        return frozen
+    global _now_cache
+    checked_at, now = _now_cache
+    tick = time.monotonic()
+    if tick - checked_at > _NOW_TTL_SECONDS:
+        now = datetime.now()
+        _now_cache = (tick, now)
+    return now
+
+
+@contextmanager
+def freeze_now() -> Iterator[datetime]:
+    """Give every entry built in this context the same default timestamp.
+
+    Bulk importers wrap their validation loop in this so all entries without
+    stored timestamps share one created_at/updated_at, read once up front.
+    The override is held in a ContextVar; worker threads must run inside a
+    copy of the caller's context (contextvars.copy_context()) to see it.
+
+    Yields:
+        The frozen timestamp.
+
+    Example:
+        >>> with freeze_now() as now:
+        ...     papers = Paper.validate_batch(rows_without_timestamps)
+        >>> papers[0].created_at == now
+        True
+    """
+    now = datetime.now()
+    token = _NOW_OVERRIDE.set(now)
+    try:
+        yield now
+    finally:
+        _NOW_OVERRIDE.reset(token)
+
+
 def validate_year(value: int, field_name: str = "year") -> int:
     """Validate year is a valid 4-digit year.
 
@@ -136,7 +301,7 @@ def validate_year(value: int, field_name: str = "year") -> int:
     Raises:
         ValueError: If year is invalid with agent-friendly guidance.
     """
-    current_year = datetime.now().year
+    current_year = _current_year()
     if value < 1900 or value > current_year + 1:
         raise ValueError(
             f"Invalid {field_name}: {value}. "
@@ -146,6 +311,41 @@ def validate_year(value: int, field_name: str = "year") -> int:
     return value
 
 
+def _has_url_scheme(value: str) -> bool:
+    """Check for an http(s) scheme followed by a non-space character.
+
+    Args:
+        value: The URL to check.
+
+    Returns:
+        True if the URL starts with 'http://' or 'https://' plus a host.
+    """
+    if not value.startswith(_URL_SCHEMES):
+        return False
+    host_start = value.index("//") + 2
+    first = value[host_start : host_start + 1]
+    return first != "" and not first.isspace()
+
+
+def _check_url_length(value: str, field_name: str) -> None:
+    """Reject URLs longer than MAX_URL_LENGTH characters.
+
+    Args:
+        value: The URL to check.
+        field_name: Name of the field for error messages.
+
+    Raises:
+        ValueError: If the URL is too long with agent-friendly guidance.
+    """
+    if len(value) > MAX_URL_LENGTH:
+        raise ValueError(
+            f"Field '{field_name}' is too long: {len(value)} characters. "
+            f"Maximum allowed: {MAX_URL_LENGTH} characters. "
+            f"Current value: '{value[:50]}...'. "
+            f"Please provide the canonical URL without embedded content."
+        )
+
+
 def validate_url(value: str | None, field_name: str = "url") -> str | None:
     """Validate URL format (http/https).
 
@@ -161,8 +361,8 @@ def validate_url(value: str | None, field_name: str = "url") -> str | None:
     """
     if value is None:
         return None
-    pattern = r"^https?://[^\s]+"
-    if not re.match(pattern, value):
+    _check_url_length(value, field_name)
+    if not _has_url_scheme(value):
         raise ValueError(
             f"Invalid {field_name} format: '{value}'. "
             f"URL must start with 'http://' or 'https://'. "
@@ -184,16 +384,17 @@ def validate_file_path(value: str, field_name: str) -> str:
     Raises:
         ValueError: If file path format is invalid with agent-friendly guidance.
     """
-    # Allow absolute paths (Unix/Mac or Windows) or relative paths
-    pattern = r"^(/|~|[A-Za-z]:\\|\.\.?/)"
-    if not re.match(pattern, value):
-        raise ValueError(
-            f"Invalid {field_name} format: '{value}'. "
-            f"Path must be absolute (starting with /, ~, or drive letter like C:\\) "
-            f"or relative (starting with ./ or ../). "
-            f"Example: '/Users/dennis/papers/ashford2012.pdf' or './papers/ashford2012.pdf'"
-        )
-    return value
+    if value.startswith(_PATH_PREFIXES):
+        return value
+    # Windows drive letter, e.g. C:\
+    if value[1:3] == ":\\" and value[:1].isascii() and value[:1].isalpha():
+        return value
+    raise ValueError(
+        f"Invalid {field_name} format: '{value}'. "
+        f"Path must be absolute (starting with /, ~, or drive letter like C:\\) "
+        f"or relative (starting with ./ or ../). "
+        f"Example: '/Users/dennis/papers/ashford2012.pdf' or './papers/ashford2012.pdf'"
+    )
 
 
 def validate_rating(value: int, field_name: str = "rating") -> int:
@@ -209,7 +410,7 @@ def validate_rating(value: int, field_name: str = "rating") -> int:
     Raises:
         ValueError: If rating is out of range with agent-friendly guidance.
     """
-    if value < 1 or value > 5:
+    if not 1 <= value <= 5:
         raise ValueError(
             f"Invalid {field_name}: {value}. "
             f"Rating must be between 1 (lowest) and 5 (highest). "
@@ -218,6 +419,20 @@ def validate_rating(value: int, field_name: str = "rating") -> int:
     return value
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_date(value: str) -> bool:
+    """Parse a YYYY-MM-DD date with strptime, memoized per string.
+
+    Access and update dates repeat heavily across media entries, and
+    strptime is the most expensive check in entry validation.
+    """
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
 def validate_date_format(value: str, field_name: str = "date") -> str:
     """Validate date is in YYYY-MM-DD format.
 
@@ -231,17 +446,18 @@ def validate_date_format(value: str, field_name: str = "date") -> str:
     Raises:
         ValueError: If date format is invalid with agent-friendly guidance.
     """
-    pattern = r"^\d{4}-\d{2}-\d{2}$"
-    if not re.match(pattern, value):
+    # strptime alone accepts unpadded or space-padded fields like "2025-1-1"
+    # and "2025-01- 1"; the shape check enforces YYYY-MM-DD before the parse
+    digits = value[:4] + value[5:7] + value[8:]
+    if not (
+        len(value) == 10 and value[4] == value[7] == "-" and digits.isascii() and digits.isdigit()
+    ):
         raise ValueError(
             f"Invalid {field_name} format: '{value}'. "
             f"Date must be in YYYY-MM-DD format, e.g., '2025-01-21'. "
             f"Please provide a valid date."
         )
-    # Also validate it's a real date
-    try:
-        datetime.strptime(value, "%Y-%m-%d")
-    except ValueError:
+    if not _is_valid_date(value):
         raise ValueError(
             f"Invalid {field_name}: '{value}' is not a valid date. "
             f"Please provide a valid date in YYYY-MM-DD format."
@@ -262,8 +478,8 @@ def validate_required_url(value: str, field_name: str = "url") -> str:
     Raises:
         ValueError: If URL format is invalid with agent-friendly guidance.
     """
-    pattern = r"^https?://[^\s]+"
-    if not re.match(pattern, value):
+    _check_url_length(value, field_name)
+    if not _has_url_scheme(value):
         raise ValueError(
             f"Invalid {field_name} format: '{value}'. "
             f"URL must start with 'http://' or 'https://'. "
@@ -272,6 +488,23 @@ def validate_required_url(value: str, field_name: str = "url") -> str:
     return value
 
 
+def _count_words(value: str, limit: int | None = None) -> int:
+    """Count whitespace-separated words without building a list of them.
+
+    Same count as ``len(value.split())``, in O(1) extra memory. With a
+    limit, scanning stops once ``limit`` words have been seen, which is
+    all a threshold check needs.
+
+    Args:
+        value: Text to count words in.
+        limit: Stop counting at this many words (None counts all).
+
+    Returns:
+        Number of words, capped at ``limit`` when given.
+    """
+    return sum(1 for _ in islice(_patterns().word.finditer(value), limit))
+
+
 def validate_max_words(value: str, max_words: int, field_name: str) -> str:
     """Validate string does not exceed maximum word count.
 
@@ -286,10 +519,14 @@ def validate_max_words(value: str, max_words: int, field_name: str) -> str:
     Raises:
         ValueError: If word count exceeds maximum with agent-friendly guidance.
     """
-    word_count = len(value.split())
-    if word_count > max_words:
+    # Fast path: each word but the last needs a separator after it, so a
+    # string of n characters holds at most (n + 1) // 2 words
+    if (len(value) + 1) // 2 <= max_words:
+        return value
+    # The bounded count stops right past the limit, also for oversized input
+    if _count_words(value, max_words + 1) > max_words:
         raise ValueError(
-            f"Field '{field_name}' exceeds maximum word count: {word_count} words. "
+            f"Field '{field_name}' exceeds maximum word count: more than {max_words} words. "
             f"Maximum allowed: {max_words} words. "
             f"Please condense the content to fit within the limit."
         )
@@ -310,7 +547,7 @@ def validate_min_words(value: str, min_words: int, field_name: str) -> str:
     Raises:
         ValueError: If word count is below minimum with agent-friendly guidance.
     """
-    word_count = len(value.split())
+    word_count = _count_words(value, min_words)
     if word_count < min_words:
         raise ValueError(
             f"Field '{field_name}' has insufficient content: {word_count} words. "
@@ -343,6 +580,22 @@ def validate_quotes_min_count(quotes: list[Quote], min_count: int = 10) -> list[
     return quotes
 
 
+def normalize_keywords(keywords: str) -> list[str]:
+    """Split a comma-separated keyword string into normalized keywords.
+
+    Args:
+        keywords: Comma-separated keywords (e.g., "Leadership, Identity").
+
+    Returns:
+        Stripped, lowercased keywords with empty entries removed.
+
+    Example:
+        >>> normalize_keywords("Leadership, Identity,")
+        ['leadership', 'identity']
+    """
+    return [kw for kw in map(str.lower, map(str.strip, keywords.split(","))) if kw]
+
+
 # =============================================================================
 # Quote Model
 # =============================================================================
@@ -365,7 +618,11 @@ class Quote(BaseModel):
         >>> media_quote = Quote(text="The key insight here is...", timestamp="05:30")
     """
 
-    text: str = Field(min_length=10, description="The verbatim quote text (minimum 10 characters)")
+    text: str = Field(
+        min_length=10,
+        pattern=r"\S",
+        description="The verbatim quote text (minimum 10 characters, not only whitespace)",
+    )
     page: int | None = Field(
         default=None, gt=0, description="Page number where quote appears (for papers/books)"
     )
@@ -373,38 +630,323 @@ class Quote(BaseModel):
         default=None, description="Timestamp for video/podcast (HH:MM:SS or MM:SS)"
     )
 
-    @field_validator("text")
-    @classmethod
-    def validate_text_not_empty(cls, v: str) -> str:
-        """Ensure quote text is meaningful, not just whitespace."""
-        if not v.strip():
-            raise ValueError(
-                "Quote text cannot be empty or whitespace only. "
-                "Please provide the exact verbatim text from the source."
-            )
-        return v
-
     @field_validator("timestamp")
     @classmethod
     def validate_timestamp_format(cls, v: str | None) -> str | None:
         """Validate timestamp format (HH:MM:SS or MM:SS)."""
         if v is None:
             return None
-        pattern = r"^(\d{1,2}:)?\d{1,2}:\d{2}$"
-        if not re.match(pattern, v):
+        # [H]H:MM:SS or [M]M:SS, parsed by hand; seconds are always two digits
+        parts = v.split(":")
+        if not (
+            len(parts) in (2, 3)
+            and len(parts[-1]) == 2
+            and all(0 < len(part) <= 2 and part.isdecimal() for part in parts)
+        ):
             raise ValueError(
                 f"Invalid timestamp format: '{v}'. "
                 f"Timestamp must be in HH:MM:SS or MM:SS format, e.g., '05:30' or '01:23:45'."
             )
         return v
 
+    @classmethod
+    def validate_batch(cls, rows: list[Any]) -> list[Quote]:
+        """Validate a list of raw quote dictionaries in one call.
+
+        Args:
+            rows: Quote data dictionaries (e.g., parsed from --quotes JSON).
+
+        Returns:
+            Validated Quote objects in input order.
+
+        Raises:
+            ValidationError: If the input is not a list or any item is invalid.
+
+        Example:
+            >>> quotes = Quote.validate_batch([{"text": "Leadership is a process...", "page": 42}])
+        """
+        return _QUOTES_ADAPTER.validate_python(rows)
+
+
+_QUOTES_ADAPTER: TypeAdapter[list[Quote]] = TypeAdapter(list[Quote])
+
+
+# =============================================================================
+# Shared Entry Base
+# =============================================================================
+
+
+# Content fields joined into an entry's searchable text, in order, and a
+# getter that reads them all in one call
+_SEARCHABLE_FIELDS = (
+    "abstract",
+    "question",
+    "method",
+    "gaps",
+    "results",
+    "interpretation",
+    "claims",
+    "full_text",
+)
+_searchable_values = attrgetter(*_SEARCHABLE_FIELDS)
+
+# Derived values _SearchableEntry caches in the instance __dict__
+_CACHED_PROPERTIES = ("keywords_list", "searchable_text", "searchable_tokens", "bibtex")
+
+
+class _SearchableEntry(BaseModel):
+    """Validators and search helpers shared by Paper, Book and Media.
+
+    Declares no fields itself: each model keeps its own field declarations,
+    so per-model descriptions and the field order of the registry JSON are
+    unchanged. The validators use ``check_fields=False`` and apply to the
+    subclass fields of the same name.
+
+    Entries are frozen: updates go through the registry, which validates a
+    new instance, or through ``model_copy(update=...)``, which drops the
+    per-instance caches below so they cannot go stale.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    if TYPE_CHECKING:
+        # Fields every entry model declares, visible to type checkers only
+        id: str
+        author: str
+        title: str
+        year: int
+        keywords: str
+        abstract: str
+        question: str
+        method: str
+        gaps: str
+        results: str
+        interpretation: str
+        claims: str
+        quotes: list[Quote]
+        full_text: str
+
+    # =========================================================================
+    # Validators
+    # =========================================================================
+
+    @field_validator("id", check_fields=False)
+    @classmethod
+    def validate_id(cls, v: str) -> str:
+        """Validate entry ID format."""
+        return validate_id_format(v, "id")
+
+    @field_validator("author", check_fields=False)
+    @classmethod
+    def validate_author(cls, v: str) -> str:
+        """Validate author has minimum length."""
+        return validate_min_length(v, 2, "author")
+
+    @field_validator("title", check_fields=False)
+    @classmethod
+    def validate_title(cls, v: str) -> str:
+        """Validate title has minimum length."""
+        return validate_min_length(v, 5, "title")
+
+    @field_validator("year", check_fields=False)
+    @classmethod
+    def validate_year_field(cls, v: int) -> int:
+        """Validate year is a valid 4-digit year."""
+        return validate_year(v, "year")
+
+    @field_validator("file_path_pdf", check_fields=False)
+    @classmethod
+    def validate_file_path_pdf(cls, v: str) -> str:
+        """Validate PDF file path format - allow empty strings as default."""
+        if not v:
+            return ""
+        return validate_file_path(v, "file_path_pdf")
+
+    @field_validator("file_path_markdown", check_fields=False)
+    @classmethod
+    def validate_file_path_markdown(cls, v: str) -> str:
+        """Validate markdown file path format."""
+        return validate_file_path(v, "file_path_markdown")
+
+    @field_validator(
+        "abstract",
+        "question",
+        "method",
+        "gaps",
+        "results",
+        "interpretation",
+        "claims",
+        check_fields=False,
+    )
+    @classmethod
+    def validate_content_max_words(cls, v: str, info: Any) -> str:
+        """Validate content fields do not exceed 1000 words."""
+        return validate_max_words(v, 1000, info.field_name)
+
+    @field_validator("full_text", check_fields=False)
+    @classmethod
+    def validate_full_text(cls, v: str) -> str:
+        """Validate full_text has minimum 1000 words."""
+        return validate_min_words(v, 1000, "full_text")
+
+    # =========================================================================
+    # Methods
+    # =========================================================================
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any], include_quotes: bool = True) -> Self:
+        """Build an entry from data this tool wrote itself, skipping validation.
+
+        Registry files only ever hold ``model_dump(mode="json")`` output of
+        validated entries, so re-running every validator (word counts over
+        each content field, ID and path checks) on reload repeats work.
+        Only the JSON-to-Python conversions validation would have done are
+        applied: quotes become Quote objects and timestamps datetimes.
+
+        Never use this for user-supplied input; use ``model_validate``.
+
+        Args:
+            data: Entry data as stored in a registry file.
+            include_quotes: Build Quote objects for the stored quotes. Pass
+                False for metadata-only reads (listings, statistics); the
+                entry then has no quotes, so its searchable_text, bibtex
+                export and quote output are incomplete.
+
+        Returns:
+            Entry constructed without validation.
+
+        Example:
+            >>> paper = Paper.from_trusted_dict(registry_data["ashford2012"])
+        """
+        values = dict(data)
+        values["quotes"] = (
+            [Quote.model_construct(**quote) for quote in data.get("quotes", ())]
+            if include_quotes
+            else []
+        )
+        for key in ("created_at", "updated_at"):
+            timestamp = values.get(key)
+            if isinstance(timestamp, str):
+                values[key] = datetime.fromisoformat(timestamp)
+        return cls.model_construct(**values)
+
+    @classmethod
+    def columns(
+        cls, items: Sequence[Self], fields: Sequence[str] | None = None
+    ) -> dict[str, list[Any]]:
+        """Transpose entries into one list of values per field.
+
+        Table writers (CSV, Parquet, SQLite) write a column at a time, so
+        reading one field across all entries saves them transposing rows
+        themselves.
+
+        Args:
+            items: Entries to transpose.
+            fields: Field names to include, e.g. BOOK_ALL_FIELDS. Defaults to
+                every model field in declaration order.
+
+        Returns:
+            Mapping of field name to the values of that field, in item order.
+
+        Example:
+            >>> cols = Book.columns(books, BOOK_BIBTEX_FIELDS)
+            >>> cols["title"][0] == books[0].title
+            True
+        """
+        names = tuple(cls.model_fields) if fields is None else fields
+        return {name: list(map(attrgetter(name), items)) for name in names}
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the entry, dropping cached derived values when fields change.
+
+        Pydantic copies the instance ``__dict__``, which also holds the
+        cached properties (searchable_text, bibtex, ...); with ``update``
+        those would describe the old field values.
+
+        Args:
+            update: Field values to change in the copy.
+            deep: Deep-copy field values.
+
+        Returns:
+            The copied entry.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for key in _CACHED_PROPERTIES:
+                copied.__dict__.pop(key, None)
+        return copied
+
+    @cached_property
+    def keywords_list(self) -> list[str]:
+        """Normalized keywords, computed once per instance.
+
+        Returns:
+            Stripped, lowercased keywords with empty entries removed.
+        """
+        return normalize_keywords(self.keywords)
+
+    @cached_property
+    def searchable_text(self) -> str:
+        """Combine all searchable content fields into one text block.
+
+        Used for BM25 full-text indexing. Combines abstract, question, method,
+        gaps, results, interpretation, claims, full_text, and quote texts.
+
+        The text is built once per instance with a single join and reused by
+        indexing and fragment extraction. Entries are frozen (updates validate
+        a new instance), so the cached value cannot go stale.
+
+        Returns:
+            Combined text from all content fields for BM25 indexing.
+
+        Example:
+            >>> text = paper.searchable_text
+            >>> len(text) > 0
+            True
+        """
+        return "\n\n".join(chain(_searchable_values(self), (quote.text for quote in self.quotes)))
+
+    @cached_property
+    def searchable_tokens(self) -> list[str]:
+        """Tokenize the searchable text the way the BM25 indices do.
+
+        Tokens are stemmed and stopword-filtered, computed once per instance
+        and reused, so scoring the same entry again skips tokenization.
+
+        Returns:
+            Token strings of searchable_text, ready for ``bm25s.BM25.index``.
+
+        Example:
+            >>> retriever.index([book.searchable_tokens])
+        """
+        # Imported here: search builds on these models
+        from paper_index_tool.search import tokenize_text
+
+        return tokenize_text(self.searchable_text)
+
+    @cached_property
+    def bibtex(self) -> str:
+        """Bibtex entry for this entry, rendered once per instance.
+
+        Returns:
+            The output of to_bibtex().
+
+        Example:
+            >>> print(book.bibtex)
+        """
+        return self.to_bibtex()
+
+    @abstractmethod
+    def to_bibtex(self) -> str:
+        """Export the entry as a bibtex entry; implemented by each model."""
+
 
 # =============================================================================
 # Paper Model
 # =============================================================================
 
 
-class Paper(BaseModel):
+class Paper(_SearchableEntry):
     """Academic paper entry with bibtex metadata and searchable content.
 
     This model represents a peer-reviewed academic paper with comprehensive
@@ -421,7 +963,7 @@ class Paper(BaseModel):
         quotes, full_text
 
     Methods:
-        get_searchable_text(): Combine all content for BM25 indexing.
+        searchable_text: Combined content for BM25 indexing (cached).
         to_bibtex(): Export as bibtex @article entry.
 
     Example:
@@ -487,17 +1029,17 @@ class Paper(BaseModel):
     # Metadata
     # =========================================================================
     created_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was created"
+        default_factory=_cached_now, description="Timestamp when entry was created"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was last updated"
+        default_factory=_cached_now, description="Timestamp when entry was last updated"
     )
 
     # =========================================================================
     # AI Generation Tracking
     # =========================================================================
     ai_generated: bool = Field(default=False, description="Whether content was AI-generated")
-    ai_provider: str | None = Field(
+    ai_provider: AIProvider | None = Field(
         default=None, description="AI provider: anthropic, openai, google, meta, mistral, other"
     )
     ai_model: str | None = Field(
@@ -508,43 +1050,12 @@ class Paper(BaseModel):
     # Validators
     # =========================================================================
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate paper ID format."""
-        return validate_id_format(v, "id")
-
-    @field_validator("author")
-    @classmethod
-    def validate_author(cls, v: str) -> str:
-        """Validate author has minimum length."""
-        return validate_min_length(v, 2, "author")
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate title has minimum length."""
-        return validate_min_length(v, 5, "title")
-
-    @field_validator("year")
-    @classmethod
-    def validate_year_field(cls, v: int) -> int:
-        """Validate year is a valid 4-digit year."""
-        return validate_year(v, "year")
-
     @field_validator("journal")
     @classmethod
     def validate_journal(cls, v: str) -> str:
         """Validate journal has minimum length."""
         return validate_min_length(v, 5, "journal")
 
-    @field_validator("volume", "number", "issue")
-    @classmethod
-    def validate_volume_number_issue(cls, v: str) -> str:
-        """Validate volume/number/issue - allow empty strings as default."""
-        # Always allow empty strings
-        return v
-
     @field_validator("pages")
     @classmethod
     def validate_pages(cls, v: str) -> str:
@@ -553,13 +1064,6 @@ class Paper(BaseModel):
             return v
         return validate_min_length(v, 1, "pages")
 
-    @field_validator("publisher")
-    @classmethod
-    def validate_publisher(cls, v: str) -> str:
-        """Validate publisher - allow empty strings as default."""
-        # Always allow empty strings
-        return v
-
     @field_validator("doi")
     @classmethod
     def validate_doi(cls, v: str) -> str:
@@ -576,105 +1080,38 @@ class Paper(BaseModel):
             return None
         return validate_url(v, "url")
 
-    @field_validator("file_path_pdf")
-    @classmethod
-    def validate_file_path_pdf(cls, v: str) -> str:
-        """Validate PDF file path format - allow empty strings as default."""
-        # Always allow empty strings
-        if not v or v == "":
-            return ""
-        return validate_file_path(v, "file_path_pdf")
-
-    @field_validator("file_path_markdown")
-    @classmethod
-    def validate_file_path_markdown(cls, v: str) -> str:
-        """Validate markdown file path format."""
-        return validate_file_path(v, "file_path_markdown")
-
-    @field_validator("keywords")
-    @classmethod
-    def validate_keywords(cls, v: str) -> str:
-        """Validate keywords - allow empty strings as default."""
-        return v
-
     @field_validator("rating")
     @classmethod
     def validate_rating_field(cls, v: int) -> int:
         """Validate rating is between 1-5."""
         return validate_rating(v, "rating")
 
-    @field_validator(
-        "abstract", "question", "method", "gaps", "results", "interpretation", "claims"
-    )
-    @classmethod
-    def validate_content_max_words(cls, v: str, info: Any) -> str:
-        """Validate content fields do not exceed 1000 words."""
-        return validate_max_words(v, 1000, info.field_name)
-
-    @field_validator("full_text")
-    @classmethod
-    def validate_full_text(cls, v: str) -> str:
-        """Validate full_text has minimum 1000 words."""
-        return validate_min_words(v, 1000, "full_text")
-
-    @field_validator("quotes")
-    @classmethod
-    def validate_quotes(cls, v: list[Quote]) -> list[Quote]:
-        """Validate quotes list - allow empty list for flexibility."""
-        return v
-
-    @model_validator(mode="before")
-    @classmethod
-    def set_updated_at(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Update the updated_at timestamp on any modification."""
-        values["updated_at"] = datetime.now()
-        return values
-
-    @model_validator(mode="after")
-    def validate_ai_provider_value(self) -> Paper:
-        """Validate ai_provider is one of allowed values when ai_generated is True."""
-        valid_providers = {"anthropic", "openai", "google", "meta", "mistral", "other"}
-        if self.ai_generated and self.ai_provider is not None:
-            if self.ai_provider not in valid_providers:
-                raise ValueError(
-                    f"Invalid ai_provider: '{self.ai_provider}'. "
-                    f"When ai_generated=True, ai_provider must be one of: "
-                    f"{', '.join(sorted(valid_providers))}."
-                )
-        return self
-
     # =========================================================================
     # Methods
     # =========================================================================
 
-    def get_searchable_text(self) -> str:
-        """Combine all searchable content fields into one text block.
+    @classmethod
+    def validate_batch(cls, rows: list[dict[str, Any]]) -> list[Paper]:
+        """Validate many papers in a single pydantic-core call.
 
-        Used for BM25 full-text indexing. Combines abstract, question, method,
-        gaps, results, interpretation, claims, full_text, and quote texts.
+        Runs the same validation as ``Paper.model_validate`` for every row,
+        but through one ``list[Paper]`` validator, so a bulk import makes one
+        call into pydantic-core instead of one per paper.
+
+        Args:
+            rows: Paper data dictionaries (e.g., from an import file).
 
         Returns:
-            Combined text from all content fields for BM25 indexing.
+            Validated Paper objects in input order.
+
+        Raises:
+            ValidationError: If any row is invalid. Error locations start
+                with the index of the offending row.
 
         Example:
-            >>> text = paper.get_searchable_text()
-            >>> len(text) > 0
-            True
+            >>> papers = Paper.validate_batch([paper_dict_1, paper_dict_2])
         """
-        parts = [
-            self.abstract,
-            self.question,
-            self.method,
-            self.gaps,
-            self.results,
-            self.interpretation,
-            self.claims,
-            self.full_text,
-        ]
-        # Add quote texts
-        for quote in self.quotes:
-            parts.append(quote.text)
-        return "\n\n".join(parts)
+        return _paper_list_adapter().validate_python(rows)
 
     def to_bibtex(self) -> str:
         """Export paper as bibtex @article entry.
@@ -690,27 +1127,37 @@ class Paper(BaseModel):
             >>> bibtex.startswith("@article{")
             True
         """
-        lines = [f"@article{{{self.id},"]
-        lines.append(f"  author = {{{self.author}}},")
-        lines.append(f"  title = {{{self.title}}},")
-        lines.append(f"  year = {{{self.year}}},")
-        lines.append(f"  journal = {{{self.journal}}},")
-        lines.append(f"  volume = {{{self.volume}}},")
-        lines.append(f"  number = {{{self.number}}},")
-        lines.append(f"  pages = {{{self.pages}}},")
-        lines.append(f"  publisher = {{{self.publisher}}},")
-        lines.append(f"  doi = {{{self.doi}}},")
-        if self.url:
-            lines.append(f"  url = {{{self.url}}},")
-        lines.append(f"  file = {{{self.file_path_pdf}}},")
-        lines.append(f"  keywords = {{{self.keywords}}},")
-        if self.ai_generated:
-            provider = self.ai_provider or "unknown"
-            model = self.ai_model or "unknown"
-            lines.append(f"  note = {{AI-generated using {provider} {model}}},")
-        lines.append(f"  abstract = {{{self.abstract}}}")
-        lines.append("}")
-        return "\n".join(lines)
+        url_line = f"  url = {{{self.url}}},\n" if self.url else ""
+        note_line = (
+            f"  note = {{AI-generated using {self.ai_provider or 'unknown'} "
+            f"{self.ai_model or 'unknown'}}},\n"
+            if self.ai_generated
+            else ""
+        )
+        return (
+            f"@article{{{self.id},\n"
+            f"  author = {{{self.author}}},\n"
+            f"  title = {{{self.title}}},\n"
+            f"  year = {{{self.year}}},\n"
+            f"  journal = {{{self.journal}}},\n"
+            f"  volume = {{{self.volume}}},\n"
+            f"  number = {{{self.number}}},\n"
+            f"  pages = {{{self.pages}}},\n"
+            f"  publisher = {{{self.publisher}}},\n"
+            f"  doi = {{{self.doi}}},\n"
+            f"{url_line}"
+            f"  file = {{{self.file_path_pdf}}},\n"
+            f"  keywords = {{{self.keywords}}},\n"
+            f"{note_line}"
+            f"  abstract = {{{self.abstract}}}\n"
+            "}"
+        )
+
+
+@cache
+def _paper_list_adapter() -> TypeAdapter[list[Paper]]:
+    """Build the list[Paper] validator once, on first batch validation."""
+    return TypeAdapter(list[Paper])
 
 
 # =============================================================================
@@ -718,7 +1165,7 @@ class Paper(BaseModel):
 # =============================================================================
 
 
-class Book(BaseModel):
+class Book(_SearchableEntry):
     """Book or book chapter entry with bibtex metadata and searchable content.
 
     This model represents a book or book chapter with comprehensive metadata
@@ -734,7 +1181,7 @@ class Book(BaseModel):
         quotes, full_text
 
     Methods:
-        get_searchable_text(): Combine all content for BM25 indexing.
+        searchable_text: Combined content for BM25 indexing (cached).
         to_bibtex(): Export as bibtex @book entry.
 
     Example:
@@ -792,17 +1239,17 @@ class Book(BaseModel):
     # Metadata
     # =========================================================================
     created_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was created"
+        default_factory=_cached_now, description="Timestamp when entry was created"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was last updated"
+        default_factory=_cached_now, description="Timestamp when entry was last updated"
     )
 
     # =========================================================================
     # AI Generation Tracking
     # =========================================================================
     ai_generated: bool = Field(default=False, description="Whether content was AI-generated")
-    ai_provider: str | None = Field(
+    ai_provider: AIProvider | None = Field(
         default=None, description="AI provider: anthropic, openai, google, meta, mistral, other"
     )
     ai_model: str | None = Field(
@@ -813,30 +1260,6 @@ class Book(BaseModel):
     # Validators
     # =========================================================================
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate book ID format."""
-        return validate_id_format(v, "id")
-
-    @field_validator("author")
-    @classmethod
-    def validate_author(cls, v: str) -> str:
-        """Validate author has minimum length."""
-        return validate_min_length(v, 2, "author")
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate title has minimum length."""
-        return validate_min_length(v, 5, "title")
-
-    @field_validator("year")
-    @classmethod
-    def validate_year_field(cls, v: int) -> int:
-        """Validate year is a valid 4-digit year."""
-        return validate_year(v, "year")
-
     @field_validator("pages")
     @classmethod
     def validate_pages(cls, v: str) -> str:
@@ -845,13 +1268,6 @@ class Book(BaseModel):
             return v
         return validate_min_length(v, 1, "pages")
 
-    @field_validator("publisher")
-    @classmethod
-    def validate_publisher(cls, v: str) -> str:
-        """Validate publisher - allow empty strings as default."""
-        # Always allow empty strings
-        return v
-
     @field_validator("url")
     @classmethod
     def validate_url_field(cls, v: str | None) -> str | None:
@@ -866,100 +1282,10 @@ class Book(BaseModel):
         """Validate chapter has minimum length."""
         return validate_min_length(v, 2, "chapter")
 
-    @field_validator("file_path_pdf")
-    @classmethod
-    def validate_file_path_pdf(cls, v: str) -> str:
-        """Validate PDF file path format - allow empty strings as default."""
-        # Always allow empty strings
-        if not v or v == "":
-            return ""
-        return validate_file_path(v, "file_path_pdf")
-
-    @field_validator("file_path_markdown")
-    @classmethod
-    def validate_file_path_markdown(cls, v: str) -> str:
-        """Validate markdown file path format."""
-        return validate_file_path(v, "file_path_markdown")
-
-    @field_validator("keywords")
-    @classmethod
-    def validate_keywords(cls, v: str) -> str:
-        """Validate keywords - allow empty strings as default."""
-        return v
-
-    @field_validator(
-        "abstract", "question", "method", "gaps", "results", "interpretation", "claims"
-    )
-    @classmethod
-    def validate_content_max_words(cls, v: str, info: Any) -> str:
-        """Validate content fields do not exceed 1000 words."""
-        return validate_max_words(v, 1000, info.field_name)
-
-    @field_validator("full_text")
-    @classmethod
-    def validate_full_text(cls, v: str) -> str:
-        """Validate full_text has minimum 1000 words."""
-        return validate_min_words(v, 1000, "full_text")
-
-    @field_validator("quotes")
-    @classmethod
-    def validate_quotes(cls, v: list[Quote]) -> list[Quote]:
-        """Validate quotes list - allow empty list for flexibility."""
-        return v
-
-    @model_validator(mode="before")
-    @classmethod
-    def set_updated_at(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Update the updated_at timestamp on any modification."""
-        values["updated_at"] = datetime.now()
-        return values
-
-    @model_validator(mode="after")
-    def validate_ai_provider_value(self) -> Book:
-        """Validate ai_provider is one of allowed values when ai_generated is True."""
-        valid_providers = {"anthropic", "openai", "google", "meta", "mistral", "other"}
-        if self.ai_generated and self.ai_provider is not None:
-            if self.ai_provider not in valid_providers:
-                raise ValueError(
-                    f"Invalid ai_provider: '{self.ai_provider}'. "
-                    f"When ai_generated=True, ai_provider must be one of: "
-                    f"{', '.join(sorted(valid_providers))}."
-                )
-        return self
-
     # =========================================================================
     # Methods
     # =========================================================================
 
-    def get_searchable_text(self) -> str:
-        """Combine all searchable content fields into one text block.
-
-        Used for BM25 full-text indexing. Combines abstract, question, method,
-        gaps, results, interpretation, claims, full_text, and quote texts.
-
-        Returns:
-            Combined text from all content fields for BM25 indexing.
-
-        Example:
-            >>> text = book.get_searchable_text()
-            >>> len(text) > 0
-            True
-        """
-        parts = [
-            self.abstract,
-            self.question,
-            self.method,
-            self.gaps,
-            self.results,
-            self.interpretation,
-            self.claims,
-            self.full_text,
-        ]
-        # Add quote texts
-        for quote in self.quotes:
-            parts.append(quote.text)
-        return "\n\n".join(parts)
-
     def to_bibtex(self) -> str:
         """Export book as bibtex @book entry.
 
@@ -974,25 +1300,29 @@ class Book(BaseModel):
             >>> bibtex.startswith("@book{")
             True
         """
-        lines = [f"@book{{{self.id},"]
-        lines.append(f"  author = {{{self.author}}},")
-        lines.append(f"  title = {{{self.title}}},")
-        lines.append(f"  year = {{{self.year}}},")
-        lines.append(f"  publisher = {{{self.publisher}}},")
-        lines.append(f"  pages = {{{self.pages}}},")
-        lines.append(f"  chapter = {{{self.chapter}}},")
-        if self.isbn:
-            lines.append(f"  isbn = {{{self.isbn}}},")
-        if self.url:
-            lines.append(f"  url = {{{self.url}}},")
-        lines.append(f"  file = {{{self.file_path_pdf}}},")
-        lines.append(f"  keywords = {{{self.keywords}}},")
-        if self.ai_generated:
-            provider = self.ai_provider or "unknown"
-            model = self.ai_model or "unknown"
-            lines.append(f"  note = {{AI-generated using {provider} {model}}},")
-        lines.append("}")
-        return "\n".join(lines)
+        isbn_line = f"  isbn = {{{self.isbn}}},\n" if self.isbn else ""
+        url_line = f"  url = {{{self.url}}},\n" if self.url else ""
+        note_line = (
+            f"  note = {{AI-generated using {self.ai_provider or 'unknown'} "
+            f"{self.ai_model or 'unknown'}}},\n"
+            if self.ai_generated
+            else ""
+        )
+        return (
+            f"@book{{{self.id},\n"
+            f"  author = {{{self.author}}},\n"
+            f"  title = {{{self.title}}},\n"
+            f"  year = {{{self.year}}},\n"
+            f"  publisher = {{{self.publisher}}},\n"
+            f"  pages = {{{self.pages}}},\n"
+            f"  chapter = {{{self.chapter}}},\n"
+            f"{isbn_line}"
+            f"{url_line}"
+            f"  file = {{{self.file_path_pdf}}},\n"
+            f"  keywords = {{{self.keywords}}},\n"
+            f"{note_line}"
+            "}"
+        )
 
 
 # =============================================================================
@@ -1000,7 +1330,7 @@ class Book(BaseModel):
 # =============================================================================
 
 
-class Media(BaseModel):
+class Media(_SearchableEntry):
     """Media entry (video, podcast, blog) with bibtex metadata and searchable content.
 
     This model represents non-traditional academic sources like YouTube videos,
@@ -1021,7 +1351,7 @@ class Media(BaseModel):
         ai_generated, ai_provider, ai_model
 
     Methods:
-        get_searchable_text(): Combine all content for BM25 indexing.
+        searchable_text: Combined content for BM25 indexing (cached).
         to_bibtex(): Export as bibtex @misc (video/podcast) or @online (blog) entry.
 
     Example:
@@ -1110,7 +1440,7 @@ class Media(BaseModel):
     # AI Generation Tracking
     # =========================================================================
     ai_generated: bool = Field(default=False, description="Whether content was AI-generated")
-    ai_provider: str | None = Field(
+    ai_provider: AIProvider | None = Field(
         default=None, description="AI service provider (if ai_generated=True)"
     )
     ai_model: str | None = Field(
@@ -1121,40 +1451,16 @@ class Media(BaseModel):
     # Metadata
     # =========================================================================
     created_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was created"
+        default_factory=_cached_now, description="Timestamp when entry was created"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.now, description="Timestamp when entry was last updated"
+        default_factory=_cached_now, description="Timestamp when entry was last updated"
     )
 
     # =========================================================================
     # Validators
     # =========================================================================
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate media ID format."""
-        return validate_id_format(v, "id")
-
-    @field_validator("author")
-    @classmethod
-    def validate_author(cls, v: str) -> str:
-        """Validate author has minimum length."""
-        return validate_min_length(v, 2, "author")
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate title has minimum length."""
-        return validate_min_length(v, 5, "title")
-
-    @field_validator("year")
-    @classmethod
-    def validate_year_field(cls, v: int) -> int:
-        """Validate year is a valid 4-digit year."""
-        return validate_year(v, "year")
-
     @field_validator("url")
     @classmethod
     def validate_url_field(cls, v: str) -> str:
@@ -1181,20 +1487,6 @@ class Media(BaseModel):
             return None
         return validate_date_format(v, "last_updated")
 
-    @field_validator("file_path_markdown")
-    @classmethod
-    def validate_file_path_markdown(cls, v: str) -> str:
-        """Validate markdown file path format."""
-        return validate_file_path(v, "file_path_markdown")
-
-    @field_validator("file_path_pdf")
-    @classmethod
-    def validate_file_path_pdf(cls, v: str) -> str:
-        """Validate PDF file path format - allow empty strings as default."""
-        if not v or v == "":
-            return ""
-        return validate_file_path(v, "file_path_pdf")
-
     @field_validator("file_path_media")
     @classmethod
     def validate_file_path_media(cls, v: str) -> str:
@@ -1203,65 +1495,24 @@ class Media(BaseModel):
             return ""
         return validate_file_path(v, "file_path_media")
 
-    @field_validator(
-        "abstract", "question", "method", "gaps", "results", "interpretation", "claims"
-    )
-    @classmethod
-    def validate_content_max_words(cls, v: str, info: Any) -> str:
-        """Validate content fields do not exceed 1000 words."""
-        return validate_max_words(v, 1000, info.field_name)
-
-    @field_validator("full_text")
-    @classmethod
-    def validate_full_text(cls, v: str) -> str:
-        """Validate full_text has minimum 1000 words."""
-        return validate_min_words(v, 1000, "full_text")
-
-    @field_validator("quotes")
-    @classmethod
-    def validate_quotes(cls, v: list[Quote]) -> list[Quote]:
-        """Validate quotes list - allow empty list for flexibility."""
-        return v
-
-    @model_validator(mode="before")
-    @classmethod
-    def set_updated_at(cls, values: dict[str, Any]) -> dict[str, Any]:
-        """Update the updated_at timestamp on any modification."""
-        values["updated_at"] = datetime.now()
-        return values
-
     # =========================================================================
     # Methods
     # =========================================================================
 
-    def get_searchable_text(self) -> str:
-        """Combine all searchable content fields into one text block.
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any], include_quotes: bool = True) -> Self:
+        """Build a media entry from stored data, skipping validation.
 
-        Used for BM25 full-text indexing. Combines abstract, question, method,
-        gaps, results, interpretation, claims, full_text, and quote texts.
+        Args:
+            data: Entry data as stored in the media registry file.
+            include_quotes: Build Quote objects; see the base class.
 
         Returns:
-            Combined text from all content fields for BM25 indexing.
-
-        Example:
-            >>> text = media.get_searchable_text()
-            >>> len(text) > 0
-            True
+            Media entry with media_type restored to a MediaType.
         """
-        parts = [
-            self.abstract,
-            self.question,
-            self.method,
-            self.gaps,
-            self.results,
-            self.interpretation,
-            self.claims,
-            self.full_text,
-        ]
-        # Add quote texts
-        for quote in self.quotes:
-            parts.append(quote.text)
-        return "\n\n".join(parts)
+        return super().from_trusted_dict(
+            {**data, "media_type": MediaType(data["media_type"])}, include_quotes
+        )
 
     def to_bibtex(self) -> str:
         """Export media as bibtex entry.
@@ -1278,29 +1529,22 @@ class Media(BaseModel):
             >>> bibtex.startswith("@misc{") or bibtex.startswith("@online{")
             True
         """
-        if self.media_type == MediaType.BLOG:
-            return self._to_bibtex_online()
-        else:
-            return self._to_bibtex_misc()
+        exporter = self._BIBTEX_EXPORTERS.get(self.media_type, Media._to_bibtex_misc)
+        return exporter(self)
 
     def _to_bibtex_misc(self) -> str:
         """Export as @misc entry for video/podcast."""
-        lines = [f"@misc{{{self.id},"]
-        lines.append(f"  author = {{{self.author}}},")
-        lines.append(f"  title = {{{self.title}}},")
-        lines.append(f"  year = {{{self.year}}},")
-
         if self.media_type == MediaType.VIDEO:
-            howpublished = "YouTube video" if self.platform.lower() == "youtube" else "Video"
-            if self.platform and self.platform.lower() != "youtube":
+            platform_lower = self.platform.lower()
+            if platform_lower == "youtube":
+                howpublished = "YouTube video"
+            elif self.platform:
                 howpublished = f"{self.platform} video"
+            else:
+                howpublished = "Video"
         else:
             howpublished = "Podcast"
 
-        lines.append(f"  howpublished = {{{howpublished}}},")
-        lines.append(f"  url = {{{self.url}}},")
-        lines.append(f"  urldate = {{{self.access_date}}},")
-
         # Build note field
         note_parts = []
         if self.media_type == MediaType.VIDEO:
@@ -1326,37 +1570,51 @@ class Media(BaseModel):
                     ai_note += f" {self.ai_model}"
             note_parts.append(ai_note)
 
-        if note_parts:
-            lines.append(f"  note = {{{', '.join(note_parts)}}},")
-
-        lines.append(f"  keywords = {{{self.keywords}}}")
-        lines.append("}")
-        return "\n".join(lines)
+        note_line = f"  note = {{{', '.join(note_parts)}}},\n" if note_parts else ""
+        return (
+            f"@misc{{{self.id},\n"
+            f"  author = {{{self.author}}},\n"
+            f"  title = {{{self.title}}},\n"
+            f"  year = {{{self.year}}},\n"
+            f"  howpublished = {{{howpublished}}},\n"
+            f"  url = {{{self.url}}},\n"
+            f"  urldate = {{{self.access_date}}},\n"
+            f"{note_line}"
+            f"  keywords = {{{self.keywords}}}\n"
+            "}"
+        )
 
     def _to_bibtex_online(self) -> str:
         """Export as @online entry for blog."""
-        lines = [f"@online{{{self.id},"]
-        lines.append(f"  author = {{{self.author}}},")
-        lines.append(f"  title = {{{self.title}}},")
-        lines.append(f"  year = {{{self.year}}},")
-        lines.append(f"  url = {{{self.url}}},")
-        lines.append(f"  urldate = {{{self.access_date}}},")
-
-        if self.website:
-            lines.append(f"  organization = {{{self.website}}},")
+        organization_line = f"  organization = {{{self.website}}},\n" if self.website else ""
 
         # Build note field for AI tracking
+        note_line = ""
         if self.ai_generated:
             ai_note = "AI-generated content"
             if self.ai_provider:
                 ai_note += f" using {self.ai_provider}"
                 if self.ai_model:
                     ai_note += f" {self.ai_model}"
-            lines.append(f"  note = {{{ai_note}}},")
+            note_line = f"  note = {{{ai_note}}},\n"
+
+        return (
+            f"@online{{{self.id},\n"
+            f"  author = {{{self.author}}},\n"
+            f"  title = {{{self.title}}},\n"
+            f"  year = {{{self.year}}},\n"
+            f"  url = {{{self.url}}},\n"
+            f"  urldate = {{{self.access_date}}},\n"
+            f"{organization_line}"
+            f"{note_line}"
+            f"  keywords = {{{self.keywords}}}\n"
+            "}"
+        )
 
-        lines.append(f"  keywords = {{{self.keywords}}}")
-        lines.append("}")
-        return "\n".join(lines)
+    # Bibtex exporter per media type; anything not listed exports as @misc
+    _BIBTEX_EXPORTERS: ClassVar[dict[MediaType, Callable[[Media], str]]] = {
+        MediaType.BLOG: _to_bibtex_online,
+    }
 
 
 # =============================================================================
@@ -1364,7 +1622,7 @@ class Media(BaseModel):
 # =============================================================================
 
 # Paper field lists
-PAPER_BIBTEX_FIELDS = [
+PAPER_BIBTEX_FIELDS = (
     "author",
     "title",
     "year",
@@ -1384,9 +1642,9 @@ PAPER_BIBTEX_FIELDS = [
     "ai_generated",
     "ai_provider",
     "ai_model",
-]
+)
 
-PAPER_CONTENT_FIELDS = [
+PAPER_CONTENT_FIELDS = (
     "abstract",
     "question",
     "method",
@@ -1395,12 +1653,13 @@ PAPER_CONTENT_FIELDS = [
     "interpretation",
     "claims",
     "full_text",
-]
+)
 
-PAPER_ALL_FIELDS = PAPER_BIBTEX_FIELDS + PAPER_CONTENT_FIELDS
+PAPER_ALL_FIELDS = (*PAPER_BIBTEX_FIELDS, *PAPER_CONTENT_FIELDS)
+PAPER_ALL_FIELDS_SET = frozenset(PAPER_ALL_FIELDS)
 
 # Book field lists
-BOOK_BIBTEX_FIELDS = [
+BOOK_BIBTEX_FIELDS = (
     "author",
     "title",
     "year",
@@ -1415,9 +1674,9 @@ BOOK_BIBTEX_FIELDS = [
     "ai_generated",
     "ai_provider",
     "ai_model",
-]
+)
 
-BOOK_CONTENT_FIELDS = [
+BOOK_CONTENT_FIELDS = (
     "abstract",
     "question",
     "method",
@@ -1426,12 +1685,13 @@ BOOK_CONTENT_FIELDS = [
     "interpretation",
     "claims",
     "full_text",
-]
+)
 
-BOOK_ALL_FIELDS = BOOK_BIBTEX_FIELDS + BOOK_CONTENT_FIELDS
+BOOK_ALL_FIELDS = (*BOOK_BIBTEX_FIELDS, *BOOK_CONTENT_FIELDS)
+BOOK_ALL_FIELDS_SET = frozenset(BOOK_ALL_FIELDS)
 
 # Media field lists
-MEDIA_BIBTEX_FIELDS = [
+MEDIA_BIBTEX_FIELDS = (
     "media_type",
     "author",
     "title",
@@ -1457,9 +1717,9 @@ MEDIA_BIBTEX_FIELDS = [
     "ai_generated",
     "ai_provider",
     "ai_model",
-]
+)
 
-MEDIA_CONTENT_FIELDS = [
+MEDIA_CONTENT_FIELDS = (
     "abstract",
     "question",
     "method",
@@ -1468,14 +1728,16 @@ MEDIA_CONTENT_FIELDS = [
     "interpretation",
     "claims",
     "full_text",
-]
+)
 
-MEDIA_ALL_FIELDS = MEDIA_BIBTEX_FIELDS + MEDIA_CONTENT_FIELDS
+MEDIA_ALL_FIELDS = (*MEDIA_BIBTEX_FIELDS, *MEDIA_CONTENT_FIELDS)
+MEDIA_ALL_FIELDS_SET = frozenset(MEDIA_ALL_FIELDS)
 
 # Legacy aliases for backward compatibility
 BIBTEX_FIELDS = PAPER_BIBTEX_FIELDS
 CONTENT_FIELDS = PAPER_CONTENT_FIELDS
 ALL_FIELDS = PAPER_ALL_FIELDS
+ALL_FIELDS_SET = PAPER_ALL_FIELDS_SET
 
 
 # =============================================================================
@@ -1496,6 +1758,7 @@ class VectorIndexMetadata(BaseModel):
         dimensions: Vector dimensions (model-dependent).
         chunk_size: Number of words per chunk.
         chunk_overlap: Overlap words between chunks.
+        quantization: Storage format of the indexed vectors.
         chunk_count: Total chunks in the index.
         total_tokens: Total tokens processed.
         estimated_cost_usd: Estimated embedding cost.
@@ -1510,11 +1773,16 @@ class VectorIndexMetadata(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Unique index name (e.g., 'nova-1024', 'titan-v2')")
     embedding_model: str = Field(description="AWS Bedrock model ID for embeddings")
     dimensions: int = Field(description="Vector dimensions for this index")
     chunk_size: int = Field(default=300, description="Number of words per chunk")
     chunk_overlap: int = Field(default=50, description="Overlap words between chunks")
+    quantization: VectorQuantization = Field(
+        default="fp32", description="Vector storage format: fp32, fp16 or int8"
+    )
     chunk_count: int = Field(default=0, description="Total number of chunks in index")
     total_tokens: int = Field(default=0, description="Total tokens processed")
     estimated_cost_usd: float = Field(default=0.0, description="Estimated embedding cost in USD")
@@ -1527,8 +1795,7 @@ class VectorIndexMetadata(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate index name format (alphanumeric, hyphens, underscores)."""
-        pattern = r"^[a-z0-9][a-z0-9_-]*$"
-        if not re.match(pattern, v):
+        if not _patterns().name.match(v):
             raise ValueError(
                 f"Invalid index name: '{v}'. "
                 f"Name must start with letter/digit and contain only "
@@ -1563,6 +1830,8 @@ class Settings(BaseModel):
         >>> settings = Settings(default_vector_index="nova-1024")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     default_vector_index: str | None = Field(
         default=None, description="Default vector index for semantic search"
     )
@@ -11,7 +11,16 @@ Classes:
     CombinedSearcher: BM25 search across both papers and books.
 
 Functions:
+    get_stemmer: Get the per-thread shared English stemmer.
+    select_backend: Select the bm25s retrieval backend by corpus size.
+    warm_numba_backend: JIT-compile the numba retrieval kernels once.
+    score_single_document: BM25 score of a query against one document.
+    tokenize_corpus: Tokenize many documents, in worker processes when large.
     extract_fragments: Extract text fragments containing query terms.
+    get_paper_searcher: Get the process-wide PaperSearcher.
+    get_book_searcher: Get the process-wide BookSearcher.
+    get_media_searcher: Get the process-wide MediaSearcher.
+    clear_searcher_cache: Drop the process-wide searchers.
     ensure_index_current: Ensure the paper BM25 index is up to date.
     ensure_all_indices_current: Ensure both paper and book indices are up to date.
 
@@ -23,13 +32,31 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import hashlib
+import heapq
+import importlib.util
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
-from enum import Enum
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import bm25s  # type: ignore[import-untyped]
 import Stemmer  # type: ignore[import-not-found]
+from bm25s.stopwords import STOPWORDS_EN  # type: ignore[import-untyped]
 
 from paper_index_tool.logging_config import get_logger
 from paper_index_tool.models import Book, Media, Paper
@@ -37,13 +64,127 @@ from paper_index_tool.storage import BookRegistry, MediaRegistry, PaperRegistry,
 
 logger = get_logger(__name__)
 
+# Digest of the indexed content, stored beside each cached single-entry index
+_CONTENT_DIGEST_FILE = "content.digest"
+# Token -> occurrence count of one entry, the whole single-entry index
+_TERM_COUNTS_FILE = "term_counts.json"
+
+# BM25 term saturation of the bm25s default (Lucene) scoring used by the indices
+_BM25_K1 = 1.5
+# Lucene idf for a one-document corpus in which the term occurs: ln(1 + 0.5 / 1.5)
+_SINGLE_DOC_IDF = math.log(1 + 0.5 / 1.5)
+
+# Sort key for merging results by relevance (C-level, no per-item lambda call)
+_SCORE_KEY = attrgetter("score")
+
+# English stopwords resolved once instead of per tokenize call
+STOPWORDS: tuple[str, ...] = tuple(STOPWORDS_EN)
+
+# Corpus size from which the optional numba backend is used for retrieval
+NUMBA_MIN_DOCS = 1000
+
+# Number of texts from which index rebuilds tokenize in worker processes.
+# Workers are started with forkserver/spawn and re-import bm25s, numpy and
+# PyStemmer, which costs more than tokenizing a few hundred entries serially.
+PARALLEL_TOKENIZE_MIN_DOCS = 2048
+
+# Per-searcher cache of recent search results: entry count and lifetime
+_RESULT_CACHE_SIZE = 128
+_RESULT_CACHE_TTL_SECONDS = 60.0
+
+# PyStemmer instances keep internal state and must not be shared across threads
+_thread_local = threading.local()
+
+# Guards creation of the shared tokenizer process pool
+_tokenize_pool_lock = threading.Lock()
+
+
+def get_stemmer() -> Stemmer.Stemmer:
+    """Get the English stemmer for the current thread.
+
+    Stemmers are created once per thread and reused for every tokenize call
+    made from that thread.
+
+    Returns:
+        PyStemmer English stemmer instance.
+    """
+    stemmer = getattr(_thread_local, "stemmer", None)
+    if stemmer is None:
+        stemmer = _thread_local.stemmer = Stemmer.Stemmer("english")
+    return stemmer
+
+
+def tokenize_text(text: str) -> list[str]:
+    """Tokenize text the way entries are indexed.
+
+    Args:
+        text: Text to tokenize (e.g., an entry's searchable text).
+
+    Returns:
+        Stemmed, stopword-filtered token strings in document order.
+    """
+    return _tokenize_batch([text])[0]
+
+
+def _tokenize_batch(texts: list[str]) -> list[list[str]]:
+    """Tokenize texts to token strings; the worker function of tokenize_corpus."""
+    tokens: list[list[str]] = bm25s.tokenize(
+        texts,
+        stopwords=STOPWORDS,
+        stemmer=get_stemmer(),
+        return_ids=False,
+        show_progress=False,
+    )
+    return tokens
+
+
+@lru_cache(maxsize=1)
+def _tokenize_pool() -> ProcessPoolExecutor:
+    """Get the worker process pool shared by all tokenize_corpus calls.
+
+    Paper, book and media indices are rebuilt on concurrent threads by
+    ``reindex``; one pool keeps them within one process per CPU core and
+    lets later rebuilds reuse workers that already imported bm25s.
+    """
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def tokenize_corpus(texts: list[str]) -> list[list[str]]:
+    """Tokenize many documents, spreading large corpora over CPU cores.
+
+    Corpora of PARALLEL_TOKENIZE_MIN_DOCS texts or more are split into
+    chunks that the shared worker process pool tokenizes concurrently;
+    stemming and splitting hold the GIL, so threads would not help. Token
+    strings need no vocabulary merge, so the chunk results are simply
+    concatenated.
+
+    Args:
+        texts: Document texts to tokenize.
+
+    Returns:
+        Stemmed, stopword-filtered token strings per text, in input order.
+    """
+    workers = os.cpu_count() or 1
+    if len(texts) < PARALLEL_TOKENIZE_MIN_DOCS or workers < 2:
+        tokens: list[list[str]] = bm25s.tokenize(
+            texts, stopwords=STOPWORDS, stemmer=get_stemmer(), return_ids=False
+        )
+        return tokens
+
+    # A few chunks per worker keeps the workers busy when text sizes vary
+    size = -(-len(texts) // (workers * 4))
+    chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+    with _tokenize_pool_lock:
+        pool = _tokenize_pool()
+    return list(chain.from_iterable(pool.map(_tokenize_batch, chunks)))
+
 
 # =============================================================================
 # Entry Type Enum
 # =============================================================================
 
 
-class EntryType(str, Enum):
+class EntryType(StrEnum):
     """Entry type enumeration for search results.
 
     Distinguishes between papers, books, and media in search results,
@@ -107,6 +248,8 @@ class SearchResult:
         book: Book | None = None,
         media: Media | None = None,
         fragments: list[dict[str, Any]] | None = None,
+        fragment_terms: list[str] | None = None,
+        context_lines: int = 3,
     ) -> None:
         """Initialize a search result.
 
@@ -119,6 +262,9 @@ class SearchResult:
             book: Book object if entry_type is BOOK.
             media: Media object if entry_type is MEDIA.
             fragments: List of extracted text fragments.
+            fragment_terms: Query terms to extract fragments for on first
+                access of ``fragments``, when no fragments are given.
+            context_lines: Context lines around matches for lazy extraction.
         """
         self.entry_id = entry_id
         self.score = score
@@ -127,7 +273,34 @@ class SearchResult:
         self.paper = paper
         self.book = book
         self.media = media
-        self.fragments = fragments or []
+        self._fragments = fragments
+        self._fragment_terms = fragment_terms
+        self._context_lines = context_lines
+
+    @property
+    def fragments(self) -> list[dict[str, Any]]:
+        """Get the text fragments matching the query.
+
+        Fragments requested via ``fragment_terms`` are extracted on first
+        access, so results that are never displayed never scan their content.
+
+        Returns:
+            List of fragment dictionaries (see extract_fragments).
+        """
+        if self._fragments is None:
+            self._fragments = (
+                extract_fragments(
+                    self.content, self._fragment_terms, self._context_lines, max_fragments=3
+                )
+                if self._fragment_terms
+                else []
+            )
+        return self._fragments
+
+    @fragments.setter
+    def fragments(self, value: list[dict[str, Any]]) -> None:
+        """Replace the fragments with precomputed ones."""
+        self._fragments = value
 
     @property
     def paper_id(self) -> str:
@@ -156,11 +329,111 @@ class SearchResult:
         return self.media
 
 
+def select_backend(num_docs: int) -> str:
+    """Select the bm25s retrieval backend for a corpus of the given size.
+
+    The numba backend (installed via the ``fast`` extra) JIT-compiles top-k
+    scoring and pays off on larger corpora; small corpora stay on numpy to
+    avoid the compile cost.
+
+    Args:
+        num_docs: Number of documents in the corpus.
+
+    Returns:
+        "numba" if available and the corpus is large enough, otherwise "numpy".
+    """
+    if num_docs >= NUMBA_MIN_DOCS and importlib.util.find_spec("numba") is not None:
+        return "numba"
+    return "numpy"
+
+
+# Set once the numba retrieval kernels have been JIT-compiled in this process
+_numba_warmed = False
+
+
+def warm_numba_backend(retriever: bm25s.BM25, sample_tokens: list[str]) -> None:
+    """JIT-compile the numba retrieval kernels with one throwaway query.
+
+    Numba compiles on first call; compiled kernels are shared by every
+    retriever in the process. Warming right after an index rebuild moves
+    that cost off the first user query. Does nothing for numpy-backed
+    retrievers or once the kernels are warm.
+
+    Args:
+        retriever: A freshly indexed retriever.
+        sample_tokens: Tokens of any indexed document to query with.
+    """
+    global _numba_warmed
+    if _numba_warmed or retriever.backend != "numba" or not sample_tokens:
+        return
+    retriever.retrieve([sample_tokens[:1]], k=1, show_progress=False)
+    _numba_warmed = True
+
+
+def score_single_document(query_tokens: list[str], term_counts: Mapping[str, int]) -> float:
+    """Score a query against one document as a one-document BM25 index would.
+
+    With a single document, every matching term has the same idf and the
+    document length equals the average length, so the bm25s Lucene score
+    reduces to a term-frequency sum. This gives the same score as indexing
+    the document with ``bm25s.BM25()`` and retrieving, without building
+    the index.
+
+    Args:
+        query_tokens: Stemmed, stopword-filtered query tokens (see tokenize_text).
+        term_counts: Occurrence count per token of the document.
+
+    Returns:
+        BM25 score; 0.0 when no query token occurs in the document.
+
+    Example:
+        >>> counts = Counter(chapter.searchable_tokens)
+        >>> score_single_document(tokenize_text("leadership"), counts)
+        0.2855...
+    """
+    total = 0.0
+    for token in query_tokens:
+        tf = term_counts.get(token, 0)
+        if tf:
+            total += tf / (tf + _BM25_K1)
+    return _SINGLE_DOC_IDF * total
+
+
+# =============================================================================
+# Content Digest
+# =============================================================================
+
+
+def _content_digest(content: str) -> str:
+    """Compute a short digest of searchable content for cache validation.
+
+    Args:
+        content: Searchable text of an entry.
+
+    Returns:
+        Hex digest string.
+    """
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
 # =============================================================================
 # Fragment Extraction
 # =============================================================================
 
 
+@lru_cache(maxsize=128)
+def _compile_terms_pattern(query_terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile query terms into one case-insensitive alternation pattern.
+
+    Args:
+        query_terms: Query terms to match literally.
+
+    Returns:
+        Compiled pattern matching any of the terms.
+    """
+    return re.compile("|".join(map(re.escape, query_terms)), re.IGNORECASE)
+
+
 def extract_fragments(
     content: str,
     query_terms: list[str],
@@ -195,40 +468,44 @@ def extract_fragments(
     if not content or not query_terms:
         return []
 
-    lines = content.splitlines()
-    if not lines:
+    # Split once, keeping line endings: the cumulative lengths give each
+    # line's end offset, and terminators are stripped only for the lines
+    # that end up in a fragment
+    raw_lines = content.splitlines(keepends=True)
+    if not raw_lines:
         return []
-
-    # Find all lines containing any query term
-    matched_lines = set()
-    query_terms_lower = [term.lower() for term in query_terms]
-
-    for line_idx, line in enumerate(lines):
-        line_lower = line.lower()
-        for term in query_terms_lower:
-            if term in line_lower:
-                matched_lines.add(line_idx)
-                break
-
-    if not matched_lines:
+    line_ends = list(accumulate(map(len, raw_lines)))
+    last_line = len(raw_lines) - 1
+
+    # Find all lines containing any query term: one pass of a single compiled
+    # alternation over the whole text, jumping to the next line after a hit.
+    # Matches arrive in offset order, so each bisect starts at the last hit.
+    pattern = _compile_terms_pattern(tuple(query_terms))
+    sorted_matches: list[int] = []
+    line_idx = 0
+    match = pattern.search(content)
+    while match is not None:
+        line_idx = bisect_right(line_ends, match.start(), line_idx)
+        sorted_matches.append(line_idx)
+        if line_idx >= last_line:
+            break
+        match = pattern.search(content, line_ends[line_idx])
+
+    if not sorted_matches:
         return []
 
-    # Sort matched lines
-    sorted_matches = sorted(matched_lines)
-
-    # Build fragments with context, merging overlapping ranges
+    # Build fragment ranges with context, merging overlapping ranges
     fragments: list[dict[str, Any]] = []
     current_fragment: dict[str, Any] | None = None
 
     for match_idx in sorted_matches:
         start = max(0, match_idx - context_lines)
-        end = min(len(lines) - 1, match_idx + context_lines)
+        end = min(last_line, match_idx + context_lines)
 
         if current_fragment is None:
             current_fragment = {
                 "line_start": start + 1,
                 "line_end": end + 1,
-                "lines": lines[start : end + 1],
                 "matched_line_numbers": [match_idx + 1],
             }
         else:
@@ -236,9 +513,7 @@ def extract_fragments(
 
             if start <= current_end + 1:
                 # Overlapping - extend
-                new_end = max(current_end, end)
-                current_fragment["line_end"] = new_end + 1
-                current_fragment["lines"] = lines[current_fragment["line_start"] - 1 : new_end + 1]
+                current_fragment["line_end"] = max(current_end, end) + 1
                 current_fragment["matched_line_numbers"].append(match_idx + 1)
             else:
                 fragments.append(current_fragment)
@@ -247,14 +522,25 @@ def extract_fragments(
                 current_fragment = {
                     "line_start": start + 1,
                     "line_end": end + 1,
-                    "lines": lines[start : end + 1],
                     "matched_line_numbers": [match_idx + 1],
                 }
 
     if current_fragment and len(fragments) < max_fragments:
         fragments.append(current_fragment)
 
-    return fragments
+    # Materialize each fragment's text once its final range is known
+    return [
+        {
+            "line_start": fragment["line_start"],
+            "line_end": fragment["line_end"],
+            "lines": [
+                line.splitlines()[0]
+                for line in raw_lines[fragment["line_start"] - 1 : fragment["line_end"]]
+            ],
+            "matched_line_numbers": fragment["matched_line_numbers"],
+        }
+        for fragment in fragments
+    ]
 
 
 # =============================================================================
@@ -290,15 +576,33 @@ class BaseSearcher(ABC):
         search: Search entries using BM25.
     """
 
+    # Loaded indices shared by all searchers in the process, keyed on index
+    # path: (params file mtime_ns at load, retriever, corpus)
+    _INDEX_CACHE: ClassVar[dict[Path, tuple[int, bm25s.BM25, Sequence[dict[str, str]]]]] = {}
+
     def __init__(self) -> None:
         """Initialize the base searcher.
 
-        Sets up the BM25 stemmer and initializes cache variables.
-        The index path is derived from the index_subdir property.
+        Initializes cache variables. The index path is derived from the
+        index_subdir property.
         """
-        self.stemmer = Stemmer.Stemmer("english")
         self._retriever: bm25s.BM25 | None = None
-        self._corpus: list[dict[str, str]] | None = None
+        self._corpus: Sequence[dict[str, str]] | None = None
+        # (query, entry_id, top_k, fragments, context, data version)
+        #     -> (monotonic time, results)
+        self._result_cache: OrderedDict[
+            tuple[str, str | None, int, bool, int, tuple[int, ...]],
+            tuple[float, list[SearchResult]],
+        ] = OrderedDict()
+
+    @property
+    def stemmer(self) -> Stemmer.Stemmer:
+        """Get the shared English stemmer for the calling thread.
+
+        Returns:
+            PyStemmer English stemmer instance.
+        """
+        return get_stemmer()
 
     @property
     @abstractmethod
@@ -348,7 +652,8 @@ class BaseSearcher(ABC):
         score: float,
         content: str,
         entry: Paper | Book | Media | None,
-        fragments: list[dict[str, Any]],
+        fragment_terms: list[str] | None,
+        context_lines: int,
     ) -> SearchResult:
         """Create a SearchResult for an entry.
 
@@ -357,7 +662,8 @@ class BaseSearcher(ABC):
             score: BM25 relevance score.
             content: Matched content.
             entry: Paper, Book, or Media object.
-            fragments: Extracted text fragments.
+            fragment_terms: Query terms for lazy fragment extraction, or None.
+            context_lines: Context lines around matches in fragments.
 
         Returns:
             SearchResult with appropriate entry_type and entry object.
@@ -389,7 +695,10 @@ class BaseSearcher(ABC):
 
         Retrieves all entries from the registry, extracts their searchable
         text, tokenizes with stemming, and builds a new BM25 index.
-        The index is saved to disk for later retrieval.
+        The index is saved to disk for later retrieval, together with the
+        term counts of each entry; entries whose content is unchanged since
+        their counts were cached are not tokenized again, and the cached
+        counts of entries no longer in the registry are removed.
 
         Returns:
             Number of entries indexed.
@@ -402,7 +711,8 @@ class BaseSearcher(ABC):
         logger.info("Rebuilding BM25 index for %ss", self.entry_type.value)
 
         registry = self._get_registry()
-        entries = registry.list_entries()
+        entries = registry.list_entries(trusted=True)
+        self._prune_entry_term_counts({entry.id for entry in entries})
         if not entries:
             logger.warning("No %ss to index", self.entry_type.value)
             return 0
@@ -410,7 +720,7 @@ class BaseSearcher(ABC):
         # Build corpus
         corpus = []
         for entry in entries:
-            text = entry.get_searchable_text()
+            text = entry.searchable_text
             if text:
                 corpus.append(
                     {
@@ -423,28 +733,69 @@ class BaseSearcher(ABC):
             logger.warning("No searchable content found")
             return 0
 
-        # Tokenize
-        texts = [doc["content"] for doc in corpus]
-        corpus_tokens = bm25s.tokenize(texts, stopwords="en", stemmer=self.stemmer)
-
-        # Create index
-        retriever = bm25s.BM25()
+        # Tokenize only entries whose content changed since their term counts
+        # were cached. BM25 depends on term frequencies alone, so the bag of
+        # tokens rebuilt from cached counts indexes like the original stream.
+        digests = [_content_digest(doc["content"]) for doc in corpus]
+        corpus_tokens: list[list[str]] = []
+        stale: list[int] = []
+        for i, (doc, digest) in enumerate(zip(corpus, digests, strict=True)):
+            counts = self._read_entry_term_counts(doc["id"], digest)
+            if counts is None:
+                stale.append(i)
+                corpus_tokens.append([])
+            else:
+                corpus_tokens.append(list(Counter(counts).elements()))
+
+        if stale:
+            # Token strings, so the per-entry term counts can be cached from them
+            stale_tokens = tokenize_corpus([corpus[i]["content"] for i in stale])
+            for i, tokens in zip(stale, stale_tokens, strict=True):
+                corpus_tokens[i] = tokens
+                # Single-entry queries then only tokenize the query
+                self._save_entry_term_counts(corpus[i]["id"], digests[i], tokens)
+        logger.debug("Tokenized %d of %d entries", len(stale), len(corpus))
+
+        # Create index (the backend is persisted with the index parameters)
+        retriever = bm25s.BM25(backend=select_backend(len(corpus)))
         retriever.index(corpus_tokens)
 
         # Save
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
         retriever.save(str(self.index_path), corpus=corpus)
+        # Any document with tokens will do; an empty one would skip warming
+        warm_numba_backend(retriever, next((t for t in corpus_tokens if t), []))
 
         logger.info("Indexed %d %ss", len(corpus), self.entry_type.value)
         self._retriever = None  # Clear cache
         self._corpus = None
+        self._result_cache.clear()
+        BaseSearcher._INDEX_CACHE.pop(self.index_path, None)
         return len(corpus)
 
-    def _load_index(self) -> tuple[bm25s.BM25, list[dict[str, str]]]:
+    def clear_index(self) -> None:
+        """Remove the BM25 index and all cached per-entry term counts.
+
+        Example:
+            >>> get_paper_searcher().clear_index()
+        """
+        for path in (self.index_path, self._entry_term_counts_dir()):
+            if path.exists():
+                shutil.rmtree(path)
+                logger.info("Cleared %s search data at %s", self.entry_type.value, path)
+        self._retriever = None
+        self._corpus = None
+        self._result_cache.clear()
+        BaseSearcher._INDEX_CACHE.pop(self.index_path, None)
+
+    def _load_index(self) -> tuple[bm25s.BM25, Sequence[dict[str, str]]]:
         """Load the BM25 index from disk.
 
-        Loads the saved BM25 index and corpus from disk. Uses memory
-        mapping for efficient access to large indices.
+        Loads the saved BM25 index from disk and opens the corpus as a
+        memory-mapped JSON Lines file; documents are parsed on access.
+        Loaded indices are shared with every other searcher for the same
+        index path until the index on disk changes; the check costs one
+        stat() per call.
 
         Returns:
             Tuple of (retriever, corpus).
@@ -452,21 +803,52 @@ class BaseSearcher(ABC):
         Raises:
             ValueError: If index not found or failed to load.
         """
-        if self._retriever is not None and self._corpus is not None:
-            return self._retriever, self._corpus
-
         if not self.index_path.exists():
             raise ValueError(
                 f"Index not found for {self.entry_type.value}s. Run rebuild_index() first."
             )
 
+        # Reuse the index this or another searcher loaded, unless it was
+        # rebuilt since (searchers are long-lived, see get_paper_searcher)
+        version = self._index_version()
+        cached = BaseSearcher._INDEX_CACHE.get(self.index_path)
+        if cached is not None and cached[0] == version:
+            _, self._retriever, self._corpus = cached
+            return self._retriever, self._corpus
+
         try:
             self._retriever = bm25s.BM25.load(str(self.index_path), load_corpus=True, mmap=True)
+            # The memory-mapped corpus reads documents on access, so only
+            # the top-k hits of a query are ever parsed
             corpus_data = self._retriever.corpus
-            self._corpus = list(corpus_data) if corpus_data is not None else []
-            return self._retriever, self._corpus
+            self._corpus = corpus_data if corpus_data is not None else []
         except Exception as e:
             raise ValueError(f"Failed to load index: {e}")
+        BaseSearcher._INDEX_CACHE[self.index_path] = (version, self._retriever, self._corpus)
+        return self._retriever, self._corpus
+
+    def _index_version(self) -> int:
+        """Get the version stamp of the BM25 index on disk.
+
+        Returns:
+            mtime_ns of the index parameters file, or -1 if it is missing.
+        """
+        try:
+            return (self.index_path / "params.index.json").stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    def _registry_version(self) -> tuple[int, int]:
+        """Get the version stamp of the registry file.
+
+        Returns:
+            (mtime_ns, size) of the registry file, or (-1, -1) if it is missing.
+        """
+        try:
+            stat = self._get_registry().registry_path.stat()
+        except OSError:
+            return (-1, -1)
+        return (stat.st_mtime_ns, stat.st_size)
 
     def search(
         self,
@@ -480,7 +862,8 @@ class BaseSearcher(ABC):
 
         Performs BM25 full-text search across all entries or within a
         single entry. Optionally extracts matching text fragments with
-        surrounding context.
+        surrounding context. Identical searches within a minute return the
+        cached results unless the registry (single entry) or index changed.
 
         Args:
             query: Search query string.
@@ -500,9 +883,70 @@ class BaseSearcher(ABC):
         """
         logger.info("Searching %ss for: %s", self.entry_type.value, query)
 
+        # Repeated identical searches within the TTL reuse the earlier results,
+        # as long as the data they were computed from is unchanged: results
+        # hold registry entries, and index searches also depend on the index
+        version = (*self._registry_version(), -1 if entry_id else self._index_version())
+        key = (query, entry_id, top_k, extract_fragments_flag, context_lines, version)
+        now = time.monotonic()
+        cached = self._result_cache.get(key)
+        if cached is not None and now - cached[0] < _RESULT_CACHE_TTL_SECONDS:
+            self._result_cache.move_to_end(key)
+            logger.debug("Returning cached results for: %s", query)
+            return list(cached[1])
+
         # For single entry search, we can do it directly without the full index
         if entry_id:
-            return self._search_single_entry(query, entry_id, extract_fragments_flag, context_lines)
+            results = self._search_single_entry(
+                query, entry_id, extract_fragments_flag, context_lines
+            )
+        else:
+            results = self.search_many([query], top_k, extract_fragments_flag, context_lines)[0]
+
+        self._result_cache[key] = (now, results)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return list(results)
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        extract_fragments_flag: bool = False,
+        context_lines: int = 3,
+    ) -> list[list[SearchResult]]:
+        """Search all entries for several queries with one retrieval call.
+
+        Queries are tokenized together and scored in a single batched
+        ``retrieve`` call, so the index is loaded once and the per-query
+        Python overhead of separate ``search`` calls is avoided.
+
+        Args:
+            queries: Search query strings.
+            top_k: Number of results to return per query.
+            extract_fragments_flag: If True, extract matching text fragments.
+            context_lines: Context lines around matches in fragments.
+
+        Returns:
+            One list of SearchResult objects per query, in query order,
+            each sorted by relevance score.
+
+        Example:
+            >>> searcher = PaperSearcher()
+            >>> per_query = searcher.search_many(["leadership", "identity work"], top_k=3)
+            >>> [len(results) for results in per_query]
+            [3, 2]
+        """
+        results: list[list[SearchResult]] = [[] for _ in queries]
+
+        # Tokenize queries; a query of only stopwords cannot match anything
+        query_tokens = bm25s.tokenize(
+            queries, stopwords=STOPWORDS, stemmer=self.stemmer, return_ids=False
+        )
+        active = [i for i, tokens in enumerate(query_tokens) if tokens]
+        if not active:
+            return results
 
         # Search all entries via index
         try:
@@ -511,54 +955,159 @@ class BaseSearcher(ABC):
             # Try to rebuild index
             count = self.rebuild_index()
             if count == 0:
-                return []
+                return results
             retriever, corpus = self._load_index()
 
-        # Tokenize query
-        query_tokens = bm25s.tokenize([query], stopwords="en", stemmer=self.stemmer)
+        # Skip queries none of whose terms occur in any indexed entry (every
+        # vocabulary term has a document frequency of at least one)
+        vocab = retriever.vocab_dict
+        active = [i for i in active if any(token in vocab for token in query_tokens[i])]
+        if not active:
+            return results
 
         # Search
         actual_k = min(top_k, len(corpus))
         if actual_k == 0:
-            return []
+            return results
 
-        results_array, scores_array = retriever.retrieve(query_tokens, k=actual_k)
+        results_array, scores_array = retriever.retrieve(
+            [query_tokens[i] for i in active], k=actual_k, show_progress=False
+        )
 
         # Build results
-        results: list[SearchResult] = []
-        query_terms = query.split()
-
-        for i in range(results_array.shape[1]):
-            doc = results_array[0, i]
-            score = float(scores_array[0, i])
-
-            if score <= 0:
-                continue
-
-            doc_id = doc["id"]
-            content = doc["content"]
-
-            # Get full entry
-            entry = self._get_entry(doc_id)
-
-            # Extract fragments if requested
-            fragments: list[dict[str, Any]] = []
-            if extract_fragments_flag:
-                fragments = extract_fragments(content, query_terms, context_lines, max_fragments=3)
-
-            results.append(
-                self._create_result(
-                    entry_id=doc_id,
-                    score=score,
-                    content=content,
-                    entry=entry,
-                    fragments=fragments,
+        for row, query_index in enumerate(active):
+            # Fragments are extracted lazily, only for results whose
+            # fragments are actually read
+            fragment_terms = queries[query_index].split() if extract_fragments_flag else None
+            query_results = results[query_index]
+            for i in range(results_array.shape[1]):
+                doc = results_array[row, i]
+                score = float(scores_array[row, i])
+
+                if score <= 0:
+                    continue
+
+                doc_id = doc["id"]
+                content = doc["content"]
+
+                # Get full entry
+                entry = self._get_entry(doc_id)
+
+                query_results.append(
+                    self._create_result(
+                        entry_id=doc_id,
+                        score=score,
+                        content=content,
+                        entry=entry,
+                        fragment_terms=fragment_terms,
+                        context_lines=context_lines,
+                    )
                 )
-            )
 
-        logger.info("Found %d results", len(results))
+        logger.info("Found %s results", [len(r) for r in results])
         return results
 
+    def _entry_term_counts_dir(self) -> Path:
+        """Get the directory holding the per-entry term count caches.
+
+        Returns:
+            Path to the directory (e.g., bm25s/entries/books).
+        """
+        return get_bm25_index_dir() / "entries" / self.index_subdir
+
+    def _single_entry_index_path(self, entry_id: str) -> Path:
+        """Get path to the cached single-entry BM25 index.
+
+        Args:
+            entry_id: Entry ID the index belongs to.
+
+        Returns:
+            Path to the index directory (e.g., bm25s/entries/books/<id>).
+        """
+        return self._entry_term_counts_dir() / entry_id
+
+    def _prune_entry_term_counts(self, entry_ids: set[str]) -> None:
+        """Remove cached term counts of entries that were deleted or renamed.
+
+        Args:
+            entry_ids: IDs of the entries currently in the registry.
+        """
+        entries_dir = self._entry_term_counts_dir()
+        if not entries_dir.is_dir():
+            return
+        for path in entries_dir.iterdir():
+            if path.name not in entry_ids:
+                shutil.rmtree(path, ignore_errors=True)
+                logger.debug("Removed cached term counts of '%s'", path.name)
+
+    def _load_entry_term_counts(self, entry_id: str, content: str) -> dict[str, int]:
+        """Load the cached term counts of one entry, rebuilding them when stale.
+
+        The counts are keyed by a digest of the entry's searchable text, so
+        any change to the entry's content invalidates them. Repeated queries
+        against the same entry only tokenize the query.
+
+        Args:
+            entry_id: Entry ID the content belongs to.
+            content: Searchable text of the entry.
+
+        Returns:
+            Occurrence count per token of the entry content.
+        """
+        digest = _content_digest(content)
+        counts = self._read_entry_term_counts(entry_id, digest)
+        if counts is not None:
+            return counts
+        return self._save_entry_term_counts(entry_id, digest, tokenize_text(content))
+
+    def _read_entry_term_counts(self, entry_id: str, digest: str) -> dict[str, int] | None:
+        """Read the cached term counts of one entry if they match the digest.
+
+        Args:
+            entry_id: Entry ID the counts belong to.
+            digest: Digest of the entry's current searchable text.
+
+        Returns:
+            Occurrence count per token, or None if missing or stale.
+        """
+        cache_path = self._single_entry_index_path(entry_id)
+        digest_path = cache_path / _CONTENT_DIGEST_FILE
+        if not digest_path.exists() or digest_path.read_text() != digest:
+            return None
+        try:
+            counts: dict[str, int] = json.loads(
+                (cache_path / _TERM_COUNTS_FILE).read_text(encoding="utf-8")
+            )
+            return counts
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load cached index for '%s': %s", entry_id, e)
+            return None
+
+    def _save_entry_term_counts(
+        self, entry_id: str, digest: str, tokens: list[str]
+    ) -> dict[str, int]:
+        """Count one entry's tokens and persist the counts with its digest.
+
+        Args:
+            entry_id: Entry ID the tokens belong to.
+            digest: Content digest used to validate the cache.
+            tokens: Stemmed, stopword-filtered tokens of the entry content.
+
+        Returns:
+            Occurrence count per token.
+        """
+        counts = dict(Counter(tokens))
+
+        cache_path = self._single_entry_index_path(entry_id)
+        try:
+            cache_path.mkdir(parents=True, exist_ok=True)
+            (cache_path / _TERM_COUNTS_FILE).write_text(json.dumps(counts), encoding="utf-8")
+            (cache_path / _CONTENT_DIGEST_FILE).write_text(digest)
+        except OSError as e:
+            logger.warning("Could not cache index for '%s': %s", entry_id, e)
+
+        return counts
+
     def _search_single_entry(
         self,
         query: str,
@@ -568,8 +1117,8 @@ class BaseSearcher(ABC):
     ) -> list[SearchResult]:
         """Search within a single entry's content.
 
-        Uses simple BM25 scoring on just this entry's content without
-        requiring the full index.
+        Scores the query against just this entry's term counts without
+        requiring the full index. The per-entry counts are cached on disk.
 
         Args:
             query: Search query string.
@@ -587,35 +1136,28 @@ class BaseSearcher(ABC):
         if not entry:
             raise ValueError(f"{self.entry_type.value.capitalize()} '{entry_id}' not found")
 
-        content = entry.get_searchable_text()
+        content = entry.searchable_text
         if not content:
             return []
 
-        # Simple BM25 on single document
-        corpus_tokens = bm25s.tokenize([content], stopwords="en", stemmer=self.stemmer)
-        query_tokens = bm25s.tokenize([query], stopwords="en", stemmer=self.stemmer)
-
-        retriever = bm25s.BM25()
-        retriever.index(corpus_tokens)
-        _results_array, scores_array = retriever.retrieve(query_tokens, k=1)
+        # A query of only stopwords cannot score: skip loading the entry counts
+        query_tokens = tokenize_text(query)
+        if not query_tokens:
+            return []
 
-        score = float(scores_array[0, 0])
+        # BM25 on the single document (term counts cached on disk per entry)
+        score = score_single_document(query_tokens, self._load_entry_term_counts(entry_id, content))
         if score <= 0:
             return []
 
-        # Extract fragments
-        query_terms = query.split()
-        fragments: list[dict[str, Any]] = []
-        if extract_fragments_flag:
-            fragments = extract_fragments(content, query_terms, context_lines, max_fragments=3)
-
         return [
             self._create_result(
                 entry_id=entry_id,
                 score=score,
                 content=content,
                 entry=entry,
-                fragments=fragments,
+                fragment_terms=query.split() if extract_fragments_flag else None,
+                context_lines=context_lines,
             )
         ]
 
@@ -697,7 +1239,8 @@ class PaperSearcher(BaseSearcher):
         score: float,
         content: str,
         entry: Paper | Book | Media | None,
-        fragments: list[dict[str, Any]],
+        fragment_terms: list[str] | None,
+        context_lines: int,
     ) -> SearchResult:
         """Create a SearchResult for a paper.
 
@@ -706,7 +1249,8 @@ class PaperSearcher(BaseSearcher):
             score: BM25 relevance score.
             content: Matched content.
             entry: Paper object.
-            fragments: Extracted text fragments.
+            fragment_terms: Query terms for lazy fragment extraction, or None.
+            context_lines: Context lines around matches in fragments.
 
         Returns:
             SearchResult with entry_type=PAPER and paper set.
@@ -718,7 +1262,8 @@ class PaperSearcher(BaseSearcher):
             content=content,
             entry_type=EntryType.PAPER,
             paper=paper,
-            fragments=fragments,
+            fragment_terms=fragment_terms,
+            context_lines=context_lines,
         )
 
     def _get_index_path(self) -> Path:
@@ -846,7 +1391,8 @@ class BookSearcher(BaseSearcher):
         score: float,
         content: str,
         entry: Paper | Book | Media | None,
-        fragments: list[dict[str, Any]],
+        fragment_terms: list[str] | None,
+        context_lines: int,
     ) -> SearchResult:
         """Create a SearchResult for a book.
 
@@ -855,7 +1401,8 @@ class BookSearcher(BaseSearcher):
             score: BM25 relevance score.
             content: Matched content.
             entry: Book object.
-            fragments: Extracted text fragments.
+            fragment_terms: Query terms for lazy fragment extraction, or None.
+            context_lines: Context lines around matches in fragments.
 
         Returns:
             SearchResult with entry_type=BOOK and book set.
@@ -867,7 +1414,8 @@ class BookSearcher(BaseSearcher):
             content=content,
             entry_type=EntryType.BOOK,
             book=book,
-            fragments=fragments,
+            fragment_terms=fragment_terms,
+            context_lines=context_lines,
         )
 
 
@@ -948,7 +1496,8 @@ class MediaSearcher(BaseSearcher):
         score: float,
         content: str,
         entry: Paper | Book | Media | None,
-        fragments: list[dict[str, Any]],
+        fragment_terms: list[str] | None,
+        context_lines: int,
     ) -> SearchResult:
         """Create a SearchResult for a media entry.
 
@@ -957,7 +1506,8 @@ class MediaSearcher(BaseSearcher):
             score: BM25 relevance score.
             content: Matched content.
             entry: Media object.
-            fragments: Extracted text fragments.
+            fragment_terms: Query terms for lazy fragment extraction, or None.
+            context_lines: Context lines around matches in fragments.
 
         Returns:
             SearchResult with entry_type=MEDIA and media set.
@@ -969,7 +1519,8 @@ class MediaSearcher(BaseSearcher):
             content=content,
             entry_type=EntryType.MEDIA,
             media=media,
-            fragments=fragments,
+            fragment_terms=fragment_terms,
+            context_lines=context_lines,
         )
 
 
@@ -1005,11 +1556,12 @@ class CombinedSearcher:
     def __init__(self) -> None:
         """Initialize the combined searcher.
 
-        Creates PaperSearcher, BookSearcher, and MediaSearcher instances.
+        Uses the process-wide PaperSearcher, BookSearcher, and MediaSearcher
+        instances, so registries and loaded indices are shared.
         """
-        self.paper_searcher = PaperSearcher()
-        self.book_searcher = BookSearcher()
-        self.media_searcher = MediaSearcher()
+        self.paper_searcher = get_paper_searcher()
+        self.book_searcher = get_book_searcher()
+        self.media_searcher = get_media_searcher()
 
     def rebuild_all_indices(self) -> dict[str, int]:
         """Rebuild paper, book, and media BM25 indices.
@@ -1067,50 +1619,40 @@ class CombinedSearcher:
         if entry_types is None:
             entry_types = [EntryType.PAPER, EntryType.BOOK, EntryType.MEDIA]
 
-        all_results: list[SearchResult] = []
-
-        # Search papers
-        if EntryType.PAPER in entry_types:
-            try:
-                paper_results = self.paper_searcher.search(
-                    query=query,
-                    top_k=top_k,  # Get more results, we'll trim later
-                    extract_fragments_flag=extract_fragments_flag,
-                    context_lines=context_lines,
-                )
-                all_results.extend(paper_results)
-            except ValueError as e:
-                logger.warning("Paper search failed: %s", e)
+        jobs: list[tuple[BaseSearcher, EntryType]] = [
+            (searcher, entry_type)
+            for searcher, entry_type in (
+                (self.paper_searcher, EntryType.PAPER),
+                (self.book_searcher, EntryType.BOOK),
+                (self.media_searcher, EntryType.MEDIA),
+            )
+            if entry_type in entry_types
+        ]
 
-        # Search books
-        if EntryType.BOOK in entry_types:
+        def run(job: tuple[BaseSearcher, EntryType]) -> list[SearchResult]:
+            searcher, entry_type = job
             try:
-                book_results = self.book_searcher.search(
+                return searcher.search(
                     query=query,
                     top_k=top_k,  # Get more results, we'll trim later
                     extract_fragments_flag=extract_fragments_flag,
                     context_lines=context_lines,
                 )
-                all_results.extend(book_results)
             except ValueError as e:
-                logger.warning("Book search failed: %s", e)
+                logger.warning("%s search failed: %s", entry_type.value.capitalize(), e)
+                return []
 
-        # Search media
-        if EntryType.MEDIA in entry_types:
-            try:
-                media_results = self.media_searcher.search(
-                    query=query,
-                    top_k=top_k,  # Get more results, we'll trim later
-                    extract_fragments_flag=extract_fragments_flag,
-                    context_lines=context_lines,
-                )
-                all_results.extend(media_results)
-            except ValueError as e:
-                logger.warning("Media search failed: %s", e)
+        # Each type has its own index, so the searches run concurrently; map()
+        # keeps paper, book, media order so ties are merged deterministically
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                per_type = list(executor.map(run, jobs))
+        else:
+            per_type = [run(job) for job in jobs]
+        all_results = list(chain.from_iterable(per_type))
 
-        # Sort by score and limit to top_k
-        all_results.sort(key=lambda r: r.score, reverse=True)
-        results = all_results[:top_k]
+        # Select the top_k by score (partial heap select, same order as a stable sort)
+        results = heapq.nlargest(top_k, all_results, key=_SCORE_KEY)
 
         logger.info("Found %d combined results", len(results))
         return results
@@ -1206,6 +1748,56 @@ class CombinedSearcher:
         )
 
 
+# =============================================================================
+# Searcher Factories
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def get_paper_searcher() -> PaperSearcher:
+    """Get the PaperSearcher shared by all callers in this process.
+
+    Reusing one searcher keeps its registry cache, loaded index and recent
+    results across calls instead of rebuilding them per command.
+
+    Returns:
+        PaperSearcher instance.
+    """
+    return PaperSearcher()
+
+
+@lru_cache(maxsize=1)
+def get_book_searcher() -> BookSearcher:
+    """Get the BookSearcher shared by all callers in this process.
+
+    Returns:
+        BookSearcher instance.
+    """
+    return BookSearcher()
+
+
+@lru_cache(maxsize=1)
+def get_media_searcher() -> MediaSearcher:
+    """Get the MediaSearcher shared by all callers in this process.
+
+    Returns:
+        MediaSearcher instance.
+    """
+    return MediaSearcher()
+
+
+def clear_searcher_cache() -> None:
+    """Drop the shared searchers and loaded indices.
+
+    The next get_*_searcher() call creates fresh instances. Useful in tests
+    that switch the config directory between cases.
+    """
+    get_paper_searcher.cache_clear()
+    get_book_searcher.cache_clear()
+    get_media_searcher.cache_clear()
+    BaseSearcher._INDEX_CACHE.clear()
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -1220,7 +1812,7 @@ def ensure_index_current() -> None:
     Example:
         >>> ensure_index_current()  # Rebuilds if needed
     """
-    searcher = PaperSearcher()
+    searcher = get_paper_searcher()
     if searcher._needs_rebuild():
         searcher.rebuild_index()
 
@@ -1234,14 +1826,14 @@ def ensure_all_indices_current() -> None:
     Example:
         >>> ensure_all_indices_current()  # Rebuilds if needed
     """
-    paper_searcher = PaperSearcher()
+    paper_searcher = get_paper_searcher()
     if paper_searcher._needs_rebuild():
         paper_searcher.rebuild_index()
 
-    book_searcher = BookSearcher()
+    book_searcher = get_book_searcher()
     if book_searcher._needs_rebuild():
         book_searcher.rebuild_index()
 
-    media_searcher = MediaSearcher()
+    media_searcher = get_media_searcher()
     if media_searcher._needs_rebuild():
         media_searcher.rebuild_index()
@@ -91,8 +91,7 @@ def set_default_vector_index(index_name: str) -> None:
     Example:
         >>> set_default_vector_index("nova-1024")
     """
-    settings = load_settings()
-    settings.default_vector_index = index_name
+    settings = load_settings().model_copy(update={"default_vector_index": index_name})
     save_settings(settings)
     logger.info("Set default vector index to '%s'", index_name)
 
@@ -103,7 +102,6 @@ def clear_default_vector_index() -> None:
     Example:
         >>> clear_default_vector_index()
     """
-    settings = load_settings()
-    settings.default_vector_index = None
+    settings = load_settings().model_copy(update={"default_vector_index": None})
     save_settings(settings)
     logger.info("Cleared default vector index")
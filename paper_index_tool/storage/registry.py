@@ -11,7 +11,7 @@ Classes:
     MediaRegistry: Manages the media registry (media.json).
 
 Type Variables:
-    T: Generic type bound to Pydantic BaseModel (Paper, Book, or Media).
+    T: Generic type bound to the entry models (Paper, Book, or Media).
 
 Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
@@ -20,14 +20,18 @@ and has been reviewed and tested by a human.
 import json
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
+from functools import cache
+from itertools import chain
 from pathlib import Path
 from typing import cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from paper_index_tool.logging_config import get_logger
-from paper_index_tool.models import Book, Media, Paper
+from paper_index_tool.models import Book, Media, Paper, _SearchableEntry, freeze_now
 from paper_index_tool.storage.paths import (
     ensure_config_dir,
     get_books_path,
@@ -37,6 +41,13 @@ from paper_index_tool.storage.paths import (
 
 logger = get_logger(__name__)
 
+# Number of entries validated per worker task in parallel imports
+IMPORT_CHUNK_SIZE = 256
+
+# Validated entries per registry file, keyed by path and tagged with the
+# file's (mtime_ns, size) stamp so any write to the file invalidates them
+_ENTRY_CACHE: dict[Path, tuple[tuple[int, int], dict[str, BaseModel]]] = {}
+
 
 class RegistryError(Exception):
     """Base exception for registry operations.
@@ -149,7 +160,22 @@ class RegistryCorruptedError(RegistryError):
         super().__init__(message, entity_type)
 
 
-class BaseRegistry[T: BaseModel](ABC):
+@cache
+def _registry_adapter(
+    model_class: type[_SearchableEntry],
+) -> TypeAdapter[dict[str, _SearchableEntry]]:
+    """Build the whole-file validator for a registry's model class once.
+
+    Args:
+        model_class: Model class stored in the registry (Paper, Book, Media).
+
+    Returns:
+        TypeAdapter validating an ``{entry_id: entry}`` JSON document.
+    """
+    return TypeAdapter(dict[str, model_class])  # type: ignore[valid-type]
+
+
+class BaseRegistry[T: _SearchableEntry](ABC):
     """Abstract base class for registry implementations.
 
     Provides common CRUD operations, import/export functionality, and
@@ -164,7 +190,7 @@ class BaseRegistry[T: BaseModel](ABC):
         - DIP: Depends on abstractions (T, Path) not concretions.
 
     Type Parameters:
-        T: Pydantic model type (Paper or Book).
+        T: Entry model type (Paper, Book, or Media).
 
     Abstract Properties:
         model_class: The Pydantic model class for validation.
@@ -284,6 +310,39 @@ class BaseRegistry[T: BaseModel](ABC):
             )
             return {}
 
+    def _load_validated_registry(self) -> dict[str, T]:
+        """Load the registry and validate all entries in one pass.
+
+        The JSON bytes are parsed and validated by a single pydantic-core
+        call, without first building intermediate dicts with json.load and
+        validating them one entry at a time.
+
+        Returns:
+            Dictionary mapping entry IDs to validated model objects.
+
+        Raises:
+            RegistryCorruptedError: If the file is not valid JSON.
+            ValidationError: If an entry does not match the model.
+        """
+        try:
+            raw = self.registry_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(
+                "%s registry not found at %s. Creating new registry.",
+                self.entity_name.capitalize(),
+                self.registry_path,
+            )
+            return {}
+        try:
+            entries = _registry_adapter(self.model_class).validate_json(raw)
+        except ValidationError as e:
+            if e.errors()[0]["type"] == "json_invalid":
+                logger.error("Failed to parse %s registry: %s", self.entity_name, e)
+                raise RegistryCorruptedError(self.entity_name, self.registry_path, e)
+            raise
+        logger.debug("Loaded %s registry with %d entries", self.entity_name, len(entries))
+        return cast(dict[str, T], entries)
+
     def _save_registry(self, data: dict[str, dict[str, object]]) -> None:
         """Save the registry to disk.
 
@@ -298,32 +357,46 @@ class BaseRegistry[T: BaseModel](ABC):
         """
         with open(self.registry_path, "w") as f:
             json.dump(data, f, indent=2, default=str)
+        _ENTRY_CACHE.pop(self.registry_path, None)
         logger.debug(
             "Saved %s registry with %d entries",
             self.entity_name,
             len(data),
         )
 
-    def list_entries(self) -> list[T]:
+    def list_entries(self, trusted: bool = False, include_quotes: bool = True) -> list[T]:
         """List all entries sorted by ID.
 
         Retrieves all entries from the registry, validates them against
         the model class, and returns them sorted alphabetically by ID.
 
+        Args:
+            trusted: Skip validation and build entries with
+                ``from_trusted_dict``. The registry file only holds entries
+                this tool validated before saving, so read-only bulk paths
+                such as index rebuilds can use this to avoid re-running
+                every validator.
+            include_quotes: With ``trusted``, pass False to leave quotes
+                unloaded for metadata-only reads such as statistics.
+                Ignored for validated listings.
+
         Returns:
-            List of validated model objects sorted by ID.
+            List of model objects sorted by ID.
 
         Example:
             >>> papers = paper_registry.list_entries()
             >>> [p.id for p in papers]
             ['ashford2012', 'brown2015', 'smith2020']
         """
-        registry = self._load_registry()
-        entries = []
-        for entry_id in sorted(registry.keys()):
-            entry_data = registry[entry_id]
-            entry = self.model_class.model_validate(entry_data)
-            entries.append(entry)
+        if trusted:
+            data = self._load_registry()
+            entries = [
+                self.model_class.from_trusted_dict(data[entry_id], include_quotes)
+                for entry_id in sorted(data)
+            ]
+        else:
+            registry = self._load_validated_registry()
+            entries = [registry[entry_id] for entry_id in sorted(registry)]
         logger.debug("Found %d %ss", len(entries), self.entity_name)
         return entries
 
@@ -421,6 +494,9 @@ class BaseRegistry[T: BaseModel](ABC):
 
         Retrieves and validates a single entry from the registry.
         Returns None if the entry doesn't exist (no exception raised).
+        Validated entries are cached per process until the registry file
+        changes, so repeated lookups skip the JSON parse and validation and
+        return the same (frozen) instance.
 
         Args:
             entry_id: Entry ID to look up.
@@ -433,13 +509,38 @@ class BaseRegistry[T: BaseModel](ABC):
             >>> paper.title if paper else "Not found"
             'Developing as a leader'
         """
-        registry = self._load_registry()
-        entry_data = registry.get(entry_id)
-        if entry_data:
-            logger.debug("Found %s '%s'", self.entity_name, entry_id)
-            return self.model_class.model_validate(entry_data)
-        logger.debug("%s '%s' not found", self.entity_name.capitalize(), entry_id)
-        return None
+        entries = self._cached_entries()
+        entry = entries.get(entry_id)
+        if entry is None:
+            registry = self._load_registry()
+            entry_data = registry.get(entry_id)
+            if not entry_data:
+                logger.debug("%s '%s' not found", self.entity_name.capitalize(), entry_id)
+                return None
+            entry = entries[entry_id] = self.model_class.model_validate(entry_data)
+        logger.debug("Found %s '%s'", self.entity_name, entry_id)
+        # Entries are frozen and nothing mutates their quote lists in place,
+        # so the cached instance is shared instead of copied per lookup
+        return cast(T, entry)
+
+    def _cached_entries(self) -> dict[str, BaseModel]:
+        """Get the per-process cache of validated entries for this registry file.
+
+        The cache is dropped whenever the file's mtime or size changes, so
+        writes from this or another process are picked up on the next read.
+
+        Returns:
+            Mutable dictionary mapping entry IDs to validated models.
+        """
+        try:
+            stat = self.registry_path.stat()
+        except FileNotFoundError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _ENTRY_CACHE.get(self.registry_path)
+        if cached is None or cached[0] != stamp:
+            cached = _ENTRY_CACHE[self.registry_path] = (stamp, {})
+        return cached[1]
 
     def entry_exists(self, entry_id: str) -> bool:
         """Check if an entry exists.
@@ -465,7 +566,7 @@ class BaseRegistry[T: BaseModel](ABC):
         """Get searchable content for all entries.
 
         Extracts searchable text from all entries for BM25 indexing.
-        Each entry must have a get_searchable_text() method.
+        Uses each entry's cached searchable_text.
 
         Returns:
             List of (entry_id, searchable_text) tuples.
@@ -480,13 +581,9 @@ class BaseRegistry[T: BaseModel](ABC):
         content = []
         for entry in entries:
             entry_id = cast(str, getattr(entry, "id"))
-            # Both Paper and Book models have get_searchable_text method
-            # Using hasattr check for type safety
-            if hasattr(entry, "get_searchable_text"):
-                get_text = getattr(entry, "get_searchable_text")
-                text: str = get_text()
-                if text:
-                    content.append((entry_id, text))
+            text = entry.searchable_text
+            if text:
+                content.append((entry_id, text))
         logger.debug(
             "Retrieved searchable content for %d %ss",
             len(content),
@@ -516,7 +613,38 @@ class BaseRegistry[T: BaseModel](ABC):
         )
         return registry
 
-    def import_all(self, data: dict[str, dict[str, object]], replace: bool = True) -> int:
+    def _validate_import_chunk(
+        self, chunk: list[tuple[str, dict[str, object]]]
+    ) -> list[tuple[str, dict[str, object]]]:
+        """Validate a chunk of import entries and dump them to JSON-safe dicts.
+
+        Args:
+            chunk: List of (entry_id, entry_data) pairs.
+
+        Returns:
+            List of (entry_id, validated_data) pairs in input order.
+
+        Raises:
+            ValueError: If any entry fails validation.
+        """
+        validated: list[tuple[str, dict[str, object]]] = []
+        for entry_id, entry_data in chunk:
+            try:
+                entry = self.model_class.model_validate(entry_data)
+                validated.append((entry_id, entry.model_dump(mode="json")))
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to validate {self.entity_name} '{entry_id}': {e}. "
+                    f"Please check the data format and required fields."
+                )
+        return validated
+
+    def import_all(
+        self,
+        data: dict[str, dict[str, object]],
+        replace: bool = True,
+        workers: int = 1,
+    ) -> int:
         """Import entries from a dictionary.
 
         Imports entries from a dictionary (e.g., from JSON backup).
@@ -527,6 +655,9 @@ class BaseRegistry[T: BaseModel](ABC):
             replace: If True, replace all existing entries. If False, merge
                      (existing entries are kept, new entries are added,
                      conflicting IDs are skipped with a warning).
+            workers: Number of threads used to validate entries. Values above 1
+                     validate chunks of IMPORT_CHUNK_SIZE entries concurrently;
+                     the registry is still written once from the calling thread.
 
         Returns:
             Number of entries imported.
@@ -541,17 +672,23 @@ class BaseRegistry[T: BaseModel](ABC):
             >>> print(f"Imported {count} papers")
             Imported 15 papers
         """
-        # Validate all entries first
-        validated_entries: dict[str, dict[str, object]] = {}
-        for entry_id, entry_data in data.items():
-            try:
-                entry = self.model_class.model_validate(entry_data)
-                validated_entries[entry_id] = entry.model_dump(mode="json")
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to validate {self.entity_name} '{entry_id}': {e}. "
-                    f"Please check the data format and required fields."
-                )
+        # Validate all entries first; entries without timestamps share one
+        items = list(data.items())
+        with freeze_now():
+            if workers > 1 and len(items) > IMPORT_CHUNK_SIZE:
+                chunks = [
+                    items[i : i + IMPORT_CHUNK_SIZE]
+                    for i in range(0, len(items), IMPORT_CHUNK_SIZE)
+                ]
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(copy_context().run, self._validate_import_chunk, chunk)
+                        for chunk in chunks
+                    ]
+                    validated_chunks = [future.result() for future in futures]
+                validated_entries = dict(chain.from_iterable(validated_chunks))
+            else:
+                validated_entries = dict(self._validate_import_chunk(items))
 
         if replace:
             # Replace entire registry
@@ -741,6 +878,34 @@ class PaperRegistry(BaseRegistry[Paper]):
     # Convenience Aliases (Backward Compatibility)
     # =========================================================================
 
+    def _validate_import_chunk(
+        self, chunk: list[tuple[str, dict[str, object]]]
+    ) -> list[tuple[str, dict[str, object]]]:
+        """Validate a chunk of paper imports with one Paper.validate_batch call.
+
+        On failure the offending entry is re-validated on its own, so the
+        error message names that paper and only its problems.
+
+        Args:
+            chunk: List of (entry_id, entry_data) pairs.
+
+        Returns:
+            List of (entry_id, validated_data) pairs in input order.
+
+        Raises:
+            ValueError: If any entry fails validation.
+        """
+        try:
+            papers = Paper.validate_batch([entry_data for _, entry_data in chunk])
+        except ValidationError as e:
+            failed = cast(int, e.errors()[0]["loc"][0])
+            super()._validate_import_chunk([chunk[failed]])
+            raise  # pragma: no cover - the single-entry validation raises
+        return [
+            (entry_id, paper.model_dump(mode="json"))
+            for (entry_id, _), paper in zip(chunk, papers, strict=True)
+        ]
+
     def list_papers(self) -> list[Paper]:
         """List all papers sorted by ID.
 
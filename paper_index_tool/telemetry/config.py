@@ -10,12 +10,12 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 
 from paper_index_tool import __version__
 
 
-class ExporterType(str, Enum):
+class ExporterType(StrEnum):
     """Supported telemetry exporters."""
 
     CONSOLE = "console"
@@ -8,6 +8,7 @@ Classes:
     BedrockEmbeddings: Client for AWS Bedrock text embeddings.
     EmbeddingStats: Statistics from embedding generation.
     EmbeddingModelConfig: Configuration for an embedding model.
+    RequestRateLimiter: Thread-safe token bucket for Bedrock request pacing.
 
 Supported Models:
     titan-v1: amazon.titan-embed-text-v1 (1536 dims)
@@ -20,7 +21,10 @@ Supported Models:
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from paper_index_tool.logging_config import get_logger
@@ -98,6 +102,12 @@ DEFAULT_MODEL = "titan-v2"
 # Default region - us-east-1 is required for Nova embedding model
 DEFAULT_REGION = "us-east-1"
 
+# Default concurrent Bedrock requests; embedding is network-bound, not CPU-bound
+DEFAULT_MAX_WORKERS = 16
+
+# Cohere models on Bedrock accept up to 96 texts per request
+COHERE_MAX_BATCH_SIZE = 96
+
 # Legacy constants for backward compatibility
 EMBEDDING_MODEL_ID = EMBEDDING_MODELS[DEFAULT_MODEL].model_id
 EMBEDDING_DIMENSIONS = EMBEDDING_MODELS[DEFAULT_MODEL].default_dimensions
@@ -167,11 +177,13 @@ class EmbeddingStats:
         total_tokens: Total number of input tokens processed.
         total_cost: Total cost in USD.
         num_texts: Number of texts embedded.
+        elapsed_seconds: Wall-clock time spent generating the embeddings.
     """
 
     total_tokens: int
     total_cost: float
     num_texts: int
+    elapsed_seconds: float = 0.0
 
     @classmethod
     def from_tokens(
@@ -192,6 +204,113 @@ class EmbeddingStats:
         return cls(total_tokens=total_tokens, total_cost=cost, num_texts=num_texts)
 
 
+# =============================================================================
+# Client Factory
+# =============================================================================
+
+
+@lru_cache(maxsize=8)
+def _create_bedrock_client(region: str, max_pool_connections: int) -> Any:
+    """Create a boto3 Bedrock runtime client, shared per region and pool size.
+
+    boto3 and botocore's service model are imported here, on the first
+    embedding call, so commands that never embed skip that startup cost.
+    Clients are thread-safe, so every BedrockEmbeddings instance with the
+    same settings reuses one client (and its connection pool).
+
+    Args:
+        region: AWS region for Bedrock.
+        max_pool_connections: Maximum HTTP pool connections.
+
+    Returns:
+        Boto3 bedrock-runtime client.
+
+    Raises:
+        AWSCredentialsError: If credentials cannot be found.
+    """
+    try:
+        import boto3  # type: ignore[import-not-found]
+        from botocore.config import Config  # type: ignore[import-not-found]
+        from botocore.exceptions import (  # type: ignore[import-not-found]
+            NoCredentialsError,
+            ProfileNotFound,
+        )
+    except ImportError:
+        raise ImportError(
+            "boto3 is required for vector search. "
+            "Install with: pip install paper-index-tool[vector] "
+            "or: uv sync --extra vector"
+        )
+
+    try:
+        # Configure connection pool for concurrent requests
+        boto_config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        )
+
+        # Use default credential chain (env vars, profile, IAM role)
+        session = boto3.Session(region_name=region)
+        client = session.client("bedrock-runtime", config=boto_config)
+        logger.debug(
+            "Created Bedrock client in region: %s (pool_connections=%d)",
+            session.region_name,
+            max_pool_connections,
+        )
+        return client
+    except NoCredentialsError as e:
+        raise AWSCredentialsError(str(e))
+    except ProfileNotFound as e:
+        raise AWSCredentialsError(f"AWS profile not found: {e}")
+    except Exception as e:
+        raise AWSCredentialsError(f"Failed to create Bedrock client: {e}")
+
+
+class RequestRateLimiter:
+    """Thread-safe token bucket limiting requests per second.
+
+    Used to keep concurrent embedding requests under the account's Bedrock
+    TPS quota. Each acquire() consumes one token; tokens refill continuously
+    at ``rate`` per second up to a burst of ``rate`` tokens.
+
+    Example:
+        >>> limiter = RequestRateLimiter(rate=10.0)
+        >>> limiter.acquire()  # blocks only when the bucket is empty
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Maximum sustained requests per second (must be > 0).
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}.")
+        self._rate = rate
+        self._capacity = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 class BedrockEmbeddings:
     """AWS Bedrock embeddings client supporting multiple models.
 
@@ -224,6 +343,7 @@ class BedrockEmbeddings:
         model_name: str = DEFAULT_MODEL,
         dimensions: int | None = None,
         max_pool_connections: int = 50,
+        max_requests_per_second: float | None = None,
     ) -> None:
         """Initialize Bedrock embeddings client.
 
@@ -239,6 +359,9 @@ class BedrockEmbeddings:
             max_pool_connections: Maximum HTTP pool connections for concurrent
                 requests. Should match or exceed max_workers in embed_texts().
                 Default: 50.
+            max_requests_per_second: Optional cap on Bedrock requests per
+                second across all worker threads, sized to the account's
+                TPS quota. None (default) relies on botocore's adaptive retries.
 
         Raises:
             AWSCredentialsError: If AWS credentials cannot be found.
@@ -251,6 +374,9 @@ class BedrockEmbeddings:
         self._client = None
         self._region = region or DEFAULT_REGION
         self._max_pool_connections = max_pool_connections
+        self._rate_limiter = (
+            RequestRateLimiter(max_requests_per_second) if max_requests_per_second else None
+        )
 
     def _get_client(self) -> Any:
         """Get or create boto3 Bedrock runtime client.
@@ -261,45 +387,9 @@ class BedrockEmbeddings:
         Raises:
             AWSCredentialsError: If credentials cannot be found.
         """
-        if self._client is not None:
-            return self._client
-
-        try:
-            import boto3  # type: ignore[import-not-found]
-            from botocore.config import Config  # type: ignore[import-not-found]
-            from botocore.exceptions import (  # type: ignore[import-not-found]
-                NoCredentialsError,
-                ProfileNotFound,
-            )
-        except ImportError:
-            raise ImportError(
-                "boto3 is required for vector search. "
-                "Install with: pip install paper-index-tool[vector] "
-                "or: uv sync --extra vector"
-            )
-
-        try:
-            # Configure connection pool for concurrent requests
-            boto_config = Config(
-                max_pool_connections=self._max_pool_connections,
-                retries={"max_attempts": 3, "mode": "adaptive"},
-            )
-
-            # Use default credential chain (env vars, profile, IAM role)
-            session = boto3.Session(region_name=self._region)
-            self._client = session.client("bedrock-runtime", config=boto_config)
-            logger.debug(
-                "Created Bedrock client in region: %s (pool_connections=%d)",
-                session.region_name,
-                self._max_pool_connections,
-            )
-            return self._client
-        except NoCredentialsError as e:
-            raise AWSCredentialsError(str(e))
-        except ProfileNotFound as e:
-            raise AWSCredentialsError(f"AWS profile not found: {e}")
-        except Exception as e:
-            raise AWSCredentialsError(f"Failed to create Bedrock client: {e}")
+        if self._client is None:
+            self._client = _create_bedrock_client(self._region, self._max_pool_connections)
+        return self._client
 
     def _build_request_body(self, text: str, purpose: str = "GENERIC_INDEX") -> str:
         """Build model-specific request body.
@@ -384,10 +474,35 @@ class BedrockEmbeddings:
             EmbeddingError: If API call fails.
             AWSCredentialsError: If credentials are invalid.
         """
+        text = self._prepare_text(text)
+
+        try:
+            response_body = self._invoke(self._build_request_body(text, purpose))
+            embedding, token_count = self._parse_response(response_body, len(text))
+
+            logger.debug(
+                "Generated embedding with %d dimensions, %d tokens", len(embedding), token_count
+            )
+            return embedding, token_count
+
+        except Exception as e:
+            raise self._translate_error(e)
+
+    def _prepare_text(self, text: str) -> str:
+        """Validate input text and truncate it to the model's input limit.
+
+        Args:
+            text: Input text to embed.
+
+        Returns:
+            Text truncated to roughly max_input_tokens (about 4.7 chars per token).
+
+        Raises:
+            EmbeddingError: If the text is empty.
+        """
         if not text or not text.strip():
             raise EmbeddingError("Input text cannot be empty")
 
-        # Truncate if too long (roughly 4.7 chars per token)
         max_chars = int(self.config.max_input_tokens * 4.7)
         if len(text) > max_chars:
             logger.warning(
@@ -396,40 +511,81 @@ class BedrockEmbeddings:
                 max_chars,
             )
             text = text[:max_chars]
+        return text
 
-        try:
-            client = self._get_client()
+    def _invoke(self, request_body: str) -> dict[str, Any]:
+        """Send one InvokeModel request and decode the JSON response.
 
-            request_body = self._build_request_body(text, purpose)
+        Args:
+            request_body: JSON-encoded request body.
 
-            response = client.invoke_model(
-                modelId=self.model_id,
-                body=request_body,
-                contentType="application/json",
-                accept="application/json",
-            )
+        Returns:
+            Parsed response body.
+        """
+        client = self._get_client()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        response = client.invoke_model(
+            modelId=self.model_id,
+            body=request_body,
+            contentType="application/json",
+            accept="application/json",
+        )
+        return dict(json.loads(response["body"].read()))
 
-            response_body = json.loads(response["body"].read())
-            embedding, token_count = self._parse_response(response_body, len(text))
+    def _translate_error(self, error: Exception) -> Exception:
+        """Map a Bedrock client failure to an agent-friendly exception.
 
-            logger.debug(
-                "Generated embedding with %d dimensions, %d tokens", len(embedding), token_count
+        Args:
+            error: Exception raised while invoking the model.
+
+        Returns:
+            AWSCredentialsError for credential/permission failures,
+            EmbeddingError otherwise.
+        """
+        if isinstance(error, (AWSCredentialsError, EmbeddingError)):
+            return error
+        error_str = str(error)
+        if "AccessDeniedException" in error_str:
+            return AWSCredentialsError(
+                f"Access denied to model {self.model_id}. "
+                f"Ensure your IAM role has bedrock:InvokeModel permission "
+                f"for this model in your region."
             )
-            return embedding, token_count
+        if "ExpiredTokenException" in error_str:
+            return AWSCredentialsError("AWS session token expired. Please refresh credentials.")
+        if "UnrecognizedClientException" in error_str:
+            return AWSCredentialsError("Invalid AWS credentials.")
+        return EmbeddingError(error_str)
+
+    def _embed_batch_with_tokens(
+        self, texts: list[str], purpose: str = "GENERIC_INDEX"
+    ) -> tuple[list[list[float]], int]:
+        """Embed a batch of texts in a single request (Cohere models only).
 
+        Args:
+            texts: Up to COHERE_MAX_BATCH_SIZE texts to embed.
+            purpose: GENERIC_INDEX for documents or TEXT_RETRIEVAL for queries.
+
+        Returns:
+            Tuple of (embedding vectors in input order, billed input tokens).
+
+        Raises:
+            EmbeddingError: If API call fails.
+            AWSCredentialsError: If credentials are invalid.
+        """
+        prepared = [self._prepare_text(text) for text in texts]
+        input_type = "search_query" if purpose == "TEXT_RETRIEVAL" else "search_document"
+        try:
+            response_body = self._invoke(json.dumps({"texts": prepared, "input_type": input_type}))
+            embeddings = [list(vector) for vector in response_body["embeddings"]]
+            token_count = (
+                response_body.get("meta", {}).get("billed_units", {}).get("input_tokens", 0)
+            )
+            logger.debug("Generated %d embeddings in one batch request", len(embeddings))
+            return embeddings, token_count
         except Exception as e:
-            error_str = str(e)
-            if "AccessDeniedException" in error_str:
-                raise AWSCredentialsError(
-                    f"Access denied to model {self.model_id}. "
-                    f"Ensure your IAM role has bedrock:InvokeModel permission "
-                    f"for this model in your region."
-                )
-            if "ExpiredTokenException" in error_str:
-                raise AWSCredentialsError("AWS session token expired. Please refresh credentials.")
-            if "UnrecognizedClientException" in error_str:
-                raise AWSCredentialsError("Invalid AWS credentials.")
-            raise EmbeddingError(error_str)
+            raise self._translate_error(e)
 
     def embed_text(self, text: str, purpose: str = "GENERIC_INDEX") -> list[float]:
         """Generate embedding vector for text.
@@ -478,12 +634,17 @@ class BedrockEmbeddings:
         """Generate embeddings for multiple texts in parallel.
 
         Processes texts concurrently using ThreadPoolExecutor for I/O-bound
-        API calls to AWS Bedrock.
+        API calls to AWS Bedrock. Titan and Nova accept a single text per
+        request, so wall-clock time is dominated by round trips; concurrency
+        is bounded by the HTTP pool size and, if configured, the request rate
+        limiter. Cohere models accept up to COHERE_MAX_BATCH_SIZE texts per
+        request and are sent in batches, cutting request count ~96x.
 
         Args:
             texts: List of texts to embed.
             show_progress: If True, display tqdm progress bar.
-            max_workers: Number of parallel workers. Defaults to CPU count.
+            max_workers: Number of parallel workers. Defaults to
+                DEFAULT_MAX_WORKERS, capped at the HTTP pool size.
 
         Returns:
             Tuple of (embeddings list, stats with token count and cost).
@@ -497,7 +658,6 @@ class BedrockEmbeddings:
             2
             >>> print(f"Cost: ${stats.total_cost:.6f}")
         """
-        import os
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
         from tqdm import tqdm
@@ -505,7 +665,19 @@ class BedrockEmbeddings:
         if not texts:
             return [], EmbeddingStats(total_tokens=0, total_cost=0.0, num_texts=0)
 
-        num_workers = max_workers or os.cpu_count() or 1
+        num_workers = max_workers or min(DEFAULT_MAX_WORKERS, self._max_pool_connections)
+        started = time.perf_counter()
+
+        if self.model_name.startswith("cohere"):
+            embeddings, total_tokens = self._embed_texts_batched(
+                texts, show_progress=show_progress, max_workers=num_workers
+            )
+            stats = EmbeddingStats.from_tokens(
+                total_tokens, len(texts), self.config.price_per_1000_tokens
+            )
+            stats.elapsed_seconds = time.perf_counter() - started
+            return embeddings, stats
+
         results: dict[int, tuple[list[float], int]] = {}
 
         with ThreadPoolExecutor(max_workers=num_workers) as executor:
@@ -535,5 +707,49 @@ class BedrockEmbeddings:
         stats = EmbeddingStats.from_tokens(
             total_tokens, len(texts), self.config.price_per_1000_tokens
         )
+        stats.elapsed_seconds = time.perf_counter() - started
 
         return embeddings, stats
+
+    def _embed_texts_batched(
+        self, texts: list[str], show_progress: bool, max_workers: int
+    ) -> tuple[list[list[float]], int]:
+        """Embed texts in concurrent batch requests of COHERE_MAX_BATCH_SIZE.
+
+        Args:
+            texts: Texts to embed.
+            show_progress: If True, display tqdm progress bar (per text).
+            max_workers: Number of concurrent batch requests.
+
+        Returns:
+            Tuple of (embeddings in input order, total billed input tokens).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tqdm import tqdm
+
+        batches = [
+            texts[i : i + COHERE_MAX_BATCH_SIZE]
+            for i in range(0, len(texts), COHERE_MAX_BATCH_SIZE)
+        ]
+        embeddings: list[list[float]] = []
+        total_tokens = 0
+
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+            tqdm(
+                total=len(texts),
+                desc="Generating embeddings",
+                unit="chunk",
+                disable=not show_progress,
+            ) as pbar,
+        ):
+            # executor.map yields batch results in submission order
+            for (batch_embeddings, batch_tokens), batch in zip(
+                executor.map(self._embed_batch_with_tokens, batches), batches, strict=True
+            ):
+                embeddings.extend(batch_embeddings)
+                total_tokens += batch_tokens
+                pbar.update(len(batch))
+
+        return embeddings, total_tokens
@@ -14,7 +14,7 @@ from datetime import datetime
 from typing import Any
 
 from paper_index_tool.logging_config import get_logger
-from paper_index_tool.models import VectorIndexMetadata
+from paper_index_tool.models import VectorIndexMetadata, VectorQuantization
 from paper_index_tool.storage.paths import (
     get_named_index_chunks_path,
     get_named_index_dir,
@@ -31,6 +31,67 @@ from paper_index_tool.vector.errors import NamedIndexNotFoundError
 
 logger = get_logger(__name__)
 
+# Collections below this size are searched exactly; brute force is faster than
+# walking a graph there and gives perfect recall
+HNSW_MIN_VECTORS = 4096
+
+# HNSW graph parameters (neighbours per node, build and query beam widths)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 64
+HNSW_EF_SEARCH = 128
+
+
+def build_faiss_index(
+    faiss: Any, embeddings: Any, quantization: VectorQuantization = "fp32"
+) -> Any:
+    """Build a cosine-similarity FAISS index over L2-normalized embeddings.
+
+    Small collections use an exact flat index. From ``HNSW_MIN_VECTORS``
+    vectors on, an HNSW graph (inner-product metric) is built instead so
+    query time grows logarithmically rather than linearly with the corpus.
+
+    With ``fp16`` or ``int8`` quantization, vectors are stored through a
+    FAISS scalar quantizer (2 or 1 bytes per dimension instead of 4). The
+    int8 quantizer is trained on the fixed range [-1, 1] that bounds every
+    component of a unit vector, not on the embeddings themselves, so later
+    additions can reuse it and re-encoding a reconstructed vector is exact.
+
+    Args:
+        faiss: The faiss module.
+        embeddings: Normalized float32 array of shape (N, dimensions).
+        quantization: Storage format of the vectors.
+
+    Returns:
+        FAISS index containing all embeddings.
+    """
+    import numpy as np
+
+    count, dimension = embeddings.shape
+    metric = faiss.METRIC_INNER_PRODUCT
+    qtype = {"fp16": faiss.ScalarQuantizer.QT_fp16, "int8": faiss.ScalarQuantizer.QT_8bit}.get(
+        quantization
+    )
+
+    if count < HNSW_MIN_VECTORS:
+        if qtype is None:
+            index = faiss.IndexFlatIP(dimension)
+        else:
+            index = faiss.IndexScalarQuantizer(dimension, qtype, metric)
+    else:
+        if qtype is None:
+            index = faiss.IndexHNSWFlat(dimension, HNSW_M, metric)
+        else:
+            index = faiss.IndexHNSWSQ(dimension, qtype, HNSW_M, metric)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        logger.debug("Building HNSW index over %d vectors (%s)", count, quantization)
+
+    if not index.is_trained:
+        bounds = np.array([[-1.0] * dimension, [1.0] * dimension], dtype=np.float32)
+        index.train(bounds)
+    index.add(embeddings)
+    return index
+
 
 class VectorIndexRegistry:
     """Registry for managing named vector indices.
@@ -148,6 +209,7 @@ class VectorIndexRegistry:
         dimensions: int | None = None,
         chunk_size: int = 300,
         chunk_overlap: int = 50,
+        quantization: VectorQuantization = "fp32",
     ) -> VectorIndexMetadata:
         """Create a new named index.
 
@@ -157,6 +219,7 @@ class VectorIndexRegistry:
             dimensions: Embedding dimensions (None for model default).
             chunk_size: Words per chunk.
             chunk_overlap: Overlap words between chunks.
+            quantization: Vector storage format ("fp32", "fp16" or "int8").
 
         Returns:
             Created VectorIndexMetadata.
@@ -182,6 +245,7 @@ class VectorIndexRegistry:
             dimensions=validated_dims,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            quantization=quantization,
             chunk_count=0,
             total_tokens=0,
             estimated_cost_usd=0.0,
@@ -275,19 +339,14 @@ class VectorIndexRegistry:
         if name not in indices:
             raise NamedIndexNotFoundError(name)
 
-        metadata = indices[name]
-        # Create new metadata with updated values
-        updated_metadata = VectorIndexMetadata(
-            name=metadata.name,
-            embedding_model=metadata.embedding_model,
-            dimensions=metadata.dimensions,
-            chunk_size=metadata.chunk_size,
-            chunk_overlap=metadata.chunk_overlap,
-            chunk_count=chunk_count,
-            total_tokens=total_tokens,
-            estimated_cost_usd=estimated_cost_usd,
-            created_at=metadata.created_at,
-            updated_at=datetime.now(),
+        # Metadata is frozen: copy it with the new statistics
+        updated_metadata = indices[name].model_copy(
+            update={
+                "chunk_count": chunk_count,
+                "total_tokens": total_tokens,
+                "estimated_cost_usd": estimated_cost_usd,
+                "updated_at": datetime.now(),
+            }
         )
 
         indices[name] = updated_metadata
@@ -401,6 +460,8 @@ class VectorIndexRegistry:
 
         Chunks the entry, generates embeddings, and adds them to the
         FAISS index. More efficient than rebuilding the entire index.
+        Only a flat index that reaches ``HNSW_MIN_VECTORS`` is rebuilt (as
+        HNSW, from the vectors already stored in it plus the new ones).
 
         Args:
             name: Index name.
@@ -457,7 +518,18 @@ class VectorIndexRegistry:
         # Add to FAISS index
         embeddings_array = np.array(embeddings_list, dtype=np.float32)
         faiss.normalize_L2(embeddings_array)
-        index.add(embeddings_array)
+        total = index.ntotal + len(embeddings_array)
+        crosses_hnsw = getattr(index, "hnsw", None) is None and total >= HNSW_MIN_VECTORS
+        if index.ntotal == 0 or crosses_hnsw:
+            # An empty index may be a plain placeholder of the wrong storage
+            # type, and a flat index that grew past the threshold should
+            # become HNSW; quantizers use a fixed range, so this is lossless
+            if index.ntotal:
+                stored = index.reconstruct_n(0, index.ntotal)
+                embeddings_array = np.vstack([stored, embeddings_array])
+            index = build_faiss_index(faiss, embeddings_array, metadata.quantization)
+        else:
+            index.add(embeddings_array)
 
         # Update chunks list
         chunks.extend(new_chunks)
@@ -491,8 +563,8 @@ class VectorIndexRegistry:
         """Remove an entry from a named index.
 
         Removes all chunks associated with an entry ID from the index.
-        Note: This requires rebuilding the FAISS index as IndexFlatIP
-        doesn't support removal.
+        Note: This requires rebuilding the FAISS index as neither the flat
+        nor the HNSW index supports removal.
 
         Args:
             name: Index name.
@@ -545,8 +617,7 @@ class VectorIndexRegistry:
             embeddings_array = np.array(embeddings_list, dtype=np.float32)
             faiss.normalize_L2(embeddings_array)
 
-            new_index = faiss.IndexFlatIP(metadata.dimensions)
-            new_index.add(embeddings_array)
+            new_index = build_faiss_index(faiss, embeddings_array, metadata.quantization)
 
             self.save_index_data(name, new_index, remaining_chunks)
         else:
@@ -13,6 +13,7 @@ uses embedding-based similarity instead of keyword matching.
 
 from __future__ import annotations
 
+import heapq
 import json
 from typing import Any
 
@@ -32,6 +33,7 @@ from paper_index_tool.storage import (
 from paper_index_tool.vector.chunking import CharacterLimitChunker, Chunk, TextChunker
 from paper_index_tool.vector.embeddings import BedrockEmbeddings
 from paper_index_tool.vector.errors import IndexNotFoundError, NamedIndexNotFoundError
+from paper_index_tool.vector.registry import HNSW_EF_SEARCH, build_faiss_index
 
 logger = get_logger(__name__)
 
@@ -68,6 +70,7 @@ class VectorSearcher:
         index_name: str | None = None,
         model_name: str | None = None,
         dimensions: int | None = None,
+        max_requests_per_second: float | None = None,
     ) -> None:
         """Initialize vector searcher.
 
@@ -80,10 +83,13 @@ class VectorSearcher:
                         if not specified, will be loaded from index metadata.
             dimensions: Embedding dimensions. Required for named indices
                         if not specified, will be loaded from index metadata.
+            max_requests_per_second: Cap on Bedrock embedding requests per
+                        second (None for no cap). See BedrockEmbeddings.
         """
         self.index_name = index_name
         self._model_name = model_name
         self._dimensions = dimensions
+        self._max_requests_per_second = max_requests_per_second
 
         # Defer embeddings creation until we know the model
         self._embeddings: BedrockEmbeddings | None = None
@@ -141,6 +147,7 @@ class VectorSearcher:
                 self._embeddings = BedrockEmbeddings(
                     model_name=model_name,
                     dimensions=metadata.dimensions,
+                    max_requests_per_second=self._max_requests_per_second,
                 )
             except NamedIndexNotFoundError:
                 # Index doesn't exist yet, use provided or default model
@@ -148,15 +155,19 @@ class VectorSearcher:
                     self._embeddings = BedrockEmbeddings(
                         model_name=self._model_name,
                         dimensions=self._dimensions,
+                        max_requests_per_second=self._max_requests_per_second,
                     )
                 else:
                     # Default to titan-v2
-                    self._embeddings = BedrockEmbeddings()
+                    self._embeddings = BedrockEmbeddings(
+                        max_requests_per_second=self._max_requests_per_second
+                    )
         else:
             # Legacy mode - use default model
             self._embeddings = BedrockEmbeddings(
                 model_name=self._model_name or "titan-v2",
                 dimensions=self._dimensions,
+                max_requests_per_second=self._max_requests_per_second,
             )
 
         return self._embeddings
@@ -210,8 +221,9 @@ class VectorSearcher:
         For named indices, updates the index metadata with statistics.
 
         Returns:
-            Dictionary with counts and cost:
-            {"papers": N, "books": M, "media": P, "chunks": C, "tokens": T, "cost": $}.
+            Dictionary with counts, cost and embedding wall-clock time:
+            {"papers": N, "books": M, "media": P, "chunks": C, "tokens": T, "cost": $,
+            "seconds": S}.
 
         Example:
             >>> counts = searcher.rebuild_index()
@@ -226,22 +238,22 @@ class VectorSearcher:
         counts: dict[str, int | float] = {"papers": 0, "books": 0, "media": 0, "chunks": 0}
 
         # Chunk papers
-        for paper in self.paper_registry.list_entries():
-            text = paper.get_searchable_text()
+        for paper in self.paper_registry.list_entries(trusted=True):
+            text = paper.searchable_text
             chunks = self.chunker.chunk_text(text, paper.id, "paper")
             all_chunks.extend(chunks)
             counts["papers"] += 1
 
         # Chunk books
-        for book in self.book_registry.list_entries():
-            text = book.get_searchable_text()
+        for book in self.book_registry.list_entries(trusted=True):
+            text = book.searchable_text
             chunks = self.chunker.chunk_text(text, book.id, "book")
             all_chunks.extend(chunks)
             counts["books"] += 1
 
         # Chunk media
-        for media in self.media_registry.list_entries():
-            text = media.get_searchable_text()
+        for media in self.media_registry.list_entries(trusted=True):
+            text = media.searchable_text
             chunks = self.chunker.chunk_text(text, media.id, "media")
             all_chunks.extend(chunks)
             counts["media"] += 1
@@ -250,6 +262,7 @@ class VectorSearcher:
             logger.warning("No content to index")
             counts["tokens"] = 0
             counts["cost"] = 0.0
+            counts["seconds"] = 0.0
             return counts
 
         # Apply character limit chunker to enforce model limits
@@ -266,18 +279,14 @@ class VectorSearcher:
         # Store token/cost stats
         counts["tokens"] = stats.total_tokens
         counts["cost"] = stats.total_cost
+        counts["seconds"] = stats.elapsed_seconds
 
         # Convert to numpy array
         np = self._get_numpy()
         embeddings_array = np.array(embeddings_list, dtype=np.float32)
 
-        # Build FAISS index (Inner Product for cosine similarity with normalized vectors)
-        dimension = embeddings_array.shape[1]
-        index = faiss.IndexFlatIP(dimension)
-
-        # Normalize vectors for cosine similarity
+        # Normalize vectors so inner product equals cosine similarity
         faiss.normalize_L2(embeddings_array)
-        index.add(embeddings_array)
 
         # Save index to appropriate location
         if self.index_name:
@@ -285,6 +294,8 @@ class VectorSearcher:
             from paper_index_tool.vector.registry import VectorIndexRegistry
 
             registry = VectorIndexRegistry()
+            quantization = registry.get_index(self.index_name).quantization
+            index = build_faiss_index(faiss, embeddings_array, quantization)
             registry.save_index_data(self.index_name, index, all_chunks)
             registry.update_index_stats(
                 self.index_name,
@@ -294,6 +305,7 @@ class VectorSearcher:
             )
         else:
             # Legacy single index
+            index = build_faiss_index(faiss, embeddings_array)
             index_dir = get_vector_index_dir()
             index_dir.mkdir(parents=True, exist_ok=True)
 
@@ -406,6 +418,9 @@ class VectorSearcher:
         faiss = self._get_faiss()
         np = self._get_numpy()
         index, chunks = self._load_index()
+        if not chunks:
+            # Nothing to match: skip the Bedrock client and the query embedding
+            return []
 
         # Embed query (uses TEXT_RETRIEVAL purpose for Nova model)
         query_embedding = self.embeddings.embed_query(query)
@@ -415,6 +430,10 @@ class VectorSearcher:
         # Search index
         # Get more results than needed since we'll aggregate by entry
         search_k = min(top_k * 10, len(chunks))
+        hnsw = getattr(index, "hnsw", None)
+        if hnsw is not None:
+            # The beam must be at least as wide as the number of neighbours requested
+            hnsw.efSearch = max(HNSW_EF_SEARCH, search_k)
         distances, indices = index.search(query_array, search_k)
 
         # Aggregate results by entry
@@ -445,9 +464,10 @@ class VectorSearcher:
         results: list[SearchResult] = []
         query_terms = query.split()  # For fragment extraction
 
-        for entry_id_key, (score, chunk) in sorted(
-            entry_scores.items(), key=lambda x: x[1][0], reverse=True
-        )[:top_k]:
+        # Partial heap select of the best entries (same order as a full sort)
+        for entry_id_key, (score, chunk) in heapq.nlargest(
+            top_k, entry_scores.items(), key=lambda item: item[1][0]
+        ):
             # Get full entry
             entry: Paper | Book | Media | None = None
             entry_type = EntryType(chunk.entry_type)
@@ -460,7 +480,7 @@ class VectorSearcher:
                 entry = self.media_registry.get_media(entry_id_key)
 
             # Get full content for fragments
-            content = entry.get_searchable_text() if entry else chunk.text
+            content = entry.searchable_text if entry else chunk.text
 
             # Extract fragments if requested
             fragments: list[dict[str, Any]] = []
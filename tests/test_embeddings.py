@@ -0,0 +1,193 @@
+"""Tests for paper_index_tool.vector.embeddings.
+
+Covers concurrent embedding with a stubbed Bedrock client: results come back
+in input order for single-text and batched (Cohere) models, and token
+counts of all requests are summed. Also covers the request rate limiter,
+timed with a fake clock.
+"""
+
+import io
+import json
+import random
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from paper_index_tool.vector import embeddings as embeddings_module
+from paper_index_tool.vector.embeddings import (
+    COHERE_MAX_BATCH_SIZE,
+    BedrockEmbeddings,
+    RequestRateLimiter,
+)
+
+
+class StubBedrockClient:
+    """Bedrock runtime stand-in that embeds "text N" as the vector [N, N].
+
+    Responses are delayed by a random few milliseconds so concurrent
+    requests complete out of submission order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stub with no recorded requests."""
+        self.requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._random = random.Random(3)
+
+    def invoke_model(self, modelId: str, body: str, contentType: str, accept: str) -> Any:  # noqa: N803
+        """Answer one InvokeModel request in the Titan or Cohere format."""
+        request = json.loads(body)
+        with self._lock:
+            self.requests.append(request)
+            delay = self._random.uniform(0, 0.003)
+        time.sleep(delay)
+
+        if "texts" in request:
+            vectors = [self.vector(text) for text in request["texts"]]
+            tokens = sum(len(text.split()) for text in request["texts"])
+            response = {"embeddings": vectors, "meta": {"billed_units": {"input_tokens": tokens}}}
+        else:
+            text = request["inputText"]
+            response = {"embedding": self.vector(text), "inputTextTokenCount": len(text.split())}
+        return {"body": io.BytesIO(json.dumps(response).encode())}
+
+    @staticmethod
+    def vector(text: str) -> list[float]:
+        """The stub embedding of "text N"."""
+        number = float(text.split()[-1])
+        return [number, number]
+
+
+def create_embeddings(
+    model_name: str, **kwargs: Any
+) -> tuple[BedrockEmbeddings, StubBedrockClient]:
+    """Create an embeddings client that talks to a fresh stub."""
+    embeddings = BedrockEmbeddings(model_name=model_name, **kwargs)
+    client = StubBedrockClient()
+    embeddings._client = client  # type: ignore[assignment]
+    return embeddings, client
+
+
+TEXTS = [f"text {i}" for i in range(2 * COHERE_MAX_BATCH_SIZE + 17)]
+
+
+class TestEmbedTexts:
+    """Tests for BedrockEmbeddings.embed_texts."""
+
+    def test_single_text_model_preserves_order(self) -> None:
+        """Titan requests finish out of order but results follow the input."""
+        embeddings, client = create_embeddings("titan-v2")
+
+        vectors, stats = embeddings.embed_texts(TEXTS, show_progress=False, max_workers=8)
+
+        assert vectors == [StubBedrockClient.vector(text) for text in TEXTS]
+        assert len(client.requests) == len(TEXTS)
+        assert stats.total_tokens == 2 * len(TEXTS)
+        assert stats.num_texts == len(TEXTS)
+
+    def test_cohere_batches_preserve_order(self) -> None:
+        """Cohere texts go out in full batches and come back in input order."""
+        embeddings, client = create_embeddings("cohere-en")
+
+        vectors, _stats = embeddings.embed_texts(TEXTS, show_progress=False, max_workers=4)
+
+        assert vectors == [StubBedrockClient.vector(text) for text in TEXTS]
+        batch_sizes = sorted((len(r["texts"]) for r in client.requests), reverse=True)
+        assert batch_sizes == [COHERE_MAX_BATCH_SIZE, COHERE_MAX_BATCH_SIZE, 17]
+        assert all(r["input_type"] == "search_document" for r in client.requests)
+
+    def test_cohere_tokens_are_summed_over_batches(self) -> None:
+        """Billed tokens of every batch request add up in the stats."""
+        embeddings, _client = create_embeddings("cohere-en")
+
+        _vectors, stats = embeddings.embed_texts(TEXTS, show_progress=False)
+
+        assert stats.total_tokens == 2 * len(TEXTS)
+        assert stats.num_texts == len(TEXTS)
+        assert stats.total_cost == pytest.approx(
+            stats.total_tokens / 1000 * embeddings.config.price_per_1000_tokens
+        )
+
+    def test_empty_input_makes_no_requests(self) -> None:
+        """No texts means no requests and zero stats."""
+        embeddings, client = create_embeddings("cohere-en")
+
+        vectors, stats = embeddings.embed_texts([], show_progress=False)
+
+        assert vectors == []
+        assert client.requests == []
+        assert stats.total_tokens == 0
+
+
+class FakeClock:
+    """Stands in for the time module; sleep() advances the clock instantly.
+
+    Tests use rates whose reciprocals are exact binary fractions, so the
+    bucket refills to exactly one token after each computed wait.
+    """
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Current fake time in seconds."""
+        return self.now
+
+    perf_counter = monotonic
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the fake time instead of blocking."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock of the embeddings module with a FakeClock."""
+    fake = FakeClock()
+    monkeypatch.setattr(embeddings_module, "time", fake)
+    return fake
+
+
+class TestRequestRateLimiter:
+    """Tests for RequestRateLimiter."""
+
+    @pytest.mark.parametrize("rate", [0, -1.5])
+    def test_rejects_non_positive_rate(self, rate: float) -> None:
+        """A rate of zero or less is an error, not an unlimited bucket."""
+        with pytest.raises(ValueError, match="Rate must be positive"):
+            RequestRateLimiter(rate)
+
+    def test_burst_then_paced_at_rate(self, clock: FakeClock) -> None:
+        """A full bucket is spent at once, then one request per 1/rate seconds."""
+        limiter = RequestRateLimiter(rate=8.0)
+        times = []
+        for _ in range(24):
+            limiter.acquire()
+            times.append(clock.now)
+
+        assert times[:8] == [0.0] * 8
+        assert times[8:] == [0.125 * n for n in range(1, 17)]
+
+    def test_idle_time_refills_up_to_capacity(self, clock: FakeClock) -> None:
+        """After a long pause only `rate` requests go through without waiting."""
+        limiter = RequestRateLimiter(rate=4.0)
+        for _ in range(4):
+            limiter.acquire()
+
+        clock.sleep(60.0)
+        for _ in range(5):
+            limiter.acquire()
+
+        assert clock.now == 60.25
+
+    def test_embed_texts_is_paced_by_max_requests_per_second(self, clock: FakeClock) -> None:
+        """BedrockEmbeddings acquires a token for every request it sends."""
+        embeddings, client = create_embeddings("titan-v2", max_requests_per_second=4.0)
+
+        embeddings.embed_texts(TEXTS[:12], show_progress=False, max_workers=1)
+
+        assert len(client.requests) == 12
+        assert clock.now == 2.0
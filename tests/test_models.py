@@ -0,0 +1,153 @@
+"""Tests for the entry models in paper_index_tool.models.
+
+Covers the cached derived values of entries, building entries from
+trusted registry data, and date and word-limit validation.
+"""
+
+from typing import Any
+
+import pytest
+
+from paper_index_tool.models import (
+    Book,
+    Media,
+    MediaType,
+    Paper,
+    Quote,
+    validate_date_format,
+    validate_max_words,
+)
+from tests.test_chapter_grouping import create_test_book
+from tests.test_search import create_test_paper
+
+QUOTES = [
+    Quote(text="Leaders grow through experience.", page=3),
+    Quote(text="Identity shapes behaviour.", page=7),
+]
+
+
+def create_test_media(media_id: str) -> Media:
+    """Create a minimal valid Media entry with required fields."""
+    return Media.model_validate(
+        {
+            "id": media_id,
+            "media_type": "podcast",
+            "author": "Host, Jane",
+            "title": "Test Episode Title",
+            "year": 2021,
+            "url": "https://example.com/episode",
+            "access_date": "2024-01-15",
+            "file_path_markdown": "/path/to/episode.md",
+            "abstract": "Test abstract about leadership.",
+            "question": "What is the main question?",
+            "method": "Test methodology description.",
+            "gaps": "Test gaps identified.",
+            "results": "Test results summary.",
+            "interpretation": "Test interpretation of results.",
+            "claims": "Test key claims.",
+            "full_text": " ".join(f"Sentence {i} of the transcript." for i in range(1, 251)),
+            "quotes": QUOTES,
+        }
+    )
+
+
+def stored_entries() -> list[Paper | Book | Media]:
+    """One entry of each type with quotes, as the registries would store them."""
+    return [
+        create_test_paper("smith2011", quotes=QUOTES),
+        Book.model_validate(create_test_book("jones2020ch1", quotes=QUOTES)),
+        create_test_media("lee2021pod"),
+    ]
+
+
+class TestCachedProperties:
+    """Tests for the per-instance caches of _SearchableEntry."""
+
+    def test_model_copy_with_update_drops_cached_values(self) -> None:
+        """Cached text and bibtex must follow the updated fields of a copy."""
+        paper = create_test_paper("smith2011")
+        assert "leadership" in paper.searchable_text
+        assert "Test Paper Title" in paper.bibtex
+
+        copied = paper.model_copy(update={"abstract": "Totally new.", "title": "A New Title"})
+
+        assert "Totally new." in copied.searchable_text
+        assert "leadership" not in copied.searchable_text
+        assert "A New Title" in copied.bibtex
+        assert "leadership" in paper.searchable_text
+
+    def test_model_copy_without_update_keeps_cached_values(self) -> None:
+        """A plain copy has the same fields, so it may reuse the cached values."""
+        paper = create_test_paper("smith2011")
+        text = paper.searchable_text
+        assert paper.model_copy().searchable_text is text
+
+
+class TestFromTrustedDict:
+    """Tests for building entries from registry data without validation."""
+
+    @pytest.mark.parametrize("entry", stored_entries(), ids=lambda e: type(e).__name__)
+    def test_matches_model_validate(self, entry: Paper | Book | Media) -> None:
+        """Trusted construction must give the same entry as full validation."""
+        data: dict[str, Any] = entry.model_dump(mode="json")
+        model_class = type(entry)
+
+        trusted = model_class.from_trusted_dict(data)
+
+        assert trusted == model_class.model_validate(data)
+        assert trusted.model_dump() == entry.model_dump()
+        assert all(isinstance(quote, Quote) for quote in trusted.quotes)
+        assert len(trusted.quotes) == len(QUOTES)
+
+    @pytest.mark.parametrize("entry", stored_entries(), ids=lambda e: type(e).__name__)
+    def test_without_quotes_matches_model_validate(self, entry: Paper | Book | Media) -> None:
+        """include_quotes=False must equal validating the data without quotes."""
+        data: dict[str, Any] = entry.model_dump(mode="json")
+        model_class = type(entry)
+
+        trusted = model_class.from_trusted_dict(data, include_quotes=False)
+
+        assert trusted == model_class.model_validate({**data, "quotes": []})
+        assert trusted.quotes == []
+
+    def test_media_type_is_restored(self) -> None:
+        """Media's stored media_type string must come back as a MediaType."""
+        data = create_test_media("lee2021pod").model_dump(mode="json")
+        media = Media.from_trusted_dict(data)
+        assert media.media_type is MediaType.PODCAST
+
+
+class TestValidateDateFormat:
+    """Tests for validate_date_format."""
+
+    def test_accepts_iso_date(self) -> None:
+        """A zero-padded YYYY-MM-DD date is returned unchanged."""
+        assert validate_date_format("2025-01-21") == "2025-01-21"
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2025-01- 1", " 2025-1-01", "2025-1-1", "2025/01/21", "2025-01-21T00", "２０２５-01-21"],
+    )
+    def test_rejects_other_shapes(self, value: str) -> None:
+        """Unpadded, space-padded, non-ASCII or differently separated dates fail."""
+        with pytest.raises(ValueError, match="YYYY-MM-DD format, e.g."):
+            validate_date_format(value)
+
+    def test_rejects_impossible_date(self) -> None:
+        """A well-formed string naming a day that does not exist fails."""
+        with pytest.raises(ValueError, match="is not a valid date"):
+            validate_date_format("2025-02-30")
+
+
+class TestValidateMaxWords:
+    """Tests for validate_max_words."""
+
+    def test_accepts_text_at_the_limit(self) -> None:
+        """Exactly max_words words pass, whatever the spacing."""
+        text = "  one\ttwo\n three  "
+        assert validate_max_words(text, 3, "abstract") == text
+
+    def test_rejects_text_over_the_limit(self) -> None:
+        """Oversized text is reported against the limit, not counted in full."""
+        with pytest.raises(ValueError, match="more than 3 words"):
+            validate_max_words("word " * 10_000, 3, "abstract")
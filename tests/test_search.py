@@ -0,0 +1,256 @@
+"""Tests for paper_index_tool.search.
+
+Covers fragment extraction (line matching, context windows, merging of
+overlapping fragments, the fragment limit), single-document scoring,
+parallel corpus tokenization, the searcher result cache and the per-entry
+term count caches.
+"""
+
+import os
+import random
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import bm25s  # type: ignore[import-untyped]
+import pytest
+
+from paper_index_tool import search
+from paper_index_tool.models import Paper
+from paper_index_tool.search import (
+    PaperSearcher,
+    clear_searcher_cache,
+    extract_fragments,
+    score_single_document,
+    tokenize_corpus,
+    tokenize_text,
+)
+from paper_index_tool.storage import PaperRegistry
+
+
+def create_test_paper(paper_id: str, **overrides: object) -> Paper:
+    """Create a minimal valid Paper with required fields."""
+    full_text = " ".join(f"Sentence {i} of the full text body." for i in range(1, 201))
+    data: dict[str, object] = {
+        "id": paper_id,
+        "author": "Smith, John",
+        "title": "Test Paper Title",
+        "year": 2011,
+        "journal": "Test Journal",
+        "file_path_markdown": "/path/to/test.md",
+        "abstract": "Test abstract about leadership.",
+        "question": "What is the main question?",
+        "method": "Test methodology description.",
+        "gaps": "Test gaps identified.",
+        "results": "Test results summary.",
+        "interpretation": "Test interpretation of results.",
+        "claims": "Test key claims.",
+        "full_text": full_text,
+    }
+    data.update(overrides)
+    return Paper.model_validate(data)
+
+
+class TestExtractFragments:
+    """Tests for extract_fragments."""
+
+    def test_matches_case_insensitively(self) -> None:
+        """Query terms should match regardless of case."""
+        content = "Line 1\nLeadership development\nLine 3"
+        fragments = extract_fragments(content, ["leadership"], context_lines=1)
+        assert len(fragments) == 1
+        assert fragments[0]["matched_line_numbers"] == [2]
+        assert fragments[0]["line_start"] == 1
+        assert fragments[0]["line_end"] == 3
+        assert fragments[0]["lines"] == ["Line 1", "Leadership development", "Line 3"]
+
+    def test_matches_substrings_and_any_term(self) -> None:
+        """Any term matching as a substring should mark the line."""
+        content = "alpha\nleaders grow\nbeta\nidentity work\ngamma"
+        fragments = extract_fragments(content, ["lead", "identity"], context_lines=0)
+        assert [f["matched_line_numbers"] for f in fragments] == [[2], [4]]
+        assert [f["lines"] for f in fragments] == [["leaders grow"], ["identity work"]]
+
+    def test_overlapping_context_is_merged(self) -> None:
+        """Matches whose context windows touch should form one fragment."""
+        content = "\n".join(["x", "term", "x", "term", "x", "x", "x", "x", "term"])
+        fragments = extract_fragments(content, ["term"], context_lines=1)
+        assert len(fragments) == 2
+        assert fragments[0]["line_start"] == 1
+        assert fragments[0]["line_end"] == 5
+        assert fragments[0]["matched_line_numbers"] == [2, 4]
+        assert fragments[1]["matched_line_numbers"] == [9]
+
+    def test_respects_max_fragments(self) -> None:
+        """No more than max_fragments fragments should be returned."""
+        content = "\n".join(["term", "x", "x", "x"] * 5)
+        fragments = extract_fragments(content, ["term"], context_lines=0, max_fragments=2)
+        assert len(fragments) == 2
+        assert [f["line_start"] for f in fragments] == [1, 5]
+
+    def test_handles_crlf_line_endings(self) -> None:
+        """Line numbers should follow splitlines() semantics for CRLF text."""
+        content = "a\r\nb term\r\nc"
+        fragments = extract_fragments(content, ["term"], context_lines=0)
+        assert fragments[0]["matched_line_numbers"] == [2]
+        assert fragments[0]["lines"] == ["b term"]
+
+    def test_no_match_or_empty_input(self) -> None:
+        """Empty content, empty terms, or no match should return no fragments."""
+        assert extract_fragments("", ["term"]) == []
+        assert extract_fragments("some text", []) == []
+        assert extract_fragments("some text", ["missing"]) == []
+
+
+class TestScoreSingleDocument:
+    """score_single_document must match a one-document bm25s index."""
+
+    @staticmethod
+    def bm25s_score(query_tokens: list[str], doc_tokens: list[str]) -> float:
+        """Score by indexing the document with bm25s defaults."""
+        retriever = bm25s.BM25()
+        retriever.index([doc_tokens], show_progress=False)
+        known = [token for token in query_tokens if token in retriever.vocab_dict]
+        if not known:
+            return 0.0
+        return float(retriever.get_scores(known)[0])
+
+    def test_matches_bm25s_on_random_pairs(self) -> None:
+        """Random documents and queries, including repeated query terms."""
+        rng = random.Random(42)
+        vocab = [f"term{i}" for i in range(40)]
+        for _ in range(300):
+            doc = rng.choices(vocab, k=rng.randint(1, 60))
+            query = rng.choices(vocab, k=rng.randint(1, 6))
+            expected = self.bm25s_score(query, doc)
+            assert score_single_document(query, Counter(doc)) == pytest.approx(expected, abs=1e-6)
+
+    def test_no_matching_term_scores_zero(self) -> None:
+        """A query sharing no token with the document scores 0."""
+        assert score_single_document(["absent"], Counter(["present", "present"])) == 0.0
+
+
+class TestTokenizeCorpus:
+    """Tests for tokenize_corpus."""
+
+    @pytest.fixture
+    def parallel(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Take the worker process path for small corpora on any machine."""
+        monkeypatch.setattr(search, "PARALLEL_TOKENIZE_MIN_DOCS", 8)
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        search._tokenize_pool.cache_clear()
+        yield
+        search._tokenize_pool().shutdown()
+        search._tokenize_pool.cache_clear()
+
+    @staticmethod
+    def corpus() -> list[str]:
+        """Texts of varied length, including empty and stopword-only ones."""
+        rng = random.Random(7)
+        words = ["leaders", "running", "the", "and", "Identity", "studies", "naïve", "x2"]
+        texts = [" ".join(rng.choices(words, k=rng.randint(0, 40))) for _ in range(60)]
+        return [*texts, "", "the and", "Leadership, identity & growth!"]
+
+    def test_parallel_matches_serial(self, parallel: None) -> None:
+        """Worker processes must give the same tokens, in input order."""
+        texts = self.corpus()
+        expected = [tokenize_text(text) for text in texts]
+
+        assert tokenize_corpus(texts) == expected
+
+    def test_concurrent_calls_share_one_pool(self, parallel: None) -> None:
+        """Rebuilds on several threads reuse the same worker pool."""
+        texts = self.corpus()
+        tokenize_corpus(texts)
+        pool = search._tokenize_pool()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(tokenize_corpus, [texts] * 3))
+
+        assert search._tokenize_pool() is pool
+        assert results == [tokenize_corpus(texts)] * 3
+
+
+class TestSearchResultCache:
+    """Tests for the per-searcher result cache."""
+
+    @pytest.fixture
+    def registry(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> PaperRegistry:
+        """Point the config directory at tmp_path and add one paper."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        clear_searcher_cache()
+        registry = PaperRegistry()
+        registry.add_paper(create_test_paper("smith2011"))
+        return registry
+
+    def test_single_entry_search_sees_updated_entry(self, registry: PaperRegistry) -> None:
+        """A cached single-entry result must not survive an update of the entry."""
+        searcher = PaperSearcher()
+        assert searcher.search("hippo", entry_id="smith2011") == []
+
+        registry.update_paper("smith2011", {"abstract": "A study of the hippo."})
+
+        results = searcher.search("hippo", entry_id="smith2011")
+        assert [r.entry_id for r in results] == ["smith2011"]
+
+    def test_index_search_sees_updated_entry_without_reindex(self, registry: PaperRegistry) -> None:
+        """Cached index results must not keep an entry from before an update."""
+        searcher = PaperSearcher()
+        searcher.rebuild_index()
+        assert [r.paper.title for r in searcher.search("leadership") if r.paper] == [
+            "Test Paper Title"
+        ]
+
+        registry.update_paper("smith2011", {"title": "Renamed Paper Title"})
+
+        assert [r.paper.title for r in searcher.search("leadership") if r.paper] == [
+            "Renamed Paper Title"
+        ]
+
+    def test_index_search_sees_rebuild_by_other_searcher(self, registry: PaperRegistry) -> None:
+        """A cached index result must not survive a rebuild by another searcher."""
+        searcher = PaperSearcher()
+        searcher.rebuild_index()
+        assert searcher.search("hippo") == []
+
+        registry.update_paper("smith2011", {"abstract": "A study of the hippo."})
+        PaperSearcher().rebuild_index()
+
+        assert [r.entry_id for r in searcher.search("hippo")] == ["smith2011"]
+
+
+class TestEntryTermCounts:
+    """Tests for the per-entry term count caches written by rebuild_index."""
+
+    @pytest.fixture
+    def registry(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> PaperRegistry:
+        """Point the config directory at tmp_path and add two papers."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        clear_searcher_cache()
+        registry = PaperRegistry()
+        registry.add_paper(create_test_paper("smith2011"))
+        registry.add_paper(create_test_paper("jones2012"))
+        return registry
+
+    def test_rebuild_prunes_deleted_entries(self, registry: PaperRegistry) -> None:
+        """Cached counts of deleted entries are removed by the next rebuild."""
+        searcher = PaperSearcher()
+        searcher.rebuild_index()
+        assert searcher._single_entry_index_path("jones2012").exists()
+
+        registry.delete_paper("jones2012")
+        searcher.rebuild_index()
+
+        assert not searcher._single_entry_index_path("jones2012").exists()
+        assert searcher._single_entry_index_path("smith2011").exists()
+
+    def test_clear_index_removes_index_and_counts(self, registry: PaperRegistry) -> None:
+        """clear_index leaves neither the index nor any cached counts behind."""
+        searcher = PaperSearcher()
+        searcher.rebuild_index()
+
+        searcher.clear_index()
+
+        assert not searcher.index_path.exists()
+        assert not searcher._single_entry_index_path("smith2011").parent.exists()
@@ -0,0 +1,91 @@
+"""Tests for paper_index_tool.vector.registry.
+
+Covers incremental additions to named FAISS indices: quantized vectors must
+not drift over repeated adds, and an HNSW index must grow in place.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+
+from paper_index_tool.vector import registry as vector_registry  # noqa: E402
+from paper_index_tool.vector.embeddings import BedrockEmbeddings, EmbeddingStats  # noqa: E402
+from paper_index_tool.vector.registry import VectorIndexRegistry  # noqa: E402
+
+DIMENSIONS = 256
+
+
+@pytest.fixture
+def registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> VectorIndexRegistry:
+    """Point the config directory at tmp_path and embed with seeded random vectors."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    rng = np.random.default_rng(7)
+
+    def fake_embed_texts(
+        self: BedrockEmbeddings, texts: list[str], show_progress: bool = True
+    ) -> tuple[list[list[float]], EmbeddingStats]:
+        vectors = rng.standard_normal((len(texts), DIMENSIONS)).tolist()
+        return vectors, EmbeddingStats(total_tokens=len(texts), total_cost=0.0, num_texts=1)
+
+    monkeypatch.setattr(BedrockEmbeddings, "embed_texts", fake_embed_texts)
+    return VectorIndexRegistry()
+
+
+def create_empty_index(registry: VectorIndexRegistry, name: str, quantization: Any) -> None:
+    """Create a named index holding no vectors yet."""
+    registry.create_index(name, "nova", dimensions=DIMENSIONS, quantization=quantization)
+    registry.save_index_data(name, faiss.IndexFlatIP(DIMENSIONS), [])
+
+
+def stored_vectors(registry: VectorIndexRegistry, name: str) -> Any:
+    """Return the vectors stored in a named index, in insertion order."""
+    index, _chunks = registry.load_index_data(name)
+    return index.reconstruct_n(0, index.ntotal)
+
+
+class TestAddEntryToIndex:
+    """Tests for VectorIndexRegistry.add_entry_to_index."""
+
+    @pytest.mark.parametrize("quantization", ["fp16", "int8"])
+    def test_repeated_adds_do_not_drift(
+        self, registry: VectorIndexRegistry, quantization: str
+    ) -> None:
+        """Vectors stored by the first add are unchanged after many more adds."""
+        create_empty_index(registry, "quantized", quantization)
+        registry.add_entry_to_index("quantized", "entry0", "paper", "first entry text")
+        first = stored_vectors(registry, "quantized")
+
+        for i in range(1, 31):
+            registry.add_entry_to_index("quantized", f"entry{i}", "paper", f"entry {i} text")
+
+        stored = stored_vectors(registry, "quantized")
+        assert len(stored) == 31
+        np.testing.assert_array_equal(stored[:1], first)
+
+    def test_hnsw_index_grows_in_place(
+        self, registry: VectorIndexRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only the add that crosses HNSW_MIN_VECTORS rebuilds the index."""
+        monkeypatch.setattr(vector_registry, "HNSW_MIN_VECTORS", 4)
+        builds: list[int] = []
+        build = vector_registry.build_faiss_index
+
+        def counting_build(*args: Any, **kwargs: Any) -> Any:
+            builds.append(1)
+            return build(*args, **kwargs)
+
+        monkeypatch.setattr(vector_registry, "build_faiss_index", counting_build)
+        create_empty_index(registry, "graph", "int8")
+
+        for i in range(10):
+            registry.add_entry_to_index("graph", f"entry{i}", "paper", f"entry {i} text")
+
+        index, chunks = registry.load_index_data("graph")
+        assert index.ntotal == len(chunks) == 10
+        assert isinstance(index, faiss.IndexHNSWSQ)
+        # First add replaces the empty placeholder, the fourth crosses the threshold
+        assert len(builds) == 2